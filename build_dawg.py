@@ -8,6 +8,15 @@ in Maven's DAWG format that can replace the maven2 data fork.
 Usage:
   python3 build_dawg.py lexica/s1_words.txt lexica/s2_words.txt -o maven2_new
   python3 build_dawg.py --verify     # round-trip test with existing maven2
+  python3 build_dawg.py ... --incremental   # low-memory sorted-input build
+  python3 build_dawg.py ... -j 8            # per-letter subtrees in 8 processes
+  python3 build_dawg.py ... --no-cache      # ignore/skip the .dawg_cache directory
+  python3 build_dawg.py --set-op difference maven2:S2 osw_fork:S2 -o maven2_new
+                                   # replace A's section with A-B, built directly
+  python3 build_dawg.py lexica/s1_words.txt lexica/s2_words.txt --gaddag -o maven2_gaddag
+                                   # GADDAG sections (see below) instead of DAWGs
+  python3 build_dawg.py ... --layout freq --workload words.txt
+                                   # hot groups first (dawg_layout); not for Maven
 
 File format:
   [12-byte header: boundary, s1_count, s2_count]
@@ -21,14 +30,38 @@ Entry format (32-bit big-endian):
   bit 8:      end-of-word
   bit 9:      last-sibling
   bits 10-31: child entry index
+
+GADDAG sections (--gaddag) use the same file and entry format.  Each
+word w of length n is stored as the n strings rev(w[:i]) + SEP + w[i:]
+for 1 <= i < n, plus rev(w) itself; SEP is the letter byte 0x7B ('{'),
+which sorts after 'z', so it is always the last entry of its group.
+A move generator starts at any tile of a word, walks left (reversed),
+and crosses SEP to extend right, all in one walk.  Readers that only
+accept a-z treat the SEP entry as the end of its group, so they see
+the GADDAG as a DAWG of the reversed words.
 """
 
 import argparse
+import hashlib
 import struct
 import sys
 import os
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+from dawg_layout import LAYOUTS, apply_layout, read_workload
+from dawg_reader import MavenFork, Section, parse_section_spec
+from dawg_words import structure_ids
 
 DAWG_PATH = "/Volumes/T7/retrogames/oldmac/share/maven2"
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".dawg_cache")
+
+# Part of every cache key; bump whenever the serialized layout changes
+BUILDER_VERSION = 1
+
+# GADDAG separator between the reversed prefix and the forward suffix
+GADDAG_SEP = '{'
 
 
 class TrieNode:
@@ -53,126 +86,429 @@ def build_trie(words):
     return root
 
 
+class DawgTable:
+    """Minimized DAWG stored as parallel arrays instead of node objects.
+
+    State s has end-of-word flag eow[s] and outgoing arcs
+    first[s] .. first[s+1]-1 (CSR layout); arc a leads to state
+    target[a] on letter byte letter[a].  Arcs of a state are in letter
+    order.  A state is only added once all its children exist, so
+    child indexes are always smaller than the parent's.
+
+    add_state deduplicates through `register`, keyed on the state's
+    (eow, letter, target, ...) ints; equal keys are equivalent states.
+    """
+
+    def __init__(self):
+        self.eow = bytearray()
+        self.first = array('i', [0])
+        self.letter = bytearray()
+        self.target = array('i')
+        self.register = {}  # (eow, letter, target, ...) -> state
+        self.root = -1
+
+    def __len__(self):
+        return len(self.eow)
+
+    def __getstate__(self):
+        # The register is only needed while building; don't ship it
+        state = self.__dict__.copy()
+        state['register'] = None
+        return state
+
+    def add_state(self, eow, arcs):
+        """Return the state for (eow, arcs), adding it if it is new.
+
+        arcs is a flat [letter, target, letter, target, ...] list.
+        """
+        key = (eow, *arcs)
+        s = self.register.get(key)
+        if s is None:
+            s = self.register[key] = len(self.eow)
+            self.eow.append(eow)
+            self.letter.extend(arcs[0::2])
+            self.target.extend(arcs[1::2])
+            self.first.append(len(self.target))
+        return s
+
+    @classmethod
+    def from_trie(cls, root):
+        """Minimize a TrieNode trie into a table (iterative post-order).
+
+        The input may already share nodes (a TrieNode DAWG); each node
+        is visited once.
+        """
+        table = cls()
+        done = {}  # id(node) -> state
+        # Frames: [node, child iterator, flat arcs collected so far]
+        stack = [[root, iter(sorted(root.children.items())), []]]
+        while stack:
+            frame = stack[-1]
+            nxt = next(frame[1], None)
+            if nxt is not None:
+                ch, child = nxt
+                frame[2].append(ord(ch))
+                s = done.get(id(child))
+                if s is None:
+                    stack.append([child, iter(sorted(child.children.items())), []])
+                else:
+                    frame[2].append(s)
+                continue
+            stack.pop()
+            s = done[id(frame[0])] = table.add_state(1 if frame[0].eow else 0, frame[2])
+            if stack:
+                stack[-1][2].append(s)
+            else:
+                table.root = s
+        return table
+
+    def to_trie(self, state=None):
+        """TrieNode DAWG for `state` (default: the root).
+
+        Equivalent states become one shared node, as in the DAWGs that
+        minimize_trie returns.
+        """
+        state = self.root if state is None else state
+        nodes = []
+        for s in range(state + 1):  # children precede their parents
+            node = TrieNode()
+            node.eow = bool(self.eow[s])
+            for a in range(self.first[s], self.first[s + 1]):
+                node.children[chr(self.letter[a])] = nodes[self.target[a]]
+            nodes.append(node)
+        return nodes[state]
+
+
+def build_table(sorted_words):
+    """Build a minimized DawgTable directly from sorted words (Daciuk et al.).
+
+    Only the path of the most recently added word is unminimized; when
+    the next word diverges from it, the nodes past the common prefix are
+    frozen into the table (reusing an equivalent state when one exists).
+    Peak memory therefore tracks the DAWG size rather than the trie size.
+
+    Raises ValueError if the input is not sorted.
+    """
+    table = DawgTable()
+    path = [[0, []]]  # [eow, flat arcs] of the nodes along prev
+    prev = ""
+
+    def freeze(depth):
+        # Freeze path[len(prev)] .. path[depth+1], deepest first
+        while len(path) > depth + 1:
+            eow, arcs = path.pop()
+            s = table.add_state(eow, arcs)
+            path[-1][1].extend((ord(prev[len(path) - 1]), s))
+
+    for word in sorted_words:
+        if word == prev:
+            continue
+        if word < prev:
+            raise ValueError(f"input not sorted: {word!r} after {prev!r}")
+
+        common = 0
+        limit = min(len(word), len(prev))
+        while common < limit and word[common] == prev[common]:
+            common += 1
+
+        freeze(common)
+        for _ in range(len(word) - common):
+            path.append([0, []])
+        path[-1][0] = 1
+        prev = word
+
+    freeze(0)
+    eow, arcs = path[0]
+    table.root = table.add_state(eow, arcs)
+    return table
+
+
+def _build_letter_table(job):
+    """Worker: minimize the subtree for one root letter, return its table."""
+    letter, words, incremental = job
+    if incremental:
+        return letter, build_table(words)
+    return letter, DawgTable.from_trie(build_trie(words))
+
+
+def merge_tables(tables):
+    """Merge per-letter tables into one DAWG with global suffix sharing.
+
+    Each table's states are re-added bottom-up to a single table, so
+    suffixes shared across root letters collapse exactly as they would
+    in a serial build.  Returns the merged DawgTable.
+    """
+    merged = DawgTable()
+    root_arcs = []
+    for letter in sorted(tables):
+        t = tables[letter]
+        remap = array('i', bytes(4 * len(t)))
+        for s in range(len(t)):
+            if s == t.root:
+                continue
+            arcs = []
+            for a in range(t.first[s], t.first[s + 1]):
+                arcs.append(t.letter[a])
+                arcs.append(remap[t.target[a]])
+            remap[s] = merged.add_state(t.eow[s], arcs)
+        a = t.first[t.root]  # the letter's single root arc
+        root_arcs.append(t.letter[a])
+        root_arcs.append(remap[t.target[a]])
+    merged.root = merged.add_state(0, root_arcs)
+    return merged
+
+
+def build_table_parallel(sorted_words, jobs, incremental=False):
+    """Build the DAWG with one process-pool task per root letter.
+
+    Root-letter subtrees are built and minimized independently, then
+    merged with merge_tables; serializing the result gives the same
+    entries as the serial build.  Only building and minimizing run in
+    the pool: merging and serialize_dawg stay serial over the whole
+    DAWG, since group addresses come from one global DFS order.
+    """
+    by_letter = {}
+    for word in sorted_words:
+        by_letter.setdefault(word[0], []).append(word)
+
+    # Largest subtrees first so the pool stays busy
+    work = sorted(by_letter.items(), key=lambda item: -len(item[1]))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        tables = dict(pool.map(_build_letter_table,
+                               [(letter, words, incremental) for letter, words in work]))
+    return merge_tables(tables)
+
+
+# TrieNode entry points from before DawgTable, kept for existing callers.
+# They wrap the table builders and return shared-node TrieNode DAWGs.
+
 def minimize_trie(root):
-    """Minimize trie into a DAWG by merging identical subtrees.
+    """Minimize a trie into a DAWG by merging identical subtrees."""
+    return DawgTable.from_trie(root).to_trie()
+
+
+def build_dawg_incremental(sorted_words):
+    """build_table, returned as a TrieNode DAWG.
 
-    Uses bottom-up signature matching: two nodes are equivalent if they
-    have the same eow flag and the same set of (letter, child_id) pairs
-    after their children have been minimized.
+    Raises ValueError if the input is not sorted.
     """
-    register = {}  # signature -> canonical node
+    return build_table(sorted_words).to_trie()
 
-    def minimize(node):
-        # Minimize children first (bottom-up)
-        for ch in node.children:
-            node.children[ch] = minimize(node.children[ch])
 
-        # Build signature from minimized children
-        sig = (node.eow, tuple(sorted(
-            (ch, id(node.children[ch])) for ch in node.children
-        )))
+def build_dawg_parallel(sorted_words, jobs, incremental=False):
+    """build_table_parallel, returned as a TrieNode DAWG."""
+    return build_table_parallel(sorted_words, jobs, incremental).to_trie()
 
-        if sig in register:
-            return register[sig]
-        register[sig] = node
-        return node
 
-    # Increase recursion limit for deep tries (longest words ~45 letters)
-    old_limit = sys.getrecursionlimit()
-    sys.setrecursionlimit(max(old_limit, 1000))
-    result = minimize(root)
-    sys.setrecursionlimit(old_limit)
-    return result
+def flatten_dawg(node):
+    """Flatten a DAWG into a picklable post-order node table.
 
+    Returns a list of (eow, ((ch, child_index), ...)) tuples in which
+    every child precedes its parent; the last item is `node` itself.
+    """
+    t = DawgTable.from_trie(node)
+    return [(bool(t.eow[s]),
+             tuple((chr(t.letter[a]), t.target[a]) for a in range(t.first[s], t.first[s + 1])))
+            for s in range(len(t))]
 
-def count_nodes(root):
-    """Count unique nodes in a DAWG."""
-    seen = set()
 
-    def visit(node):
-        if id(node) in seen:
-            return
-        seen.add(id(node))
-        for child in node.children.values():
-            visit(child)
+def merge_subtrees(tables):
+    """Merge per-letter flatten_dawg tables into one TrieNode DAWG.
 
-    visit(root)
+    Same global suffix sharing as merge_tables.
+    """
+    converted = {}
+    for letter, flat in tables.items():
+        t = DawgTable()
+        state = []
+        for eow, arcs in flat:
+            state.append(t.add_state(int(eow), [x for ch, i in arcs
+                                                for x in (ord(ch), state[i])]))
+        t.root = t.add_state(0, [ord(letter), state[-1]])
+        converted[letter] = t
+    return merge_tables(converted).to_trie()
+
+
+def count_nodes(root):
+    """Count unique nodes in a TrieNode trie or DAWG."""
+    seen = {id(root)}
+    stack = [root]
+    while stack:
+        for child in stack.pop().children.values():
+            if id(child) not in seen:
+                seen.add(id(child))
+                stack.append(child)
     return len(seen)
 
 
-def serialize_dawg(root):
-    """Serialize a DAWG into Maven-format entry list.
+def serialize_dawg(table):
+    """Serialize a DawgTable into Maven-format entry list.
+
+    A TrieNode root (trie or DAWG) is also accepted and minimized into
+    a table first, as serialize_dawg(root) callers did before.
 
-    Returns a list of 32-bit entry values.
+    Returns a list of 32-bit entry values and the a-h boundary.
 
     Layout:
       Entry 0: sentinel (0x00000000)
       Entries 1-26: root letter index (a=1, ..., z=26)
       Entries 27+: all other sibling groups (DFS order)
+
+    Groups are allocated in depth-first pre-order using an explicit
+    stack; a shared state gets its group the first time it is reached.
     """
-    entries = [0] * 27  # sentinel + 26 root entries (placeholders)
-
-    # Map: id(node) -> entry index of this node's children sibling group
-    node_group_start = {}
-
-    def alloc_and_recurse(node):
-        """Allocate sibling group for node's children, then recurse DFS."""
-        if id(node) in node_group_start:
-            return  # shared DAWG node, already processed
-        if not node.children:
-            return  # leaf node, no children to serialize
-
-        sorted_children = sorted(node.children.items())
-        start = len(entries)
-        node_group_start[id(node)] = start
-
-        # Reserve entries for this sibling group
-        entries.extend([0] * len(sorted_children))
-
-        # DFS into children
-        for ch, child_node in sorted_children:
-            alloc_and_recurse(child_node)
-
-        # Fill in entries (children's groups are now allocated)
-        for j, (ch, child_node) in enumerate(sorted_children):
-            letter_byte = ord(ch)
-            eow = 1 if child_node.eow else 0
-            last = 1 if j == len(sorted_children) - 1 else 0
-            child_ptr = node_group_start.get(id(child_node), 0)
-            entries[start + j] = (letter_byte
-                                  | (eow << 8)
-                                  | (last << 9)
-                                  | (child_ptr << 10))
-
-    # Process root's children in alphabetical order
+    if isinstance(table, TrieNode):
+        table = DawgTable.from_trie(table)
+    first, letter, target, eow = table.first, table.letter, table.target, table.eow
+    group_start = array('i', bytes(4 * len(table)))  # 0 = not allocated
+    order = []  # states in allocation order
+    size = 27  # sentinel + 26 root entries
+
+    root_child = {}
+    for a in range(first[table.root], first[table.root + 1]):
+        root_child[letter[a]] = target[a]
+
     boundary = 0
     for i in range(26):
-        letter = chr(ord('a') + i)
-        if letter in root.children:
-            alloc_and_recurse(root.children[letter])
-        if letter == 'h':
-            boundary = len(entries)  # a-h subtrees end here
+        s = root_child.get(0x61 + i)
+        if s is not None:
+            stack = [s]
+            while stack:
+                s = stack.pop()
+                if group_start[s] or first[s] == first[s + 1]:
+                    continue  # already allocated, or a leaf
+                group_start[s] = size
+                size += first[s + 1] - first[s]
+                order.append(s)
+                # Reversed so the first child is allocated next
+                for a in range(first[s + 1] - 1, first[s] - 1, -1):
+                    if not group_start[target[a]]:
+                        stack.append(target[a])
+        if i == 7:
+            boundary = size  # a-h subtrees end here
+
+    entries = [0] * size
+    for s in order:
+        pos = group_start[s]
+        end = first[s + 1]
+        for a in range(first[s], end):
+            child = target[a]
+            entries[pos] = (letter[a]
+                            | (eow[child] << 8)
+                            | ((a == end - 1) << 9)
+                            | (group_start[child] << 10))
+            pos += 1
 
     # Fill in root entries (1-26)
     for i in range(26):
-        letter = chr(ord('a') + i)
-        letter_byte = ord(letter)
-        if letter in root.children:
-            child_node = root.children[letter]
-            eow = 1 if child_node.eow else 0
-            child_ptr = node_group_start.get(id(child_node), 0)
+        s = root_child.get(0x61 + i)
+        if s is not None:
+            flags = eow[s] << 8
+            child_ptr = group_start[s]
         else:
-            eow = 0
+            flags = 0
             child_ptr = 0
         last = 1 if i == 25 else 0
-        entries[1 + i] = (letter_byte
-                          | (eow << 8)
+        entries[1 + i] = ((0x61 + i)
+                          | flags
                           | (last << 9)
                           | (child_ptr << 10))
 
     return entries, boundary
 
 
+SET_OPS = {
+    # op: (eow rule, keep A-only letters, keep B-only letters, identical groups)
+    'union': (lambda a, b: a or b, True, True, 'copy'),
+    'intersection': (lambda a, b: a and b, False, False, 'copy'),
+    'difference': (lambda a, b: a and not b, True, False, 'empty'),
+    'symmetric': (lambda a, b: a != b, True, True, 'empty'),
+}
+
+
+def build_set_operation(a_entries, b_entries, op):
+    """Build the DAWG for a set operation on two sections' word sets.
+
+    Minimized product construction: each reachable pair of sibling
+    groups (one from A, one from B; 0 for "none") becomes at most one
+    table state, and DawgTable.add_state merges equivalent results, so
+    no word list is ever materialized.  Pairs of structurally identical
+    groups are resolved without walking both sides.
+
+    op is one of SET_OPS.  Returns a minimized DawgTable.
+    """
+    if isinstance(a_entries, Section):
+        a_entries = a_entries.to_array()
+    if isinstance(b_entries, Section):
+        b_entries = b_entries.to_array()
+    eow_rule, keep_a, keep_b, identical = SET_OPS[op]
+    register = {}
+    ids_a = structure_ids(a_entries, register)
+    ids_b = structure_ids(b_entries, register)
+
+    table = DawgTable()
+    memo = {}  # (ga, gb, op) -> flat arcs of the resulting group
+
+    def group(entries, g):
+        out = []
+        n = len(entries)
+        while g and g < n:
+            val = entries[g]
+            out.append(val)
+            if val & 0x200:
+                break
+            g += 1
+        return out
+
+    def arcs_for(ga, gb, rule, only_a, only_b, same):
+        key = (ga, gb, rule)
+        if key in memo:
+            return memo[key]
+        if ga and gb and ids_a[ga] == ids_b[gb]:
+            if same == 'copy':
+                arcs = arcs_for(ga, 0, *SET_OPS['union'])
+            else:
+                arcs = []
+            memo[key] = arcs
+            return arcs
+
+        ea = group(a_entries, ga)
+        eb = group(b_entries, gb)
+        arcs = []
+        i = j = 0
+        while i < len(ea) or j < len(eb):
+            la = ea[i] & 0xFF if i < len(ea) else 256
+            lb = eb[j] & 0xFF if j < len(eb) else 256
+            if la < lb:
+                if not only_a:
+                    i += 1
+                    continue
+                # A-only letter: copy A's subtree
+                letter, eow, sub = la, ea[i] & 0x100, arcs_for(ea[i] >> 10, 0, *SET_OPS['union'])
+                i += 1
+            elif lb < la:
+                if not only_b:
+                    j += 1
+                    continue
+                letter, eow, sub = lb, eb[j] & 0x100, arcs_for(0, eb[j] >> 10, *SET_OPS['union'])
+                j += 1
+            else:
+                letter = la
+                eow = rule(ea[i] & 0x100, eb[j] & 0x100)
+                sub = arcs_for(ea[i] >> 10, eb[j] >> 10, rule, only_a, only_b, same)
+                i += 1
+                j += 1
+            if eow or sub:
+                arcs.append(letter)
+                arcs.append(table.add_state(1 if eow else 0, sub))
+        memo[key] = arcs
+        return arcs
+
+    root_arcs = arcs_for(1, 1, eow_rule, keep_a, keep_b, identical)
+    table.root = table.add_state(0, root_arcs)
+    return table
+
+
 def pack_file(s1_entries, s2_entries, boundary=0):
     """Pack two DAWG entry lists into Maven data fork format.
 
@@ -199,10 +535,12 @@ def pack_file(s1_entries, s2_entries, boundary=0):
     return header + s1_data + s1_index + s2_data + s2_index
 
 
-def enumerate_entries(entries):
+def enumerate_entries(entries, top=0x7A):
     """Enumerate all words from a list of Maven DAWG entries.
 
     This is the inverse of serialize_dawg — used for verification.
+    Letter bytes above `top` end a group; pass ord(GADDAG_SEP) to
+    enumerate GADDAG strings.
     """
     words = set()
 
@@ -225,7 +563,7 @@ def enumerate_entries(entries):
                     break
                 e = entries[idx]
                 ch_byte = e & 0xFF
-                if not (0x61 <= ch_byte <= 0x7A):
+                if not (0x61 <= ch_byte <= top):
                     break
 
                 letter = chr(ch_byte)
@@ -245,6 +583,28 @@ def enumerate_entries(entries):
     return words
 
 
+def gaddag_strings(word):
+    """The GADDAG strings for one word: rev(w[:i]) + SEP + w[i:], and rev(w)."""
+    out = [word[i - 1::-1] + GADDAG_SEP + word[i:] for i in range(1, len(word))]
+    out.append(word[::-1])
+    return out
+
+
+def build_gaddag(words, label="", incremental=False, jobs=1, cache=None):
+    """Build a GADDAG section for a word list.
+
+    The GADDAG strings of all words go through build_section, so they
+    are minimized by the same register (and cached the same way).
+    Returns (entries, boundary).
+    """
+    strings = set()
+    for word in words:
+        strings.update(gaddag_strings(word))
+    if label:
+        print(f"  {label}: {len(words):,} words -> {len(strings):,} GADDAG strings")
+    return build_section(strings, label, incremental, jobs, cache)
+
+
 def load_words(path):
     """Load word list from file (one word per line, any case)."""
     words = set()
@@ -257,77 +617,186 @@ def load_words(path):
 
 
 def load_original_section(data, base, count):
-    """Parse entries from original Maven data fork."""
-    entries = []
-    for i in range(count):
-        offset = base + i * 4
-        val = struct.unpack('>I', data[offset:offset + 4])[0]
-        entries.append(val)
-    return entries
+    """View entries of an original Maven data fork without copying.
+
+    Returns a dawg_reader.Section over data[base:base + count*4].
+    """
+    return Section(memoryview(data)[base:base + count * 4])
 
 
-def build_section(words, label=""):
+def _entry_bytes(entries):
+    """Big-endian bytes of an entry list (zero-copy for Sections)."""
+    if isinstance(entries, Section):
+        return entries.raw
+    return struct.pack(f'>{len(entries)}I', *entries)
+
+
+class BuildCache:
+    """Content-addressed on-disk cache of built sections and word sets.
+
+    Built sections are keyed by a hash of the builder version and the
+    sorted word list; enumerated word sets are keyed by a hash of the
+    builder version and the section's entry bytes.  Files are written
+    atomically, so a cache directory can be shared between concurrent
+    builds.  Checks of freshly built sections enumerate them directly,
+    so a stale or corrupt cache entry cannot make them pass.
+    """
+
+    def __init__(self, root=CACHE_DIR):
+        self.root = root
+
+    def _path(self, key, ext):
+        return os.path.join(self.root, key[:2], key + ext)
+
+    def _read(self, key, ext):
+        try:
+            with open(self._path(key, ext), 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def _write(self, key, ext, data):
+        path = self._path(key, ext)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+    @staticmethod
+    def words_key(sorted_words):
+        h = hashlib.sha256(f"build_dawg v{BUILDER_VERSION}\n".encode())
+        h.update("\n".join(sorted_words).encode())
+        return h.hexdigest()
+
+    @staticmethod
+    def entries_key(entries):
+        h = hashlib.sha256(f"entries v{BUILDER_VERSION}\n".encode())
+        h.update(_entry_bytes(entries))
+        return h.hexdigest()
+
+    def load_section(self, key):
+        """Return (entries, boundary) for a build key, or None."""
+        data = self._read(key, '.dawg')
+        if data is None:
+            return None
+        boundary, count = struct.unpack_from('>II', data)
+        return list(struct.unpack_from(f'>{count}I', data, 8)), boundary
+
+    def store_section(self, key, entries, boundary):
+        header = struct.pack('>II', boundary, len(entries))
+        self._write(key, '.dawg', header + _entry_bytes(entries))
+
+    def section_words(self, entries):
+        """enumerate_entries(entries), cached by the entries' content."""
+        key = self.entries_key(entries)
+        data = self._read(key, '.words')
+        if data is not None:
+            return set(data.decode().split("\n")) if data else set()
+        words = enumerate_entries(entries)
+        self._write(key, '.words', "\n".join(sorted(words)).encode())
+        return words
+
+
+def section_words(entries, cache=None):
+    """Word set of a section, through the cache when one is given."""
+    if cache is not None:
+        return cache.section_words(entries)
+    return enumerate_entries(entries)
+
+
+def build_section(words, label="", incremental=False, jobs=1, cache=None):
     """Build a complete DAWG section from a word list.
 
+    With incremental=True the DAWG is minimized while the sorted words
+    stream in (build_table) instead of building the whole trie first.
+    With jobs > 1 the root-letter subtrees are built in a process pool
+    (build_table_parallel).  The entries are identical either way.
+
+    With a BuildCache, a word list that was built before is loaded from
+    the cache instead of being rebuilt.
+
     Returns list of entry values.
     """
     sorted_words = sorted(words)
     if label:
         print(f"  {label}: {len(sorted_words):,} words")
 
-    # Build trie
-    root = build_trie(sorted_words)
-    if label:
-        trie_nodes = count_nodes(root)
-        print(f"  {label}: trie has {trie_nodes:,} nodes")
-
-    # Minimize to DAWG
-    root = minimize_trie(root)
+    if cache is not None:
+        key = cache.words_key(sorted_words)
+        hit = cache.load_section(key)
+        if hit is not None:
+            if label:
+                print(f"  {label}: {len(hit[0]):,} entries (boundary={hit[1]}, cached)")
+            return hit
+
+    t0 = time.perf_counter()
+    if jobs > 1:
+        table = build_table_parallel(sorted_words, jobs, incremental)
+        if label:
+            print(f"  {label}: DAWG has {len(table):,} nodes ({jobs} workers, "
+                  f"{time.perf_counter() - t0:.2f}s)")
+    elif incremental:
+        table = build_table(sorted_words)
+        if label:
+            print(f"  {label}: DAWG has {len(table):,} nodes (built incrementally, "
+                  f"{time.perf_counter() - t0:.2f}s)")
+    else:
+        # Build trie
+        root = build_trie(sorted_words)
+        if label:
+            trie_nodes = count_nodes(root)
+            print(f"  {label}: trie has {trie_nodes:,} nodes")
+
+        # Minimize to DAWG
+        table = DawgTable.from_trie(root)
+        del root
+        if label:
+            dawg_nodes = len(table)
+            print(f"  {label}: DAWG has {dawg_nodes:,} nodes ({100*dawg_nodes/trie_nodes:.0f}% of trie, "
+                  f"{time.perf_counter() - t0:.2f}s)")
+
+    table.register = None  # no longer needed once built
+
+    # Serialize (always serial, see build_table_parallel)
+    t0 = time.perf_counter()
+    entries, boundary = serialize_dawg(table)
     if label:
-        dawg_nodes = count_nodes(root)
-        print(f"  {label}: DAWG has {dawg_nodes:,} nodes ({100*dawg_nodes/trie_nodes:.0f}% of trie)")
+        print(f"  {label}: {len(entries):,} entries (boundary={boundary}, "
+              f"serialized in {time.perf_counter() - t0:.2f}s)")
 
-    # Serialize
-    entries, boundary = serialize_dawg(root)
-    if label:
-        print(f"  {label}: {len(entries):,} entries (boundary={boundary})")
+    if cache is not None:
+        cache.store_section(key, entries, boundary)
 
     return entries, boundary
 
 
-def verify():
+def verify(incremental=False, jobs=1, cache=None):
     """Round-trip test: extract words from maven2, rebuild, verify match."""
     print("Loading original maven2...")
-    with open(DAWG_PATH, 'rb') as f:
-        data = f.read()
-
-    field1 = struct.unpack('>I', data[0:4])[0]
-    field2 = struct.unpack('>I', data[4:8])[0]
-    field3 = struct.unpack('>I', data[8:12])[0]
-
-    s1_base = 12
-    s2_base = 116 + field2 * 4
+    fork = MavenFork(DAWG_PATH)
+    field1, field2, field3 = fork.boundary, fork.s1_count, fork.s2_count
 
     print(f"  Header: boundary={field1}, s1_count={field2}, s2_count={field3}")
 
-    # Extract original entries
-    s1_orig = load_original_section(data, s1_base, field2)
-    s2_orig = load_original_section(data, s2_base, field3)
+    # Original entries, read in place from the mapped fork
+    s1_orig = fork.s1
+    s2_orig = fork.s2
 
     # Enumerate words from original
     print("\nExtracting words from original DAWG...")
-    s1_words = enumerate_entries(s1_orig)
-    s2_words = enumerate_entries(s2_orig)
+    s1_words = section_words(s1_orig, cache)
+    s2_words = section_words(s2_orig, cache)
     print(f"  S1: {len(s1_words):,} words")
     print(f"  S2: {len(s2_words):,} words")
 
     # Rebuild
     print("\nRebuilding S1 DAWG...")
-    s1_rebuilt, s1_boundary = build_section(s1_words, "S1")
+    s1_rebuilt, s1_boundary = build_section(s1_words, "S1", incremental, jobs, cache)
     print("\nRebuilding S2 DAWG...")
-    s2_rebuilt, _ = build_section(s2_words, "S2")
+    s2_rebuilt, _ = build_section(s2_words, "S2", incremental, jobs, cache)
 
-    # Verify round-trip
+    # Verify round-trip (enumerated afresh, not through the cache)
     print("\nVerifying round-trip...")
     s1_check = enumerate_entries(s1_rebuilt)
     s2_check = enumerate_entries(s2_rebuilt)
@@ -362,7 +831,7 @@ def verify():
     # Pack and compare file sizes
     rebuilt_data = pack_file(s1_rebuilt, s2_rebuilt, boundary=s1_boundary)
     print(f"\nFile sizes:")
-    print(f"  Original: {len(data):,} bytes")
+    print(f"  Original: {len(fork.buf):,} bytes")
     print(f"  Rebuilt:  {len(rebuilt_data):,} bytes")
 
     if s1_ok and s2_ok:
@@ -374,6 +843,31 @@ def verify():
     return True
 
 
+def set_operation(op, spec_a, spec_b, output, boundary=0):
+    """CLI: write A's fork with A's section replaced by `A op B`."""
+    path_a, name_a = parse_section_spec(spec_a)
+    path_b, name_b = parse_section_spec(spec_b)
+    with MavenFork(path_a) as fork_a, MavenFork(path_b) as fork_b:
+        sections = {'S1': fork_a.s1.to_array(), 'S2': fork_a.s2.to_array()}
+        b_entries = fork_b.section(name_b).to_array()
+        old_boundary = fork_a.boundary
+
+    print(f"Building {op} of {path_a}:{name_a} and {path_b}:{name_b}...")
+    table = build_set_operation(sections[name_a], b_entries, op)
+    table.register = None
+    entries, new_boundary = serialize_dawg(table)
+    print(f"  {name_a}: DAWG has {len(table):,} nodes, "
+          f"{len(entries):,} entries (boundary={new_boundary})")
+    sections[name_a] = entries
+
+    if not boundary:
+        boundary = new_boundary if name_a == 'S1' else old_boundary
+    output_data = pack_file(sections['S1'], sections['S2'], boundary=boundary)
+    with open(output, 'wb') as f:
+        f.write(output_data)
+    print(f"\nWrote {len(output_data):,} bytes to {output}")
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Build Maven-format DAWG data fork from word lists")
@@ -387,14 +881,56 @@ def main():
                         help='Round-trip test with existing maven2')
     parser.add_argument('--boundary', type=int, default=0,
                         help='Header boundary field value (default: 0)')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Minimize while inserting sorted words '
+                             '(lower peak memory, same output)')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='Build root-letter subtrees in N processes '
+                             '(default: 1, same output)')
+    parser.add_argument('--cache-dir', default=CACHE_DIR,
+                        help=f'Build cache directory (default: {CACHE_DIR})')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Always rebuild and re-enumerate from scratch')
+    parser.add_argument('--gaddag', action='store_true',
+                        help='Build GADDAG sections from forward word lists '
+                             '(separator byte 0x7B)')
+    parser.add_argument('--layout', choices=LAYOUTS, default='maven',
+                        help='Group layout (default: maven; others are for '
+                             'analysis tools only, see dawg_layout.py)')
+    parser.add_argument('--workload', default=None,
+                        help='Forward words driving --layout freq, optionally '
+                             '"word count" per line (as in dawg_layout.py)')
+    parser.add_argument('--set-op', nargs=3, metavar=('OP', 'A', 'B'),
+                        help=f'Build OP ({", ".join(SET_OPS)}) of sections '
+                             f'A and B, given as FORK:S1|S2; the result '
+                             f"replaces A's section in a copy of A's fork")
     args = parser.parse_args()
 
+    if args.gaddag and (args.verify or args.set_op):
+        parser.error("--gaddag cannot be combined with --verify or --set-op")
+
+    cache = None if args.no_cache else BuildCache(args.cache_dir)
+
     if args.verify:
-        ok = verify()
+        ok = verify(args.incremental, args.jobs, cache)
         sys.exit(0 if ok else 1)
 
+    if args.set_op:
+        op, spec_a, spec_b = args.set_op
+        if op not in SET_OPS:
+            parser.error(f"unknown set operation {op!r}")
+        set_operation(op, spec_a, spec_b, args.output, args.boundary)
+        return
+
     if not args.s1_file or not args.s2_file:
         parser.error("S1 and S2 word list files required (or use --verify)")
+    if args.layout == 'freq' and not args.workload:
+        parser.error("--layout freq needs --workload")
+    workload = None
+    if args.workload and args.layout != 'maven':
+        workload = read_workload(args.workload)
+        if not workload:
+            parser.error(f"no words in workload {args.workload}")
 
     print(f"Loading word lists...")
     s1_words = load_words(args.s1_file)
@@ -402,18 +938,29 @@ def main():
     print(f"  S1: {len(s1_words):,} words from {args.s1_file}")
     print(f"  S2: {len(s2_words):,} words from {args.s2_file}")
 
-    print(f"\nBuilding S1 DAWG...")
-    s1_entries, s1_boundary = build_section(s1_words, "S1")
+    kind = "GADDAG" if args.gaddag else "DAWG"
+    build = build_gaddag if args.gaddag else build_section
+
+    print(f"\nBuilding S1 {kind}...")
+    s1_entries, s1_boundary = build(s1_words, "S1", args.incremental, args.jobs, cache)
 
-    print(f"\nBuilding S2 DAWG...")
-    s2_entries, _ = build_section(s2_words, "S2")
+    print(f"\nBuilding S2 {kind}...")
+    s2_entries, _ = build(s2_words, "S2", args.incremental, args.jobs, cache)
 
     # Verify before writing
-    print(f"\nVerifying built DAWGs...")
-    s1_check = enumerate_entries(s1_entries)
-    s2_check = enumerate_entries(s2_entries)
-    s1_ok = s1_check == s1_words
-    s2_ok = s2_check == s2_words
+    print(f"\nVerifying built {kind}s...")
+    if args.gaddag:
+        top = ord(GADDAG_SEP)
+        s1_check = enumerate_entries(s1_entries, top)
+        s2_check = enumerate_entries(s2_entries, top)
+        s1_ok = s1_check == {g for w in s1_words for g in gaddag_strings(w)}
+        s2_ok = s2_check == {g for w in s2_words for g in gaddag_strings(w)}
+    else:
+        # Enumerated afresh, not through the cache
+        s1_check = enumerate_entries(s1_entries)
+        s2_check = enumerate_entries(s2_entries)
+        s1_ok = s1_check == s1_words
+        s2_ok = s2_check == s2_words
     print(f"  S1: {'PASS' if s1_ok else 'FAIL'} ({len(s1_check):,} words)")
     print(f"  S2: {'PASS' if s2_ok else 'FAIL'} ({len(s2_check):,} words)")
 
@@ -421,6 +968,16 @@ def main():
         print("ERROR: Verification failed, not writing output")
         sys.exit(1)
 
+    if args.layout != 'maven':
+        s1_work = s2_work = None
+        if workload:
+            # S1 and GADDAG sections are walked with reversed spellings
+            s1_work = [w[::-1] for w in workload]
+            s2_work = s1_work if args.gaddag else workload
+        print(f"\nApplying {args.layout} layout...")
+        s1_entries = apply_layout(s1_entries, args.layout, s1_work)
+        s2_entries = apply_layout(s2_entries, args.layout, s2_work)
+
     # Pack and write
     boundary = args.boundary if args.boundary else s1_boundary
     output_data = pack_file(s1_entries, s2_entries, boundary=boundary)
@@ -6,6 +6,8 @@ The ESTR contains pattern strings, and MUL resources contain leave values for th
 import struct
 import os
 
+from leave_patterns import compile_patterns
+
 RESOURCES_DIR = "/Volumes/T7/retrogames/oldmac/maven_re/resources"
 
 def read_file(filepath):
@@ -64,6 +66,7 @@ def main():
 
     # Parse all patterns
     patterns = parse_estr()
+    matrix = compile_patterns(patterns)
     print(f"Total patterns in ESTR: {len(patterns)}")
     print()
 
@@ -146,7 +149,7 @@ def main():
         print(f"\n{display}:")
 
         # Find patterns containing this letter
-        letter_patterns = [p for p in patterns if letter in p]
+        letter_patterns = matrix.containing(letter)
         print(f"  Patterns containing '{letter}': {len(letter_patterns)}")
         for p in letter_patterns[:8]:
             print(f"    '{p}'")
@@ -182,7 +185,7 @@ def main():
     print("Q analysis (Q without U should be penalized):")
     print("="*60)
 
-    q_patterns = [p for p in patterns if 'q' in p]
+    q_patterns = matrix.containing('q')
     print(f"\nPatterns with 'q': {q_patterns}")
 
     if 'q' in all_mul_values:
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Alphagram-keyed anagram index built from a DAWG section.
+
+Every 2-15 letter word of the section is grouped under its alphagram
+(its letters sorted: RETINAS -> AEINRST).  The index holds the
+alphagrams as a sorted array of fixed-width keys plus, for each key,
+the dawg_rank ranks of its words.  An exact-anagram query is a binary
+search and a slice; words are recovered with RankedDawg.unrank.
+
+The words come from the DAWG itself, not from lexica/*.txt, so the
+index always matches the section it was built from.  It is stored next
+to the fork (maven2.s2.anagrams) and mapped on later runs; S1 ranks
+follow its stored (reversed) order, words come back in ordinary
+spelling.
+
+The file also keeps the section's RankedDawg annotation, so rank ->
+word needs no per-process precomputation.
+
+Index file (dawg_reader.ArrayFile, magic 'DGAG', flags 1 for a reversed
+section), arrays:
+  keys     16 bytes × n_keys, alphagram NUL-padded, sorted
+  offsets  u32 × (n_keys + 1)
+  ranks    u32 × n_words, grouped by key, ascending within a key
+  count    u32 × n_entries   (RankedDawg annotation)
+  before   u32 × n_entries
+
+Usage:
+  python3 dawg_alphagram.py RACK ... [--fork maven2] [--section S2]
+  python3 dawg_alphagram.py aeinrst 'aeinrs?' --section S1
+"""
+
+import argparse
+import time
+from itertools import combinations_with_replacement
+
+import numpy as np
+
+from dawg_index import section_crc
+from dawg_rank import RankedDawg
+from dawg_reader import DAWG_PATH, ArrayFile, MavenFork, load_or_build
+from dawg_words import iter_words
+
+ALPHAGRAM_MAGIC = b'DGAG'
+ALPHAGRAM_VERSION = 2
+
+MIN_LENGTH = 2
+MAX_LENGTH = 15
+KEY_SIZE = 16
+
+BLANK = '?'
+MAX_BLANKS = 2
+
+ALPHAGRAM_FILE = ArrayFile(ALPHAGRAM_MAGIC, ALPHAGRAM_VERSION, [
+    ('keys', f'S{KEY_SIZE}'),
+    ('offsets', '<u4'),
+    ('ranks', '<u4'),
+    ('count', '<u4'),
+    ('before', '<u4'),
+])
+
+
+def alphagram(word):
+    """Sorted letters of a word: 'retinas' -> 'aeinrst'."""
+    return ''.join(sorted(word))
+
+
+def anagrams_path(fork_path, name):
+    """Default anagram index file for a section: next to the fork."""
+    return f"{fork_path}.{name.lower()}.anagrams"
+
+
+class AlphagramIndex:
+    """Sorted alphagram keys with the ranks of their words."""
+
+    def __init__(self, entries, keys, offsets, ranks, ranked, reverse=False, crc=None):
+        self.entries = entries
+        self.keys = keys        # ndarray of 'S16'
+        self.offsets = offsets
+        self.ranks = ranks
+        self.ranked = ranked    # RankedDawg of entries
+        self.reverse = reverse
+        self.crc = section_crc(entries) if crc is None else crc
+
+    @classmethod
+    def build(cls, entries, reverse=False):
+        """Index the 2-15 letter words of a section; reverse=True for S1."""
+        groups = {}
+        # Enumerate every word so the position is the rank; only the
+        # 2-15 letter ones are indexed
+        for r, word in enumerate(iter_words(entries)):
+            if MIN_LENGTH <= len(word) <= MAX_LENGTH:
+                groups.setdefault(alphagram(word), []).append(r)
+        keys = sorted(groups)
+        key_arr = np.array([k.encode() for k in keys], dtype=f'S{KEY_SIZE}')
+        offsets = np.zeros(len(keys) + 1, dtype='<u4')
+        ranks = np.empty(sum(len(v) for v in groups.values()), dtype='<u4')
+        pos = 0
+        for i, key in enumerate(keys):
+            for r in groups[key]:
+                ranks[pos] = r
+                pos += 1
+            offsets[i + 1] = pos
+        return cls(entries, key_arr, offsets, ranks, RankedDawg(entries), reverse)
+
+    def save(self, path):
+        """Write the index atomically to `path`."""
+        ALPHAGRAM_FILE.save(path, {'keys': self.keys, 'offsets': self.offsets,
+                                   'ranks': self.ranks, 'count': self.ranked.count,
+                                   'before': self.ranked.before},
+                            self.crc, int(self.reverse))
+
+    @classmethod
+    def load(cls, path, entries, reverse=False):
+        """Map an index file; returns None if missing or stale for entries."""
+        crc = section_crc(entries)
+        arrays = ALPHAGRAM_FILE.load(path, crc, int(reverse))
+        if arrays is None or len(arrays['count']) != len(entries):
+            return None
+        ranked = RankedDawg(entries, arrays['count'], arrays['before'])
+        return cls(entries, arrays['keys'], arrays['offsets'], arrays['ranks'],
+                   ranked, reverse, crc)
+
+    def ranks_for(self, letters):
+        """Ranks of the words whose alphagram is alphagram(letters)."""
+        key = alphagram(letters.lower()).encode()
+        if not MIN_LENGTH <= len(key) <= MAX_LENGTH:
+            return []
+        i = int(np.searchsorted(self.keys, key))
+        if i == len(self.keys) or self.keys[i] != key:
+            return []
+        return self.ranks[self.offsets[i]:self.offsets[i + 1]].tolist()
+
+    def word(self, rank):
+        """Ordinary spelling of the word with this rank."""
+        word = self.ranked.unrank(rank)
+        return word[::-1] if self.reverse else word
+
+    def anagrams(self, rack):
+        """Sorted words using every tile of rack; '?' is a blank."""
+        rack = rack.lower()
+        blanks = rack.count(BLANK)
+        if blanks > MAX_BLANKS:
+            raise ValueError(f"rack {rack!r} has {blanks} blanks (max {MAX_BLANKS})")
+        tiles = rack.replace(BLANK, '')
+        if tiles and not (tiles.isascii() and tiles.isalpha()):
+            raise ValueError(f"invalid rack {rack!r}")
+        found = set()
+        for fill in combinations_with_replacement('abcdefghijklmnopqrstuvwxyz', blanks):
+            found.update(self.ranks_for(tiles + ''.join(fill)))
+        return sorted(self.word(r) for r in found)
+
+
+def open_alphagrams(fork, name, path=None, rebuild=False):
+    """AlphagramIndex for a section of an open MavenFork, cached next to it."""
+    entries = fork.section(name).to_array()
+    reverse = name.upper() == 'S1'
+    path = path or anagrams_path(fork.path, name)
+    return load_or_build(path, lambda: AlphagramIndex.load(path, entries, reverse),
+                         lambda: AlphagramIndex.build(entries, reverse), rebuild)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Exact-anagram lookups from an alphagram index of a DAWG section")
+    parser.add_argument('racks', nargs='*', help=f"Racks, '{BLANK}' for a blank")
+    parser.add_argument('--fork', default=DAWG_PATH,
+                        help='Maven data fork (default: %(default)s)')
+    parser.add_argument('--section', default='S2', choices=['S1', 'S2', 's1', 's2'],
+                        help='Section (default: S2)')
+    parser.add_argument('--rebuild', action='store_true',
+                        help='Rebuild the index even if it is current')
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    with MavenFork(args.fork) as fork:
+        index = open_alphagrams(fork, args.section, rebuild=args.rebuild)
+    dt = time.perf_counter() - t0
+    print(f"{args.section.upper()}: {len(index.keys):,} alphagrams, "
+          f"{len(index.ranks):,} words ({dt * 1000:.0f} ms)")
+
+    for rack in args.racks:
+        try:
+            words = index.anagrams(rack)
+        except ValueError as e:
+            parser.error(str(e))
+        print(f"  {rack.upper()}: {' '.join(w.upper() for w in words) or '-'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Rack anagram and sub-anagram search over the Maven DAWG.
+
+Walks the DAWG guided by the rack: at every sibling group only letters
+still available on the rack (or coverable by a blank) are followed, so
+the search touches just the part of the DAWG the rack can spell.  A
+7- or 8-tile rack with two blanks answers in milliseconds.
+
+A letter is always taken from a real tile when one is left, and from a
+blank only otherwise; every word is therefore found once, and the
+blanks it needs are reported as lowercase letters in the "play" form
+(real tiles uppercase), e.g. rack "retinas?" -> "STAiNER".
+
+S1 stores words reversed; its results are reversed back before being
+returned, so both sections give ordinary words.
+
+Usage:
+  python3 dawg_anagram.py RACK [--section S1|S2|both] [--full] [--min 2]
+  python3 dawg_anagram.py aeinrst
+  python3 dawg_anagram.py 'qu?ck??'        # rejected: at most two blanks
+"""
+
+import argparse
+
+from dawg_reader import DAWG_PATH, MavenFork
+from dawg_words import ROOT_GROUP
+
+BLANK = '?'
+MAX_BLANKS = 2
+
+
+def rack_counts(rack):
+    """Return (counts[26], blanks) for a rack string like 'aeinrs?'."""
+    counts = [0] * 26
+    blanks = 0
+    for ch in rack.lower():
+        if ch == BLANK:
+            blanks += 1
+        elif 'a' <= ch <= 'z':
+            counts[ord(ch) - 0x61] += 1
+        else:
+            raise ValueError(f"invalid rack tile {ch!r} in {rack!r}")
+    if blanks > MAX_BLANKS:
+        raise ValueError(f"rack {rack!r} has {blanks} blanks (max {MAX_BLANKS})")
+    return counts, blanks
+
+
+def iter_anagrams(entries, rack, min_len=2, full=False):
+    """Yield (word, play) for every word the rack can spell.
+
+    word is the stored string; play marks blank-covered letters in
+    lowercase and real tiles in uppercase.  With full=True only words
+    using every tile are produced.
+    """
+    counts, blanks = rack_counts(rack)
+    size = sum(counts) + blanks
+    if full:
+        min_len = size
+    n = len(entries)
+    letters = []
+    from_blank = []
+
+    def walk(g, blanks):
+        depth = len(letters) + 1
+        while g and g < n:
+            val = entries[g]
+            li = (val & 0xFF) - 0x61
+            if 0 <= li < 26:
+                if counts[li]:
+                    counts[li] -= 1
+                    used_blank = False
+                elif blanks:
+                    blanks -= 1
+                    used_blank = True
+                else:
+                    li = -1
+                if li >= 0:
+                    letters.append(chr(0x61 + li))
+                    from_blank.append(used_blank)
+                    if val & 0x100 and depth >= min_len:
+                        yield ''.join(letters), ''.join(
+                            c if b else c.upper() for c, b in zip(letters, from_blank))
+                    child = val >> 10
+                    if child and depth < size:
+                        yield from walk(child, blanks)
+                    letters.pop()
+                    from_blank.pop()
+                    if used_blank:
+                        blanks += 1
+                    else:
+                        counts[li] += 1
+            if val & 0x200:
+                break
+            g += 1
+
+    if size:
+        yield from walk(ROOT_GROUP, blanks)
+
+
+def find_anagrams(sections, rack, min_len=2, full=False):
+    """Anagrams of `rack` over sections {'S1': entries, 'S2': entries}.
+
+    Returns a dict word -> (play, set of section names), in ordinary
+    (not reversed) spelling.
+    """
+    found = {}
+    for name, entries in sections.items():
+        reverse = name.upper() == 'S1'
+        for word, play in iter_anagrams(entries, rack, min_len, full):
+            if reverse:
+                word, play = word[::-1], play[::-1]
+            if word in found:
+                found[word][1].add(name)
+            else:
+                found[word] = (play, {name})
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Find anagrams and sub-anagrams of a rack in the Maven DAWG")
+    parser.add_argument('rack', help=f"Rack letters, '{BLANK}' for a blank")
+    parser.add_argument('--fork', default=DAWG_PATH,
+                        help='Maven data fork (default: %(default)s)')
+    parser.add_argument('--section', default='both',
+                        choices=['S1', 'S2', 'both', 's1', 's2'],
+                        help='Section(s) to search (default: both)')
+    parser.add_argument('--full', action='store_true',
+                        help='Only words using every tile')
+    parser.add_argument('--min', type=int, default=2, dest='min_len',
+                        help='Minimum word length (default: 2)')
+    args = parser.parse_args()
+
+    try:
+        rack_counts(args.rack)
+    except ValueError as e:
+        parser.error(str(e))
+
+    names = ['S1', 'S2'] if args.section == 'both' else [args.section.upper()]
+    with MavenFork(args.fork) as fork:
+        sections = {name: fork.section(name).to_array() for name in names}
+
+    found = find_anagrams(sections, args.rack, args.min_len, args.full)
+    by_length = {}
+    for word, (play, where) in found.items():
+        by_length.setdefault(len(word), []).append((word, play, where))
+
+    print(f"Rack {args.rack.upper()}: {len(found)} words")
+    for length in sorted(by_length, reverse=True):
+        print(f"\n{length} letters ({len(by_length[length])}):")
+        for word, play, where in sorted(by_length[length]):
+            tag = '' if len(names) == 1 or len(where) == 2 else f"  [{''.join(where)} only]"
+            print(f"  {play}{tag}")
+
+
+if __name__ == '__main__':
+    main()
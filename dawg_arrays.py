@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Vectorized NumPy decoding of Maven DAWG entry arrays.
+
+Decodes a whole section in one pass into parallel arrays:
+  letter: uint8   (bits 0-7)
+  eow:    bool    (bit 8)
+  last:   bool    (bit 9)
+  child:  uint32  (bits 10-31)
+
+and runs structural checks over them (child ranges, sibling-group
+lengths, letter histograms) without a per-entry Python loop.
+
+Sections from dawg_reader are decoded straight from the mapped bytes
+(numpy reads them as '>u4' without a copy).
+
+Usage:
+  python3 dawg_arrays.py [maven2]     # structural report for S1 and S2
+"""
+
+import sys
+import time
+from collections import namedtuple
+
+import numpy as np
+
+from dawg_reader import DAWG_PATH, MavenFork, Section
+
+DecodedEntries = namedtuple('DecodedEntries', ['letter', 'eow', 'last', 'child'])
+
+
+def entry_array(entries):
+    """Return entries as a uint32 ndarray (zero-copy for Sections/bytes)."""
+    if isinstance(entries, Section):
+        return np.frombuffer(entries.raw, dtype='>u4')
+    if isinstance(entries, (bytes, bytearray, memoryview)):
+        return np.frombuffer(entries, dtype='>u4')
+    return np.asarray(entries, dtype=np.uint32)
+
+
+def decode_entries(entries):
+    """Decode a section into parallel letter/eow/last/child arrays."""
+    vals = entry_array(entries).astype(np.uint32, copy=False)
+    return DecodedEntries(
+        letter=(vals & 0xFF).astype(np.uint8),
+        eow=(vals & 0x100) != 0,
+        last=(vals & 0x200) != 0,
+        child=vals >> 10,
+    )
+
+
+def group_bounds(dec):
+    """Start index and length of every sibling group.
+
+    Entry 0 is the sentinel; groups run from entry 1, each ending at an
+    entry with the last-sibling flag.  A trailing run with no last flag
+    is reported as a group too (check_structure flags it).
+    """
+    n = len(dec.last)
+    if n <= 1:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    ends = np.flatnonzero(dec.last[1:]) + 1
+    if len(ends) == 0 or ends[-1] != n - 1:
+        ends = np.append(ends, n - 1)
+    starts = np.empty_like(ends)
+    starts[0] = 1
+    starts[1:] = ends[:-1] + 1
+    return starts, ends - starts + 1
+
+
+def check_structure(dec):
+    """Structural statistics and anomalies for a decoded section.
+
+    Returns a dict of counts, histograms and index arrays of bad entries.
+    """
+    n = len(dec.letter)
+    starts, lengths = group_bounds(dec)
+    body = slice(1, n)
+
+    valid_letter = (dec.letter >= 0x61) & (dec.letter <= 0x7A)
+    bad_letter = np.flatnonzero(~valid_letter[body]) + 1
+
+    child = dec.child
+    has_child = child != 0
+    out_of_range = np.flatnonzero(has_child & (child >= n))
+
+    # Children must point at the first entry of a sibling group
+    is_start = np.zeros(n, dtype=bool)
+    is_start[starts] = True
+    in_range = has_child & (child < n)
+    mid_group = np.flatnonzero(in_range & ~is_start[np.minimum(child, n - 1)])
+
+    # Groups nobody points at (besides the root group at entry 1)
+    referenced = np.zeros(n, dtype=bool)
+    referenced[child[in_range]] = True
+    unreferenced = starts[~referenced[starts] & (starts != 1)]
+
+    # Dead ends: neither a word nor a path to one (absent root letters
+    # in the root group are expected to look like this)
+    dead_end = np.flatnonzero(valid_letter & ~dec.eow & ~has_child)
+    root_end = lengths[0] if len(lengths) else 0
+    dead_end = dead_end[dead_end > root_end]
+
+    letters = dec.letter[body][valid_letter[body]] - 0x61
+    return {
+        'entries': n,
+        'groups': len(starts),
+        'eow_entries': int(np.count_nonzero(dec.eow)),
+        'leaf_entries': int(np.count_nonzero(valid_letter & ~has_child)),
+        'max_child': int(child.max()) if n else 0,
+        'letter_histogram': np.bincount(letters, minlength=26),
+        'group_length_histogram': np.bincount(lengths),
+        'max_group_length': int(lengths.max()) if len(lengths) else 0,
+        'unterminated_tail': bool(n > 1 and not dec.last[-1]),
+        'bad_letter': bad_letter,
+        'child_out_of_range': out_of_range,
+        'child_mid_group': mid_group,
+        'unreferenced_groups': unreferenced,
+        'dead_ends': dead_end,
+    }
+
+
+def print_report(name, report):
+    print(f"\n{name}: {report['entries']:,} entries in {report['groups']:,} sibling groups")
+    print(f"  eow entries: {report['eow_entries']:,}, leaves: {report['leaf_entries']:,}, "
+          f"max child: {report['max_child']:,}")
+    print(f"  max group length: {report['max_group_length']}")
+
+    hist = report['group_length_histogram']
+    print("  group lengths: " + ", ".join(
+        f"{length}:{int(count)}" for length, count in enumerate(hist) if count))
+
+    letters = report['letter_histogram']
+    print("  letters: " + " ".join(
+        f"{chr(0x61 + i)}={int(c)}" for i, c in enumerate(letters)))
+
+    for key in ('bad_letter', 'child_out_of_range', 'child_mid_group',
+                'unreferenced_groups', 'dead_ends'):
+        idx = report[key]
+        sample = ", ".join(str(int(i)) for i in idx[:8])
+        print(f"  {key}: {len(idx):,}" + (f"  [{sample}{', ...' if len(idx) > 8 else ''}]"
+                                         if len(idx) else ""))
+    if report['unterminated_tail']:
+        print("  WARNING: final group has no last-sibling flag")
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else DAWG_PATH
+    with MavenFork(path) as fork:
+        print(f"{path}: boundary={fork.boundary}, s1_count={fork.s1_count:,}, "
+              f"s2_count={fork.s2_count:,}")
+        for sec in (fork.s1, fork.s2):
+            t0 = time.perf_counter()
+            dec = decode_entries(sec)
+            t1 = time.perf_counter()
+            report = check_structure(dec)
+            t2 = time.perf_counter()
+            del dec  # drop array views before the mapping is closed
+            print_report(sec.name, report)
+            print(f"  decode {1000*(t1-t0):.1f} ms, checks {1000*(t2-t1):.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Batch word validation against the Maven DAWG sections.
+
+Validating a large reference list (sowpods2003.txt, TWL98.txt, ...) one
+word at a time re-walks every shared prefix.  Here the words are sorted
+first, and each lookup starts from the path of the previous word,
+walking only the letters after the common prefix.  Sorted chunks are
+fanned out to a process pool.  Each worker maps the fork through
+dawg_reader and decodes its own native-order copy of a section the
+first time it needs it (the walk runs about twice as fast on that copy
+as on the big-endian mapping), then reuses it for every later chunk.
+
+S1 stores words reversed, so for S1 the reversed words are sorted and
+walked.
+
+Usage:
+  python3 dawg_batch.py WORDLIST [--fork maven2] [-j 4] [--missing]
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from dawg_reader import DAWG_PATH, open_fork
+from dawg_words import ROOT_GROUP
+
+SECTIONS = ('S1', 'S2')
+
+# Per-process decoded sections, keyed by (fork path, section name)
+_arrays = {}
+
+
+def _section_array(path, name):
+    key = (path, name)
+    entries = _arrays.get(key)
+    if entries is None:
+        entries = _arrays[key] = open_fork(path).section(name).to_array()
+    return entries
+
+
+def validate_sorted(entries, words):
+    """Membership of each word in a sorted word list, as a list of bools.
+
+    Each walk resumes from the previous word's path at their common
+    prefix, so shared prefixes are walked once per run of words.
+    """
+    n = len(entries)
+    results = []
+    path = []  # path[d] = entry index matching prev[d]
+    prev = ""
+    for word in words:
+        common = 0
+        limit = min(len(path), len(word))
+        while common < limit and word[common] == prev[common]:
+            common += 1
+        del path[common:]
+
+        g = entries[path[-1]] >> 10 if path else ROOT_GROUP
+        for ch in word[common:]:
+            target = ord(ch)
+            while g and g < n:
+                val = entries[g]
+                if val & 0xFF == target:
+                    break
+                if val & 0x200:
+                    g = 0
+                    break
+                g += 1
+            else:
+                g = 0
+            if not g:
+                break
+            path.append(g)
+            g = val >> 10
+
+        results.append(len(path) == len(word) > 0
+                       and bool(entries[path[-1]] & 0x100))
+        prev = word
+    return results
+
+
+def _validate_chunk(job):
+    path, name, words = job
+    return validate_sorted(_section_array(path, name), words)
+
+
+def validate_words(words, fork_path=DAWG_PATH, sections=SECTIONS,
+                   jobs=1, chunk_size=20000):
+    """Validate many words against one or more sections.
+
+    Returns a dict word -> tuple of bools, one per name in `sections`.
+    Words are lowercased; anything that is not a-z is never valid.
+    """
+    unique = sorted({w.strip().lower() for w in words if w.strip()})
+    result = {w: [False] * len(sections) for w in unique}
+    valid = [w for w in unique if w.isascii() and w.isalpha()]
+
+    pool = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else None
+    try:
+        for col, name in enumerate(sections):
+            reverse = name.upper() == 'S1'
+            keyed = sorted(w[::-1] for w in valid) if reverse else valid
+            chunks = [keyed[i:i + chunk_size] for i in range(0, len(keyed), chunk_size)]
+            jobs_list = [(fork_path, name.upper(), chunk) for chunk in chunks]
+            outputs = pool.map(_validate_chunk, jobs_list) if pool else map(_validate_chunk, jobs_list)
+            for chunk, flags in zip(chunks, outputs):
+                for key, ok in zip(chunk, flags):
+                    if ok:
+                        result[key[::-1] if reverse else key][col] = True
+    finally:
+        if pool:
+            pool.shutdown()
+    return {w: tuple(flags) for w, flags in result.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Validate a word list against the Maven DAWG sections")
+    parser.add_argument('wordlist', help='Word list, one word per line')
+    parser.add_argument('--fork', default=DAWG_PATH,
+                        help='Maven data fork (default: %(default)s)')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1,
+                        help='Worker processes (default: all CPUs)')
+    parser.add_argument('--missing', action='store_true',
+                        help='List words found in neither section')
+    args = parser.parse_args()
+
+    with open(args.wordlist) as f:
+        words = f.read().split()
+    print(f"Loaded {len(words):,} words from {args.wordlist}")
+
+    t0 = time.perf_counter()
+    result = validate_words(words, args.fork, SECTIONS, args.jobs)
+    dt = time.perf_counter() - t0
+
+    in_s1 = sum(1 for s1, _ in result.values() if s1)
+    in_s2 = sum(1 for _, s2 in result.values() if s2)
+    both = sum(1 for s1, s2 in result.values() if s1 and s2)
+    neither = [w for w, (s1, s2) in result.items() if not (s1 or s2)]
+    print(f"  {len(result):,} distinct words in {dt:.2f}s "
+          f"({len(result) / dt:,.0f} words/s, {args.jobs} workers)")
+    print(f"  S1: {in_s1:,}  S2: {in_s2:,}  both: {both:,}  neither: {len(neither):,}")
+
+    if args.missing:
+        for w in neither:
+            print(w)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Lexicon diff between two Maven DAWG sections by simultaneous traversal.
+
+Instead of enumerating both sections into sets, the two DAWGs are walked
+together (a product-automaton walk): sibling groups are merged by
+letter, words only one side can reach are streamed straight from that
+side's subtree, and a pair of groups that are structurally identical is
+skipped in one step.  Diffing two revisions of a lexicon therefore costs
+time proportional to the differences (plus one linear pass per section
+to label structurally identical groups).
+
+Sections are compared as stored: S1 holds reversed words, so diff S1
+against another reversed section (e.g. an old and a rebuilt S1), not
+against S2.
+
+Output is diff-like, in lexicographic order:
+  -word   only in A
+  +word   only in B
+   word   in both (with --common)
+
+Usage:
+  python3 dawg_diff.py maven2:S2 maven2_new:S2
+  python3 dawg_diff.py old_fork:S1 new_fork:S1 --common --summary
+"""
+
+import argparse
+import sys
+
+from dawg_reader import MavenFork, Section, parse_section_spec
+from dawg_words import ROOT_GROUP, iter_subtree, structure_ids
+
+ONLY_A = '-'
+ONLY_B = '+'
+BOTH = ' '
+
+
+def _group(entries, g):
+    """[(letter_byte, eow, child), ...] for the group starting at g."""
+    n = len(entries)
+    out = []
+    while g and g < n:
+        val = entries[g]
+        out.append((val & 0xFF, val & 0x100, val >> 10))
+        if val & 0x200:
+            break
+        g += 1
+    return out
+
+
+class DawgDiff:
+    """Simultaneous walk over two entry arrays."""
+
+    def __init__(self, a, b):
+        if isinstance(a, Section):
+            a = a.to_array()
+        if isinstance(b, Section):
+            b = b.to_array()
+        self.a, self.b = a, b
+        register = {}
+        self.ids_a = structure_ids(a, register)
+        self.ids_b = structure_ids(b, register)
+
+    def diff(self, want=(ONLY_A, ONLY_B)):
+        """Yield (kind, word) in lexicographic order for kinds in `want`."""
+        yield from self._pair(ROOT_GROUP, ROOT_GROUP, '', frozenset(want))
+
+    def _pair(self, ga, gb, prefix, want):
+        if ga and gb and self.ids_a[ga] == self.ids_b[gb]:
+            if BOTH in want:
+                for word in iter_subtree(self.a, ga, prefix):
+                    yield BOTH, word
+            return
+
+        ea = _group(self.a, ga)
+        eb = _group(self.b, gb)
+        i = j = 0
+        while i < len(ea) or j < len(eb):
+            la = ea[i][0] if i < len(ea) else 256
+            lb = eb[j][0] if j < len(eb) else 256
+            if la < lb:
+                if ONLY_A in want:
+                    yield from self._one_side(ONLY_A, self.a, ea[i], prefix)
+                i += 1
+            elif lb < la:
+                if ONLY_B in want:
+                    yield from self._one_side(ONLY_B, self.b, eb[j], prefix)
+                j += 1
+            else:
+                _, eow_a, child_a = ea[i]
+                _, eow_b, child_b = eb[j]
+                word = prefix + chr(la)
+                kind = (BOTH if eow_a and eow_b else
+                        ONLY_A if eow_a else ONLY_B if eow_b else None)
+                if kind is not None and kind in want:
+                    yield kind, word
+                if child_a or child_b:
+                    yield from self._pair(child_a, child_b, word, want)
+                i += 1
+                j += 1
+
+    @staticmethod
+    def _one_side(kind, entries, entry, prefix):
+        letter, eow, child = entry
+        word = prefix + chr(letter)
+        if eow:
+            yield kind, word
+        for w in iter_subtree(entries, child, word):
+            yield kind, w
+
+
+def diff_sections(a, b, want=(ONLY_A, ONLY_B)):
+    """Stream (kind, word) differences between two entry arrays."""
+    return DawgDiff(a, b).diff(want)
+
+
+def _open_spec(spec):
+    path, name = parse_section_spec(spec)
+    fork = MavenFork(path)
+    return fork, fork.section(name).to_array()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Diff two Maven DAWG sections by simultaneous traversal")
+    parser.add_argument('a', help='First section as FORK[:S1|S2] (default S2)')
+    parser.add_argument('b', help='Second section as FORK[:S1|S2] (default S2)')
+    parser.add_argument('--common', action='store_true',
+                        help='Also list words in both sections')
+    parser.add_argument('--summary', action='store_true',
+                        help='Only print counts')
+    args = parser.parse_args()
+
+    fork_a, a = _open_spec(args.a)
+    fork_b, b = _open_spec(args.b)
+    fork_a.close()
+    fork_b.close()
+
+    want = (ONLY_A, ONLY_B, BOTH) if args.common else (ONLY_A, ONLY_B)
+    counts = {ONLY_A: 0, ONLY_B: 0, BOTH: 0}
+    out = sys.stdout
+    for kind, word in diff_sections(a, b, want):
+        counts[kind] += 1
+        if not args.summary:
+            out.write(kind + word + '\n')
+
+    summary = (f"only in A: {counts[ONLY_A]:,}, only in B: {counts[ONLY_B]:,}"
+               + (f", common: {counts[BOTH]:,}" if args.common else ""))
+    print(summary, file=sys.stderr if not args.summary else sys.stdout)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Precomputed front/back hooks and inner-hook flags for every word.
+
+For each word of a section, indexed by its dawg_rank rank:
+  front[r]   bitmask of letters c (bit 0 = 'a') such that c + word is a word
+  back[r]    bitmask of letters c such that word + c is a word
+  inner[r]   INNER_FRONT if word[1:] is a word, INNER_BACK if word[:-1] is
+
+Hooks are always in ordinary spelling.  S1 stores words reversed, so its
+stored-order hooks are swapped (a stored back hook is a real front hook)
+before they are saved; only the rank follows the stored order.
+
+The tables come from one enumeration of the section: every word x marks
+x[0] as a front hook of x[1:] and x[-1] as a back hook of x[:-1] when
+those are words.  They are stored next to the fork (maven2.s2.hooks)
+and mapped on later runs, so "does AARDVARK take an S" is a rank lookup
+and an array read.
+
+The file also keeps the section's RankedDawg annotation (count and
+before per entry), so word -> rank needs no per-process precomputation.
+
+Hook file (dawg_reader.ArrayFile, magic 'DGHK', flags 1 for a reversed
+section), arrays:
+  front   u32 × n_words
+  back    u32 × n_words
+  inner   u8 × n_words
+  count   u32 × n_entries   (RankedDawg annotation)
+  before  u32 × n_entries
+
+Usage:
+  python3 dawg_hooks.py [--fork maven2] [--section S2] [--rebuild] [WORD ...]
+"""
+
+import argparse
+import time
+from collections import namedtuple
+
+import numpy as np
+
+from dawg_index import section_crc
+from dawg_rank import RankedDawg
+from dawg_reader import DAWG_PATH, ArrayFile, MavenFork, load_or_build
+from dawg_words import iter_words
+
+HOOKS_MAGIC = b'DGHK'
+HOOKS_VERSION = 2
+
+INNER_FRONT = 1  # word minus its first letter is a word
+INNER_BACK = 2   # word minus its last letter is a word
+
+HOOKS_FILE = ArrayFile(HOOKS_MAGIC, HOOKS_VERSION, [
+    ('front', '<u4'),
+    ('back', '<u4'),
+    ('inner', 'u1'),
+    ('count', '<u4'),
+    ('before', '<u4'),
+])
+
+Hooks = namedtuple('Hooks', ['front', 'back', 'inner_front', 'inner_back'])
+
+
+def hooks_path(fork_path, name):
+    """Default hook table file for a section: next to the fork."""
+    return f"{fork_path}.{name.lower()}.hooks"
+
+
+def letters(mask):
+    """'aes' for a bitmask with bits 0, 4 and 18 set."""
+    return ''.join(chr(0x61 + c) for c in range(26) if mask >> c & 1)
+
+
+class HookTable:
+    """Per-rank hook arrays for one section."""
+
+    def __init__(self, entries, front, back, inner, ranked, reverse=False, crc=None):
+        self.entries = entries
+        self.front = front
+        self.back = back
+        self.inner = inner
+        self.ranked = ranked  # RankedDawg of entries
+        self.reverse = reverse
+        self.crc = section_crc(entries) if crc is None else crc
+
+    @classmethod
+    def build(cls, entries, reverse=False):
+        """Compute hooks from a section; reverse=True for S1."""
+        words = list(iter_words(entries))
+        rank = {w: r for r, w in enumerate(words)}
+        n = len(words)
+        front = np.zeros(n, dtype='<u4')
+        back = np.zeros(n, dtype='<u4')
+        inner = np.zeros(n, dtype='u1')
+
+        # Stored orientation first; S1 is swapped below
+        for r, x in enumerate(words):
+            if len(x) < 2:
+                continue
+            head = rank.get(x[1:])
+            if head is not None:
+                front[head] |= 1 << (ord(x[0]) - 0x61)
+                inner[r] |= INNER_FRONT
+            tail = rank.get(x[:-1])
+            if tail is not None:
+                back[tail] |= 1 << (ord(x[-1]) - 0x61)
+                inner[r] |= INNER_BACK
+
+        if reverse:
+            front, back = back, front
+            inner = ((inner & INNER_FRONT) << 1 | (inner & INNER_BACK) >> 1).astype('u1')
+        return cls(entries, front, back, inner, RankedDawg(entries), reverse)
+
+    def save(self, path):
+        """Write the table atomically to `path`."""
+        HOOKS_FILE.save(path, {'front': self.front, 'back': self.back,
+                               'inner': self.inner, 'count': self.ranked.count,
+                               'before': self.ranked.before},
+                        self.crc, int(self.reverse))
+
+    @classmethod
+    def load(cls, path, entries, reverse=False):
+        """Map a hook file; returns None if missing or stale for entries."""
+        crc = section_crc(entries)
+        arrays = HOOKS_FILE.load(path, crc, int(reverse))
+        if arrays is None or len(arrays['count']) != len(entries):
+            return None
+        ranked = RankedDawg(entries, arrays['count'], arrays['before'])
+        if len(arrays['front']) != ranked.total:
+            return None
+        return cls(entries, arrays['front'], arrays['back'], arrays['inner'],
+                   ranked, reverse, crc)
+
+    def rank(self, word):
+        """Rank of an ordinary-spelling word in this section, or None."""
+        return self.ranked.rank(word[::-1] if self.reverse else word)
+
+    def hooks(self, word):
+        """Hooks(front, back, inner_front, inner_back) for a word, or None."""
+        r = self.rank(word.lower())
+        if r is None:
+            return None
+        inner = int(self.inner[r])
+        return Hooks(letters(int(self.front[r])), letters(int(self.back[r])),
+                     bool(inner & INNER_FRONT), bool(inner & INNER_BACK))
+
+    def takes_back(self, word, letter):
+        """True if word + letter is a word."""
+        r = self.rank(word.lower())
+        return r is not None and bool(self.back[r] >> (ord(letter.lower()) - 0x61) & 1)
+
+    def takes_front(self, word, letter):
+        """True if letter + word is a word."""
+        r = self.rank(word.lower())
+        return r is not None and bool(self.front[r] >> (ord(letter.lower()) - 0x61) & 1)
+
+
+def open_hooks(fork, name, path=None, rebuild=False):
+    """HookTable for a section of an open MavenFork, cached next to it."""
+    entries = fork.section(name).to_array()
+    reverse = name.upper() == 'S1'
+    path = path or hooks_path(fork.path, name)
+    return load_or_build(path, lambda: HookTable.load(path, entries, reverse),
+                         lambda: HookTable.build(entries, reverse), rebuild)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Build or query the per-word hook tables of a DAWG section")
+    parser.add_argument('words', nargs='*', help='Words to show hooks for')
+    parser.add_argument('--fork', default=DAWG_PATH,
+                        help='Maven data fork (default: %(default)s)')
+    parser.add_argument('--section', default='S2', choices=['S1', 'S2', 's1', 's2'],
+                        help='Section (default: S2)')
+    parser.add_argument('--rebuild', action='store_true',
+                        help='Rebuild the table even if it is current')
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    with MavenFork(args.fork) as fork:
+        table = open_hooks(fork, args.section, rebuild=args.rebuild)
+    dt = time.perf_counter() - t0
+
+    n = len(table.front)
+    hooked = int(np.count_nonzero(table.front | table.back))
+    print(f"{args.section.upper()}: {n:,} words, {hooked:,} with hooks "
+          f"({dt * 1000:.0f} ms)")
+    for word in args.words:
+        h = table.hooks(word)
+        if h is None:
+            print(f"  {word.upper()}: not a word")
+            continue
+        dot_l = '·' if h.inner_front else ' '
+        dot_r = '·' if h.inner_back else ' '
+        print(f"  {h.front.upper():>8} {dot_l}{word.upper()}{dot_r} {h.back.upper()}")
+
+
+if __name__ == '__main__':
+    main()
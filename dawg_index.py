@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Persistent sibling-group and parent index for a Maven DAWG section.
+
+The old trace scripts find an entry's group by scanning backwards for
+the previous last-sibling flag, and rebuild a dict of "group start ->
+entries pointing at it" on every run.  This module computes both once,
+as flat arrays:
+
+  group_start[i]   first entry of the sibling group holding entry i
+  group_len[i]     number of entries in that group
+  parent_off[g]    CSR offsets: the entries whose child field is g are
+  parents[...]       parents[parent_off[g]:parent_off[g + 1]]
+
+and stores them in a small file next to the fork (maven2.s2.idx, ...),
+which later runs map read-only.  The file records the section's length
+and CRC-32 and is rebuilt automatically when the section changes.
+
+With the index, reverse tracing ("which words pass through entry N")
+walks parent lists upwards and costs time proportional to the answer;
+the prefixes reaching each group are cached on the DawgIndex.
+
+Index file (dawg_reader.ArrayFile, magic 'DGIX'), arrays:
+  group_start  u32 × n
+  group_len    u16 × n
+  parent_off   u32 × (n + 1)
+  parents      u32 × n_parents
+
+Usage:
+  python3 dawg_index.py [--fork maven2] [--section S2] [--rebuild]
+  python3 dawg_index.py --section S1 --trace 4711 [--limit 50]
+"""
+
+import argparse
+import sys
+import time
+import zlib
+
+import numpy as np
+
+from dawg_arrays import decode_entries, entry_array, group_bounds
+from dawg_reader import DAWG_PATH, ArrayFile, MavenFork, Section, load_or_build
+from dawg_words import ROOT_GROUP, iter_subtree
+
+INDEX_MAGIC = b'DGIX'
+INDEX_VERSION = 2
+
+INDEX_FILE = ArrayFile(INDEX_MAGIC, INDEX_VERSION, [
+    ('group_start', '<u4'),
+    ('group_len', '<u2'),
+    ('parent_off', '<u4'),
+    ('parents', '<u4'),
+])
+
+
+def section_crc(entries):
+    """CRC-32 of a section's big-endian entry bytes."""
+    if isinstance(entries, Section):
+        return zlib.crc32(entries.raw)
+    return zlib.crc32(entry_array(entries).astype('>u4'))
+
+
+def index_path(fork_path, name):
+    """Default index file for a section: next to the fork."""
+    return f"{fork_path}.{name.lower()}.idx"
+
+
+class DawgIndex:
+    """Group bounds and parent lists for one entry array."""
+
+    def __init__(self, entries, group_start, group_len, parent_off, parents,
+                 crc=None):
+        self.entries = entries
+        self.group_start = group_start
+        self.group_len = group_len
+        self.parent_off = parent_off
+        self.parents = parents
+        self.crc = section_crc(entries) if crc is None else crc
+        self._prefixes = {}  # group start -> sorted prefixes reaching it
+
+    @classmethod
+    def build(cls, entries):
+        dec = decode_entries(entries)
+        n = len(dec.child)
+
+        group_start = np.zeros(n, dtype='<u4')
+        group_len = np.zeros(n, dtype='<u2')
+        starts, lens = group_bounds(dec)
+        group_start[1:] = np.repeat(starts, lens)
+        group_len[1:] = np.repeat(lens, lens)
+
+        child = dec.child
+        src = np.flatnonzero((child > 0) & (child < n))
+        dst = child[src]
+        order = np.argsort(dst, kind='stable')
+        parents = src[order].astype('<u4')
+        parent_off = np.zeros(n + 1, dtype='<u4')
+        np.cumsum(np.bincount(dst, minlength=n), out=parent_off[1:])
+
+        return cls(entries, group_start, group_len, parent_off, parents)
+
+    def save(self, path):
+        """Write the index atomically to `path`."""
+        INDEX_FILE.save(path, {'group_start': self.group_start,
+                               'group_len': self.group_len,
+                               'parent_off': self.parent_off,
+                               'parents': self.parents}, self.crc)
+
+    @classmethod
+    def load(cls, path, entries):
+        """Map an index file; returns None if missing or stale for entries."""
+        crc = section_crc(entries)
+        arrays = INDEX_FILE.load(path, crc)
+        if arrays is None or len(arrays['group_start']) != len(entries):
+            return None
+        return cls(entries, arrays['group_start'], arrays['group_len'],
+                   arrays['parent_off'], arrays['parents'], crc)
+
+    def group(self, idx):
+        """range() of the entries in idx's sibling group."""
+        start = int(self.group_start[idx])
+        return range(start, start + int(self.group_len[idx]))
+
+    def parents_of(self, idx):
+        """Entries whose child field points at idx's sibling group."""
+        g = int(self.group_start[idx])
+        return self.parents[self.parent_off[g]:self.parent_off[g + 1]].tolist()
+
+    def _group_prefixes(self, g):
+        if g == ROOT_GROUP:
+            return ['']
+        cached = self._prefixes.get(g)
+        if cached is None:
+            entries = self.entries
+            parents = self.parents[self.parent_off[g]:self.parent_off[g + 1]].tolist()
+            cached = []
+            for p in parents:
+                letter = chr(entries[p] & 0xFF)
+                cached.extend(pre + letter
+                              for pre in self._group_prefixes(int(self.group_start[p])))
+            cached.sort()
+            self._prefixes[g] = cached
+        return cached
+
+    def prefixes(self, idx):
+        """Every stored string spelled from the root ending at entry idx."""
+        if not 0 < idx < len(self.group_start):
+            return []
+        letter = chr(self.entries[idx] & 0xFF)
+        return [pre + letter
+                for pre in self._group_prefixes(int(self.group_start[idx]))]
+
+    def words_through(self, idx):
+        """Yield every stored word whose path passes through entry idx.
+
+        Words come out in lexicographic order of their stored spelling.
+        """
+        val = self.entries[idx] if 0 < idx < len(self.group_start) else 0
+        child = val >> 10
+        for pre in self.prefixes(idx):
+            if val & 0x100:
+                yield pre
+            yield from iter_subtree(self.entries, child, pre)
+
+    def clear(self):
+        self._prefixes.clear()
+
+
+def open_index(fork, name, path=None, rebuild=False):
+    """DawgIndex for a section of an open MavenFork.
+
+    Maps the index file next to the fork when it is current; otherwise
+    builds it and tries to save it there (an unwritable directory just
+    means the index is rebuilt next time).
+    """
+    entries = fork.section(name)
+    path = path or index_path(fork.path, name)
+    return load_or_build(path, lambda: DawgIndex.load(path, entries),
+                         lambda: DawgIndex.build(entries), rebuild)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Build or query the group/parent index of a DAWG section")
+    parser.add_argument('--fork', default=DAWG_PATH,
+                        help='Maven data fork (default: %(default)s)')
+    parser.add_argument('--section', default='S2', choices=['S1', 'S2', 's1', 's2'],
+                        help='Section to index (default: S2)')
+    parser.add_argument('--index', default=None,
+                        help='Index file (default: FORK.SECTION.idx)')
+    parser.add_argument('--rebuild', action='store_true',
+                        help='Rebuild the index even if it is current')
+    parser.add_argument('--trace', type=int, metavar='ENTRY', default=None,
+                        help='List the words passing through an entry')
+    parser.add_argument('--limit', type=int, default=None,
+                        help='Stop after N words with --trace')
+    args = parser.parse_args()
+
+    name = args.section.upper()
+    path = args.index or index_path(args.fork, name)
+    with MavenFork(args.fork) as fork:
+        t0 = time.perf_counter()
+        index = open_index(fork, name, path, args.rebuild)
+        dt = time.perf_counter() - t0
+        entries = index.entries
+        print(f"{name}: {len(entries):,} entries, {len(index.parents):,} parent links "
+              f"({path}, {dt * 1000:.1f} ms)", file=sys.stderr)
+
+        if args.trace is None:
+            return
+        idx = args.trace
+        if not 0 < idx < len(entries):
+            parser.error(f"entry {idx} out of range 1..{len(entries) - 1}")
+        group = index.group(idx)
+        print(f"entry {idx} '{chr(entries[idx] & 0xFF)}': group {group.start}-"
+              f"{group.stop - 1}, parents {index.parents_of(idx)}", file=sys.stderr)
+        for i, word in enumerate(index.words_through(idx)):
+            if args.limit and i >= args.limit:
+                break
+            sys.stdout.write(word + '\n')
+
+
+if __name__ == '__main__':
+    main()
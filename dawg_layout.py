@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Alternative sibling-group layouts for Maven DAWG sections.
+
+serialize_dawg places groups in depth-first allocation order, which is
+what Maven's own files use.  For in-memory analysis, lookups touch the
+top few levels of the DAWG far more often than the rest, and in DFS
+order those hot groups are scattered across the whole section.  This
+module reorders the groups of a built section and rewrites every child
+pointer:
+
+  bfs    groups by depth (breadth-first from the root), so the first
+         levels are contiguous
+  freq   "hot" groups (visited by at least HOT_FRACTION of a workload's
+         lookups) first, most visited first; the rest keep their
+         Maven (DFS) order
+
+Entry 0 (sentinel) and the root group (1-26) stay where they are, so
+the result is still a valid section for every reader here; only Maven
+itself expects the default layout (the header's a-h boundary has no
+meaning in a reordered section).
+
+DFS order already keeps each word's deeper path compact, so pure BFS
+or a full frequency sort loses more than it gains; packing only the hot
+groups is what shrinks the working set.  The benchmark walks a word
+workload against each layout and reports lookup and enumeration
+throughput, plus cache-line misses per lookup in a simulated 32 KB LRU
+cache (interpreter overhead hides most of the effect on wall time).
+The workload is split in half: 'freq' is trained on one half and every
+layout is measured on the other.  With a whole-lexicon workload on S2
+the simulated misses drop from ~4.0 to ~3.6 per lookup, and from ~3.0
+to ~2.4 for a Zipf-skewed one.
+
+Usage:
+  python3 dawg_layout.py [--fork maven2] [--section S2]
+                         [--workload lexica/s2_words.txt | --zipf 1.0]
+                         [--repeat 3]
+"""
+
+import argparse
+import random
+import time
+from array import array
+from collections import OrderedDict, deque
+
+from dawg_reader import DAWG_PATH, MavenFork, Section
+from dawg_words import ROOT_GROUP, contains, iter_words
+
+LAYOUTS = ('maven', 'bfs', 'freq')
+
+FIRST_GROUP = 27  # sentinel + root group
+LINE_ENTRIES = 16  # 64-byte cache line / 4-byte entries
+CACHE_LINES = 512  # 32 KB simulated cache
+HOT_FRACTION = 0.001
+
+
+def _group_end(entries, g):
+    n = len(entries)
+    while g < n - 1 and not entries[g] & 0x200:
+        g += 1
+    return g + 1
+
+
+def bfs_order(entries):
+    """Group starts reachable from the root, breadth-first."""
+    n = len(entries)
+    seen = bytearray(n)
+    order = []
+    queue = deque([ROOT_GROUP])
+    while queue:
+        g = queue.popleft()
+        for i in range(g, _group_end(entries, g)):
+            child = entries[i] >> 10
+            if child and child < n and not seen[child]:
+                seen[child] = 1
+                order.append(child)
+                queue.append(child)
+    return order
+
+
+def group_visits(entries, words):
+    """How many times looking up each word visits each group (dict)."""
+    n = len(entries)
+    visits = {}
+    for word in words:
+        g = ROOT_GROUP
+        for ch in word:
+            visits[g] = visits.get(g, 0) + 1
+            target = ord(ch)
+            while g < n:
+                val = entries[g]
+                if val & 0xFF == target or val & 0x200:
+                    break
+                g += 1
+            if g >= n or val & 0xFF != target:
+                break
+            g = val >> 10
+            if not g:
+                break
+    return visits
+
+
+def freq_order(entries, visits, total, hot_fraction=HOT_FRACTION):
+    """Hot groups by descending visits, then the rest in address order.
+
+    A group is hot if at least hot_fraction of `total` lookups visit it.
+    """
+    threshold = max(1, total * hot_fraction)
+    groups = sorted(bfs_order(entries))
+    hot = sorted((g for g in groups if visits.get(g, 0) >= threshold),
+                 key=lambda g: -visits[g])
+    hot_set = set(hot)
+    return hot + [g for g in groups if g not in hot_set]
+
+
+def relayout(entries, order):
+    """Copy a section with its groups placed in `order`.
+
+    `order` lists group starts (excluding the root group); every child
+    pointer is rewritten.  Returns an array('I').
+    """
+    if isinstance(entries, Section):
+        entries = entries.to_array()
+    new_start = {}
+    size = FIRST_GROUP
+    for g in order:
+        new_start[g] = size
+        size += _group_end(entries, g) - g
+
+    out = array('I', bytes(4 * size))
+    if out.itemsize != 4:
+        out = array('L', bytes(out.itemsize * size))
+
+    def copy(src, dst):
+        for i in range(src, _group_end(entries, src)):
+            val = entries[i]
+            child = val >> 10
+            out[dst] = (val & 0x3FF) | (new_start.get(child, 0) << 10)
+            dst += 1
+
+    copy(ROOT_GROUP, ROOT_GROUP)
+    for g in order:
+        copy(g, new_start[g])
+    return out
+
+
+def apply_layout(entries, layout, workload=None):
+    """Return entries in `layout` (one of LAYOUTS).
+
+    'freq' needs a workload: an iterable of words as stored in the
+    section (reversed for S1).
+    """
+    if layout == 'maven':
+        return entries
+    if layout == 'bfs':
+        return relayout(entries, bfs_order(entries))
+    if layout == 'freq':
+        if workload is None:
+            raise ValueError("the 'freq' layout needs a workload word list")
+        workload = list(workload)
+        visits = group_visits(entries, workload)
+        return relayout(entries, freq_order(entries, visits, len(workload)))
+    raise ValueError(f"unknown layout {layout!r}")
+
+
+def read_workload(path, reverse=False):
+    """Words from a workload file, one "word [count]" per line.
+
+    A word with a count appears count times; repeats are kept, since
+    they are what 'freq' weights groups by.  reverse=True stores words
+    reversed, as the S1 section does.
+    """
+    workload = []
+    with open(path) as f:
+        for line in f:
+            parts = line.split()
+            if parts:
+                count = int(parts[1]) if len(parts) > 1 else 1
+                word = parts[0].lower()
+                workload.extend([word[::-1] if reverse else word] * count)
+    return workload
+
+
+def cache_misses(entries, words, lines=CACHE_LINES):
+    """Cache-line misses per lookup in a simulated LRU cache."""
+    n = len(entries)
+    cache = OrderedDict()
+    misses = 0
+    for word in words:
+        g = ROOT_GROUP
+        for ch in word:
+            target = ord(ch)
+            while g < n:
+                line = g // LINE_ENTRIES
+                if line in cache:
+                    cache.move_to_end(line)
+                else:
+                    misses += 1
+                    cache[line] = None
+                    if len(cache) > lines:
+                        cache.popitem(last=False)
+                val = entries[g]
+                if val & 0xFF == target or val & 0x200:
+                    break
+                g += 1
+            if g >= n or val & 0xFF != target:
+                break
+            g = val >> 10
+            if not g:
+                break
+    return misses / len(words) if words else 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark DAWG group layouts (maven DFS vs BFS vs frequency)")
+    parser.add_argument('--fork', default=DAWG_PATH,
+                        help='Maven data fork (default: %(default)s)')
+    parser.add_argument('--section', default='S2', choices=['S1', 'S2', 's1', 's2'],
+                        help='Section (default: S2)')
+    parser.add_argument('--workload', default=None,
+                        help='Words to look up, optionally "word count" per line '
+                             '(default: the section itself)')
+    parser.add_argument('--zipf', type=float, default=None, metavar='S',
+                        help='Instead, draw a Zipf(S)-skewed workload from '
+                             'the section words')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Timing repetitions, best is reported (default: 3)')
+    args = parser.parse_args()
+
+    name = args.section.upper()
+    with MavenFork(args.fork) as fork:
+        entries = fork.section(name).to_array()
+
+    if args.workload:
+        workload = read_workload(args.workload, reverse=(name == 'S1'))
+    else:
+        workload = list(iter_words(entries))
+    random.seed(1)
+    random.shuffle(workload)
+    if args.zipf is not None:
+        weights = [1 / (i + 1) ** args.zipf for i in range(len(workload))]
+        workload = random.choices(workload, weights, k=len(workload))
+    # 'freq' trains on one half and is measured on the other, so it is
+    # not scored on the exact lookups it was laid out for
+    half = len(workload) // 2
+    train, held_out = workload[:half], workload[half:]
+
+    print(f"{name}: {len(entries):,} entries, workload {len(train):,} training + "
+          f"{len(held_out):,} held-out lookups")
+    print(f"  {'layout':<6} {'lookups/s':>12} {'enumerate':>10} {'misses/lookup':>14}")
+    for layout in LAYOUTS:
+        arr = apply_layout(entries, layout, train)
+        best_lookup = best_enum = float('inf')
+        for _ in range(args.repeat):
+            t0 = time.perf_counter()
+            found = sum(1 for w in held_out if contains(arr, w))
+            t1 = time.perf_counter()
+            count = sum(1 for _ in iter_words(arr))
+            t2 = time.perf_counter()
+            best_lookup = min(best_lookup, t1 - t0)
+            best_enum = min(best_enum, t2 - t1)
+        print(f"  {layout:<6} {len(held_out) / best_lookup:>12,.0f} {best_enum:>9.2f}s "
+              f"{cache_misses(arr, held_out):>14.2f}   ({found:,} found, {count:,} words)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""
+Succinct (LOUDS-style) in-memory representation of a Maven DAWG section.
+
+A Maven entry spends 22 of its 32 bits on the child pointer.  Here the
+DAWG's sibling groups become nodes numbered in breadth-first order and
+each entry becomes an arc described by a few bits:
+
+  degrees   LOUDS degree sequence: per node, one 1 per arc then a 0;
+            node k's arcs start at select0(k - 1) + 1 - k
+  letters   5 bits per arc (letter byte - 0x61; 0x7B, the GADDAG
+            separator, fits too)
+  eow       1 bit per arc
+  tree      1 bit per arc: the arc that first reaches a node in BFS
+            order.  Its child needs no pointer: it is node
+            rank1(tree, arc) + 1, exactly as in a LOUDS tree
+  shared    1 bit per arc: an arc into a node that was reached earlier
+            (the DAWG's suffix sharing).  Only these store a pointer,
+            targets[rank1(shared, arc)], in ceil(log2(nodes)) bits
+
+Bit vectors carry a rank directory every 256 bits and a select sample
+every 64 zeros.  For the reference maven2 sections this is about 55-60%
+of the entry format.  Navigation costs a few rank/select operations per
+letter, so lookups run about 8x slower than over an entry array.
+
+LoudsDawg converts from any entry sequence, offers the same
+find/contains/iter_words calls as dawg_words (iter_words with the same
+prefix/min_len/max_len/after arguments), and converts back to
+Maven entries (serialize_dawg layout, byte-identical for sections that
+build_dawg wrote).
+
+Usage:
+  python3 dawg_louds.py [--fork maven2] [--section S2]
+"""
+
+import argparse
+import time
+from array import array
+
+import numpy as np
+
+from dawg_layout import bfs_order
+from dawg_reader import DAWG_PATH, MavenFork, Section
+
+LETTER_BASE = 0x61
+LETTER_BITS = 5
+RANK_WORDS = 4    # rank directory entry every 4 × 64 bits
+SELECT_SAMPLE = 64  # select0 sample every 64 zeros
+
+
+def _words(bits):
+    """Pack a 0/1 uint8 ndarray into an array('Q') of little-endian words."""
+    packed = np.packbits(bits.astype(np.uint8), bitorder='little')
+    packed = np.concatenate([packed, np.zeros(-len(packed) % 8 + 8, np.uint8)])
+    return array('Q', packed.tobytes())
+
+
+class BitVector:
+    """Static bit vector with rank1 and select0."""
+
+    def __init__(self, bits, select=False):
+        self.size = len(bits)
+        self.words = _words(bits)
+        ones = np.concatenate([[0], np.cumsum(bits, dtype=np.int64)])
+        self.ranks = array('I', ones[::64 * RANK_WORDS].astype(np.uint32).tobytes())
+        self.samples = array('I')
+        if select:
+            zeros = np.flatnonzero(bits == 0)
+            self.samples = array('I', (zeros[::SELECT_SAMPLE] >> 6)
+                                 .astype(np.uint32).tobytes())
+
+    def __getitem__(self, i):
+        return self.words[i >> 6] >> (i & 63) & 1
+
+    def rank1(self, i):
+        """Number of 1 bits in positions [0, i)."""
+        w = i >> 6
+        block = w // RANK_WORDS
+        r = self.ranks[block]
+        words = self.words
+        for j in range(block * RANK_WORDS, w):
+            r += words[j].bit_count()
+        return r + (words[w] & ((1 << (i & 63)) - 1)).bit_count()
+
+    def select0(self, k):
+        """Position of the k-th 0 bit (0-based)."""
+        words = self.words
+        w = self.samples[k // SELECT_SAMPLE]
+        zeros = (w << 6) - self.rank1(w << 6)
+        while True:
+            z = 64 - words[w].bit_count()
+            if zeros + z > k:
+                break
+            zeros += z
+            w += 1
+        inv = ~words[w] & 0xFFFFFFFFFFFFFFFF
+        for _ in range(k - zeros):
+            inv &= inv - 1
+        return (w << 6) + (inv & -inv).bit_length() - 1
+
+    def next0(self, i):
+        """Position of the first 0 bit at or after i."""
+        words = self.words
+        w = i >> 6
+        inv = ~words[w] & 0xFFFFFFFFFFFFFFFF & ~((1 << (i & 63)) - 1)
+        while not inv:
+            w += 1
+            inv = ~words[w] & 0xFFFFFFFFFFFFFFFF
+        return (w << 6) + (inv & -inv).bit_length() - 1
+
+    @property
+    def nbytes(self):
+        return (len(self.words) * 8 + len(self.ranks) * 4
+                + len(self.samples) * 4)
+
+
+class IntVector:
+    """Fixed-width packed unsigned integers."""
+
+    def __init__(self, values, width):
+        self.width = width
+        self.mask = (1 << width) - 1
+        values = np.asarray(values, dtype=np.uint64)
+        bits = ((values[:, None] >> np.arange(width, dtype=np.uint64)) & 1)
+        self.words = _words(bits.reshape(-1))
+        self.size = len(values)
+
+    def __getitem__(self, i):
+        pos = i * self.width
+        w, off = pos >> 6, pos & 63
+        val = self.words[w] >> off
+        if off + self.width > 64:
+            val |= self.words[w + 1] << (64 - off)
+        return val & self.mask
+
+    @property
+    def nbytes(self):
+        return len(self.words) * 8
+
+
+class LoudsDawg:
+    """A DAWG section as LOUDS bit vectors plus packed letters/targets."""
+
+    def __init__(self, entries):
+        if isinstance(entries, Section):
+            entries = entries.to_array()
+        n = len(entries)
+        groups = [1] + bfs_order(entries)  # node k starts at groups[k]
+        node_of = {g: k for k, g in enumerate(groups)}
+
+        degree_bits, letters, eow, tree, shared, targets = [], [], [], [], [], []
+        seen = bytearray(len(groups))
+        seen[0] = 1
+        for g in groups:
+            i = g
+            while i < n:
+                val = entries[i]
+                child = val >> 10
+                k = node_of.get(child) if child and child < n else None
+                degree_bits.append(1)
+                letters.append((val & 0xFF) - LETTER_BASE)
+                eow.append(val >> 8 & 1)
+                # Arcs are visited in node (BFS) order, so the first arc
+                # into a node is the one that discovered it: the r-th
+                # such arc leads to node r + 1
+                if k is not None and not seen[k]:
+                    seen[k] = 1
+                    tree.append(1)
+                    shared.append(0)
+                elif k is not None:
+                    tree.append(0)
+                    shared.append(1)
+                    targets.append(k)
+                else:
+                    tree.append(0)
+                    shared.append(0)
+                if val & 0x200:
+                    break
+                i += 1
+            degree_bits.append(0)
+
+        self.nodes = len(groups)
+        self.arcs = len(letters)
+        self.degrees = BitVector(np.array(degree_bits, dtype=np.uint8), select=True)
+        self.letters = IntVector(letters, LETTER_BITS)
+        self.eow = BitVector(np.array(eow, dtype=np.uint8))
+        self.tree = BitVector(np.array(tree, dtype=np.uint8))
+        self.shared = BitVector(np.array(shared, dtype=np.uint8))
+        self.targets = IntVector(targets, max(1, (self.nodes - 1).bit_length()))
+
+    @property
+    def nbytes(self):
+        """Memory used by the bit vectors and packed arrays."""
+        return (self.degrees.nbytes + self.letters.nbytes + self.eow.nbytes
+                + self.tree.nbytes + self.shared.nbytes + self.targets.nbytes)
+
+    def arc_range(self, node):
+        """(first, end) arc indexes of a node."""
+        start = self.degrees.select0(node - 1) + 1 if node else 0
+        end = self.degrees.next0(start)
+        return start - node, end - node
+
+    def child(self, arc):
+        """Node reached through an arc, or -1 if it has no child."""
+        if self.tree[arc]:
+            return self.tree.rank1(arc) + 1
+        if self.shared[arc]:
+            return self.targets[self.shared.rank1(arc)]
+        return -1
+
+    def find_arc(self, node, letter_byte):
+        """Arc of `node` labelled letter_byte, or -1."""
+        first, end = self.arc_range(node)
+        target = letter_byte - LETTER_BASE
+        letters = self.letters
+        for a in range(first, end):
+            if letters[a] == target:
+                return a
+        return -1
+
+    def find(self, word):
+        """Arc reached by spelling `word` from the root, or -1."""
+        node = 0
+        arc = -1
+        for ch in word:
+            if node < 0:
+                return -1
+            arc = self.find_arc(node, ord(ch))
+            if arc < 0:
+                return -1
+            node = self.child(arc)
+        return arc
+
+    def contains(self, word):
+        """True if `word` is stored (as spelled, i.e. reversed for S1)."""
+        arc = self.find(word) if word else -1
+        return arc >= 0 and bool(self.eow[arc])
+
+    def iter_words(self, prefix="", min_len=1, max_len=None, after=None):
+        """Yield stored words starting with `prefix`, in lexicographic order.
+
+        Arguments as for dawg_words.iter_words, including the `after`
+        resume cursor (only words strictly greater than it).
+        """
+        if max_len is not None and max_len < max(min_len, len(prefix)):
+            return
+        if after is not None and not after.startswith(prefix):
+            if after > prefix:
+                return  # every word with this prefix sorts before `after`
+            after = None
+
+        if prefix:
+            arc = self.find(prefix)
+            if arc < 0:
+                return
+            if self.eow[arc] and len(prefix) >= min_len and after is None:
+                yield prefix
+            node = self.child(arc)
+        else:
+            node = 0
+        if node < 0 or (max_len is not None and len(prefix) >= max_len):
+            return
+
+        letters, eow = self.letters, self.eow
+        stack = [(node, prefix)]
+        while stack:
+            node, pre = stack.pop()
+            first, end = self.arc_range(node)
+            deeper = []
+            depth = len(pre) + 1
+            for a in range(first, end):
+                word = pre + chr(letters[a] + LETTER_BASE)
+                if after is not None and word < after and not after.startswith(word):
+                    continue  # this subtree sorts entirely before `after`
+                deeper.append((a, word))
+            # Reverse so the smallest letter is expanded first
+            for a, word in reversed(deeper):
+                child = self.child(a)
+                if child >= 0 and (max_len is None or depth < max_len):
+                    stack.append((child, word))
+                if eow[a] and depth >= min_len and (after is None or word > after):
+                    stack.append((-1, word))
+            while stack and stack[-1][0] < 0:
+                yield stack.pop()[1]
+
+    def to_entries(self):
+        """Convert back to (entries, boundary) via build_dawg.serialize_dawg."""
+        from build_dawg import DawgTable, serialize_dawg
+
+        table = DawgTable()
+        node_arcs = [None] * self.nodes  # node -> flat arcs of its state(s)
+        stack = [0]
+        while stack:
+            node = stack[-1]
+            first, end = self.arc_range(node)
+            pending = False
+            for a in range(first, end):
+                child = self.child(a)
+                if child >= 0 and node_arcs[child] is None:
+                    stack.append(child)
+                    pending = True
+            if pending:
+                continue
+            stack.pop()
+            arcs = []
+            for a in range(first, end):
+                child = self.child(a)
+                eow = self.eow[a]
+                if child < 0 and not eow:
+                    continue  # root slot of an absent letter
+                # eow belongs to the target state in a DawgTable
+                arcs.append(self.letters[a] + LETTER_BASE)
+                arcs.append(table.add_state(eow, node_arcs[child] if child >= 0 else []))
+            node_arcs[node] = arcs
+        table.root = table.add_state(0, node_arcs[0])
+        return serialize_dawg(table)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare a succinct LOUDS encoding with Maven DAWG entries")
+    parser.add_argument('--fork', default=DAWG_PATH,
+                        help='Maven data fork (default: %(default)s)')
+    parser.add_argument('--section', default='S2', choices=['S1', 'S2', 's1', 's2'],
+                        help='Section (default: S2)')
+    args = parser.parse_args()
+
+    with MavenFork(args.fork) as fork:
+        entries = fork.section(args.section).to_array()
+
+    t0 = time.perf_counter()
+    louds = LoudsDawg(entries)
+    t1 = time.perf_counter()
+    print(f"{args.section.upper()}: {len(entries):,} entries "
+          f"({len(entries) * 4:,} bytes) -> {louds.nodes:,} nodes, {louds.arcs:,} arcs")
+    print(f"  LOUDS: {louds.nbytes:,} bytes "
+          f"({100 * louds.nbytes / (len(entries) * 4):.0f}% of entries), "
+          f"built in {t1 - t0:.2f}s")
+    parts = [('degrees', louds.degrees), ('letters', louds.letters), ('eow', louds.eow),
+             ('tree', louds.tree), ('shared', louds.shared), ('targets', louds.targets)]
+    print("  " + ", ".join(f"{name} {vec.nbytes:,}" for name, vec in parts))
+
+    t0 = time.perf_counter()
+    words = list(louds.iter_words())
+    t1 = time.perf_counter()
+    found = sum(1 for w in words if louds.contains(w))
+    t2 = time.perf_counter()
+    print(f"  enumerate: {len(words):,} words in {t1 - t0:.2f}s, "
+          f"lookups: {len(words) / (t2 - t1):,.0f}/s ({found:,} found)")
+
+    t0 = time.perf_counter()
+    back, _ = louds.to_entries()
+    t1 = time.perf_counter()
+    same = list(back) == list(entries)
+    print(f"  back to entries in {t1 - t0:.2f}s: "
+          f"{'identical' if same else f'{len(back):,} entries (layout differs)'}")
+
+
+if __name__ == '__main__':
+    main()
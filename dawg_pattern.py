@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Wildcard / pattern search over Maven DAWG entry arrays.
+
+Pattern syntax (case-insensitive):
+  a-z       that letter
+  ? or .    any one letter
+  [aeiou]   one letter from a class; ranges ([a-e]) and negation
+            ([^aeiou]) are allowed
+  *         any run of zero or more letters
+
+Examples: ?a??er, q*, *ing, [^aeiou][aeiou]*z, c?t*
+
+The pattern is compiled to a small NFA held as a bitmask of pattern
+positions.  The DAWG is walked depth-first; at each entry the state set
+is advanced by the entry's letter and the branch is dropped as soon as
+no position survives or the length bound is hit.  Matches are yielded
+as they are found, in lexicographic order.
+
+S1 stores words reversed; searching it reverses the pattern, and matches
+are reversed back to ordinary spelling (ordered by their reversal).
+
+Usage:
+  python3 dawg_pattern.py PATTERN [--section S1|S2] [--min N] [--max N]
+                          [--limit N] [--count]
+"""
+
+import argparse
+import sys
+
+from dawg_reader import DAWG_PATH, MavenFork
+from dawg_words import ROOT_GROUP
+
+ALL_LETTERS = (1 << 26) - 1
+
+
+class Pattern:
+    """A compiled pattern: one letter bitmask per position, or a star."""
+
+    def __init__(self, tokens):
+        # tokens: list of ('set', mask26) or ('star', None)
+        self.tokens = tokens
+        self.final = 1 << len(tokens)
+
+        self.star = 0
+        for i, (kind, _) in enumerate(tokens):
+            if kind == 'star':
+                self.star |= 1 << i
+
+        # accept[c]: positions whose class contains letter c
+        self.accept = [0] * 26
+        for i, (kind, mask) in enumerate(tokens):
+            if kind == 'set':
+                for c in range(26):
+                    if mask >> c & 1:
+                        self.accept[c] |= 1 << i
+
+        self.fixed_length = None if self.star else len(tokens)
+        self.min_length = sum(1 for kind, _ in tokens if kind == 'set')
+        self.start = self.closure(1)
+
+    def closure(self, states):
+        """Add the positions reachable by skipping stars."""
+        star = self.star
+        while True:
+            more = states | ((states & star) << 1)
+            if more == states:
+                return states
+            states = more
+
+    def step(self, states, c):
+        """State set after reading letter index c (0-25)."""
+        moved = ((states & self.accept[c]) << 1) | (states & self.star)
+        return self.closure(moved) if moved else 0
+
+    def reversed(self):
+        return Pattern(self.tokens[::-1])
+
+
+def compile_pattern(text):
+    """Parse a pattern string into a Pattern; raises ValueError."""
+    tokens = []
+    text = text.lower()
+    i = 0
+    while i < len(text):
+        ch = text[i]
+        if 'a' <= ch <= 'z':
+            tokens.append(('set', 1 << (ord(ch) - 0x61)))
+        elif ch in '?.':
+            tokens.append(('set', ALL_LETTERS))
+        elif ch == '*':
+            if not tokens or tokens[-1][0] != 'star':
+                tokens.append(('star', None))
+        elif ch == '[':
+            end = text.find(']', i + 1)
+            if end < 0:
+                raise ValueError(f"unterminated class in {text!r}")
+            body = text[i + 1:end]
+            negate = body.startswith('^')
+            if negate:
+                body = body[1:]
+            mask = 0
+            j = 0
+            while j < len(body):
+                lo = body[j]
+                if j + 2 < len(body) and body[j + 1] == '-':
+                    hi = body[j + 2]
+                    j += 3
+                else:
+                    hi = lo
+                    j += 1
+                if not ('a' <= lo <= 'z' and 'a' <= hi <= 'z' and lo <= hi):
+                    raise ValueError(f"bad letter class [{text[i + 1:end]}] in {text!r}")
+                for c in range(ord(lo), ord(hi) + 1):
+                    mask |= 1 << (c - 0x61)
+            if negate:
+                mask = ALL_LETTERS & ~mask
+            if not mask:
+                raise ValueError(f"empty letter class in {text!r}")
+            tokens.append(('set', mask))
+            i = end
+        else:
+            raise ValueError(f"unexpected {ch!r} in pattern {text!r}")
+        i += 1
+    if not tokens:
+        raise ValueError("empty pattern")
+    return Pattern(tokens)
+
+
+def iter_matches(entries, pattern, min_len=1, max_len=None, reverse=False):
+    """Yield words of the section matching `pattern` (str or Pattern).
+
+    With reverse=True the section is taken to hold reversed words (S1):
+    the pattern is reversed for the walk and matches are reversed back.
+    """
+    if isinstance(pattern, str):
+        pattern = compile_pattern(pattern)
+    if reverse:
+        pattern = pattern.reversed()
+    if pattern.fixed_length is not None:
+        max_len = (pattern.fixed_length if max_len is None
+                   else min(max_len, pattern.fixed_length))
+    min_len = max(min_len, pattern.min_length)
+    if max_len is not None and max_len < min_len:
+        return
+
+    n = len(entries)
+    final = pattern.final
+    step = pattern.step
+    letters = []
+
+    def walk(g, states):
+        depth = len(letters) + 1
+        while g and g < n:
+            val = entries[g]
+            c = (val & 0xFF) - 0x61
+            if 0 <= c < 26:
+                nxt = step(states, c)
+                if nxt:
+                    letters.append(chr(0x61 + c))
+                    if val & 0x100 and nxt & final and depth >= min_len:
+                        word = ''.join(letters)
+                        yield word[::-1] if reverse else word
+                    child = val >> 10
+                    if child and (max_len is None or depth < max_len):
+                        yield from walk(child, nxt)
+                    letters.pop()
+            if val & 0x200:
+                break
+            g += 1
+
+    yield from walk(ROOT_GROUP, pattern.start)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Find words matching a wildcard pattern in the Maven DAWG")
+    parser.add_argument('pattern', help="Pattern, e.g. '?a??er', 'q*', '[^aeiou]*ing'")
+    parser.add_argument('--fork', default=DAWG_PATH,
+                        help='Maven data fork (default: %(default)s)')
+    parser.add_argument('--section', default='S2', choices=['S1', 'S2', 's1', 's2'],
+                        help='Section to search (default: S2)')
+    parser.add_argument('--min', type=int, default=1, dest='min_len',
+                        help='Minimum word length')
+    parser.add_argument('--max', type=int, default=None, dest='max_len',
+                        help='Maximum word length')
+    parser.add_argument('--limit', type=int, default=None,
+                        help='Stop after N matches')
+    parser.add_argument('--count', action='store_true',
+                        help='Only print the number of matches')
+    args = parser.parse_args()
+
+    try:
+        pattern = compile_pattern(args.pattern)
+    except ValueError as e:
+        parser.error(str(e))
+
+    name = args.section.upper()
+    with MavenFork(args.fork) as fork:
+        entries = fork.section(name).to_array()
+
+    total = 0
+    for word in iter_matches(entries, pattern, args.min_len, args.max_len,
+                             reverse=(name == 'S1')):
+        total += 1
+        if not args.count:
+            sys.stdout.write(word + '\n')
+        if args.limit and total >= args.limit:
+            break
+    if args.count:
+        print(total)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Count-annotated Maven DAWG: word ranking, unranking and uniform sampling.
+
+For every entry we precompute
+  count[i]   - words that start with the path ending at entry i
+               (its own word if eow, plus everything below its child)
+  before[i]  - words under the earlier siblings in entry i's group
+
+With these, the lexicographic rank of a word, the word at a given rank,
+and the number of words under any prefix each take one root-to-leaf walk
+(O(length × alphabet)) instead of an enumeration.  rank() is a minimal
+perfect hash of the lexicon onto 0 .. total-1, suitable for indexing
+compact per-word side tables.
+
+Ranks are in stored order: S1 stores words reversed, so S1 ranks order
+words by their reversal.
+
+Usage:
+  python3 dawg_rank.py [--fork maven2] [--section S2] [--sample 10]
+                       [--rank WORD ...] [--unrank N ...]
+"""
+
+import argparse
+import random
+from array import array
+
+from dawg_reader import DAWG_PATH, MavenFork, Section
+from dawg_words import ROOT_GROUP
+
+
+class RankedDawg:
+    """An entry array plus per-entry word counts."""
+
+    def __init__(self, entries, count=None, before=None):
+        """Annotate `entries`, or reuse count/before saved from an earlier
+        annotation of the same entries (e.g. mapped from a side file).
+
+        count and before may be any uint32 arrays with tobytes() (numpy
+        views, array('I')); each is copied in one buffer copy.
+        """
+        if isinstance(entries, Section):
+            entries = entries.to_array()
+        self.entries = entries
+        if count is None or before is None:
+            self.count, self.before = self._annotate(entries)
+        else:
+            self.count = array('I', count.tobytes())
+            self.before = array('I', before.tobytes())
+        self.total = self._group_total(ROOT_GROUP)
+
+    @staticmethod
+    def _annotate(entries):
+        n = len(entries)
+        count = array('I', bytes(4 * n))
+        before = array('I', bytes(4 * n))
+        group_total = array('I', bytes(4 * n))  # indexed by group start
+        done = bytearray(n)  # per group start
+
+        # Iterative post-order over sibling groups
+        stack = [ROOT_GROUP] if n > ROOT_GROUP else []
+        while stack:
+            g = stack[-1]
+            if done[g]:
+                stack.pop()
+                continue
+            end = _last(entries, g, n) + 1
+            pending = False
+            for i in range(g, end):
+                child = entries[i] >> 10
+                if child and child < n and not done[child]:
+                    stack.append(child)
+                    pending = True
+            if pending:
+                continue
+            stack.pop()
+            running = 0
+            for i in range(g, end):
+                val = entries[i]
+                child = val >> 10
+                c = (val >> 8) & 1
+                if child and child < n:
+                    c += group_total[child]
+                count[i] = c
+                before[i] = running
+                running += c
+            group_total[g] = running
+            done[g] = 1
+        return count, before
+
+    def _group_total(self, g):
+        if g == 0 or g >= len(self.entries):
+            return 0
+        last = _last(self.entries, g, len(self.entries))
+        return self.before[last] + self.count[last]
+
+    def _find(self, g, target):
+        """Entry index of letter `target` in group g, or 0."""
+        entries = self.entries
+        n = len(entries)
+        while g and g < n:
+            val = entries[g]
+            if val & 0xFF == target:
+                return g
+            if val & 0x200:
+                return 0
+            g += 1
+        return 0
+
+    def rank(self, word):
+        """0-based lexicographic rank of `word`, or None if absent."""
+        entries = self.entries
+        g = ROOT_GROUP
+        r = 0
+        for pos, ch in enumerate(word):
+            idx = self._find(g, ord(ch))
+            if not idx:
+                return None
+            val = entries[idx]
+            r += self.before[idx]
+            if pos == len(word) - 1:
+                return r if val & 0x100 else None
+            r += (val >> 8) & 1  # the prefix word sorts before its extensions
+            g = val >> 10
+        return None
+
+    def unrank(self, r):
+        """The word with rank r (0 <= r < total)."""
+        if not 0 <= r < self.total:
+            raise IndexError(f"rank {r} out of range 0..{self.total - 1}")
+        entries, count = self.entries, self.count
+        g = ROOT_GROUP
+        letters = []
+        while True:
+            val = entries[g]
+            c = count[g]
+            if r >= c:
+                r -= c
+                g += 1
+                continue
+            letters.append(chr(val & 0xFF))
+            if val & 0x100:
+                if r == 0:
+                    return ''.join(letters)
+                r -= 1
+            g = val >> 10
+
+    def prefix_range(self, prefix):
+        """(first_rank, count) of the words starting with `prefix`."""
+        if not prefix:
+            return 0, self.total
+        entries = self.entries
+        g = ROOT_GROUP
+        r = 0
+        for pos, ch in enumerate(prefix):
+            idx = self._find(g, ord(ch))
+            if not idx:
+                return r, 0
+            val = entries[idx]
+            r += self.before[idx]
+            if pos == len(prefix) - 1:
+                return r, self.count[idx]
+            r += (val >> 8) & 1
+            g = val >> 10
+        return r, 0
+
+    def prefix_count(self, prefix):
+        """Number of words starting with `prefix` (including itself)."""
+        return self.prefix_range(prefix)[1]
+
+    def sample(self, k=1, rng=random):
+        """k words drawn uniformly at random (with replacement)."""
+        return [self.unrank(rng.randrange(self.total)) for _ in range(k)]
+
+
+def _last(entries, g, n):
+    """Index of the last entry in the group starting at g."""
+    while g < n - 1 and not entries[g] & 0x200:
+        g += 1
+    return g
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Rank, unrank and sample words of a Maven DAWG section")
+    parser.add_argument('--fork', default=DAWG_PATH,
+                        help='Maven data fork (default: %(default)s)')
+    parser.add_argument('--section', default='S2', choices=['S1', 'S2', 's1', 's2'],
+                        help='Section (default: S2)')
+    parser.add_argument('--sample', type=int, default=10,
+                        help='Number of uniformly random words to draw')
+    parser.add_argument('--rank', nargs='*', default=[],
+                        help='Words to rank')
+    parser.add_argument('--unrank', nargs='*', type=int, default=[],
+                        help='Ranks to turn back into words')
+    args = parser.parse_args()
+
+    with MavenFork(args.fork) as fork:
+        dawg = RankedDawg(fork.section(args.section))
+
+    print(f"{args.section.upper()}: {dawg.total:,} words")
+    for word in args.rank:
+        r = dawg.rank(word.lower())
+        print(f"  rank({word}) = {r if r is not None else 'not a word'}")
+    for r in args.unrank:
+        print(f"  unrank({r}) = {dawg.unrank(r)}")
+    if args.sample:
+        print(f"  sample: {' '.join(dawg.sample(args.sample))}")
+    for prefix in ('q', 'qu', 'za', 'x'):
+        first, count = dawg.prefix_range(prefix)
+        print(f"  prefix {prefix!r}: {count:,} words from rank {first:,}")
+
+
+if __name__ == '__main__':
+    main()
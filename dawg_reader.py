@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+Memory-mapped, zero-copy reader for the Maven DAWG data fork.
+
+The fork is mapped read-only, so several processes reading the same file
+share one page-cached copy.  Each section is exposed as a memoryview over
+the mapped bytes (big-endian uint32 entries); nothing is decoded until an
+entry is asked for, and no per-entry objects are built.  ArrayFile
+and load_or_build handle the side files that other modules derive from
+a section and keep next to the fork.
+
+File format (as written by build_dawg.pack_file):
+  [12-byte header: boundary, s1_count, s2_count]
+  [S1 entries × 4 bytes]
+  [S1 letter index duplicate: 26 × 4 bytes]
+  [S2 entries × 4 bytes]
+  [S2 letter index duplicate: 26 × 4 bytes]
+
+Entry format (32-bit big-endian):
+  bits 0-7:   letter (0x61-0x7A)
+  bit 8:      end-of-word
+  bit 9:      last-sibling
+  bits 10-31: child entry index
+
+Usage:
+  python3 dawg_reader.py [maven2]     # header, index check, scan speed
+"""
+
+import mmap
+import os
+import struct
+import sys
+import time
+from array import array
+
+DAWG_PATH = "/Volumes/T7/retrogames/oldmac/share/maven2"
+
+HEADER_SIZE = 12
+INDEX_DUP_SIZE = 26 * 4
+
+_BE32 = struct.Struct('>I')
+_HEADER = struct.Struct('>III')
+
+
+def map_file(path):
+    """Map a whole file read-only; returns a memoryview of its bytes.
+
+    The mapping stays alive as long as the view (or any slice of it) does.
+    """
+    with open(path, 'rb') as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return memoryview(mapped)
+
+
+class ArrayFile:
+    """Layout of a side file of little-endian arrays derived from a section.
+
+    The per-section files written next to a fork (dawg_index,
+    dawg_hooks, dawg_alphagram) share one format and differ only in the
+    arrays they declare as (name, dtype) pairs:
+
+      [header: magic 4s, version u16, flags u16, section crc32 u32,
+               one u32 length per array; padded to 8 bytes]
+      [each array in declaration order, padded to 8 bytes]
+
+    load() maps the file and returns zero-copy numpy views, or None if
+    the file is missing, truncated, from another version, or was built
+    for another section (crc) or orientation (flags).
+    """
+
+    def __init__(self, magic, version, fields):
+        import numpy as np
+        self.magic = magic
+        self.version = version
+        self.fields = tuple((name, np.dtype(dtype)) for name, dtype in fields)
+        self.header = struct.Struct(f'<4sHHI{len(self.fields)}I')
+
+    def save(self, path, arrays, crc, flags=0):
+        """Write `arrays` (name -> array) atomically to `path`."""
+        import numpy as np
+        data = [np.asarray(arrays[name]).astype(dtype, copy=False).tobytes()
+                for name, dtype in self.fields]
+        lengths = [len(arrays[name]) for name, _ in self.fields]
+        header = self.header.pack(self.magic, self.version, flags, crc, *lengths)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, 'wb') as f:
+            for chunk in (header, *data):
+                f.write(chunk + bytes(-len(chunk) % 8))
+        os.replace(tmp, path)
+
+    def load(self, path, crc, flags=0):
+        """Map `path`; returns {name: ndarray}, or None if stale or missing."""
+        import numpy as np
+        try:
+            buf = map_file(path)
+        except (FileNotFoundError, ValueError):  # ValueError: empty file
+            return None
+        if len(buf) < self.header.size:
+            return None
+        magic, version, file_flags, file_crc, *lengths = self.header.unpack_from(buf, 0)
+        if (magic != self.magic or version != self.version
+                or file_flags != flags or file_crc != crc):
+            return None
+        off = self.header.size + -self.header.size % 8
+        sizes = [n * dtype.itemsize for n, (_, dtype) in zip(lengths, self.fields)]
+        if len(buf) != off + sum(size + -size % 8 for size in sizes):
+            return None
+        arrays = {}
+        for (name, dtype), n, size in zip(self.fields, lengths, sizes):
+            arrays[name] = np.frombuffer(buf, dtype, n, off)
+            off += size + -size % 8
+        return arrays
+
+
+def load_or_build(path, load, build, rebuild=False):
+    """load(), or else build() and try to save the result to `path`.
+
+    An unwritable directory only means the file is rebuilt next time.
+    """
+    result = None if rebuild else load()
+    if result is None:
+        result = build()
+        try:
+            result.save(path)
+        except OSError as e:
+            print(f"warning: could not save {path}: {e}", file=sys.stderr)
+    return result
+
+
+class Section:
+    """Read-only sequence of the 32-bit entries in one DAWG section.
+
+    Supports len(), indexing and iteration, so it can be passed anywhere
+    an entry list is expected (e.g. build_dawg.enumerate_entries).
+    `raw` is the underlying memoryview of big-endian bytes.
+    """
+    __slots__ = ['raw', 'name', 'path']
+
+    def __init__(self, raw, name='', path=None):
+        self.raw = memoryview(raw).cast('B')
+        self.name = name
+        self.path = path  # set when backed by a mapped fork (for pickling)
+
+    def __len__(self):
+        return len(self.raw) >> 2
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        return _BE32.unpack_from(self.raw, index << 2)[0]
+
+    def __iter__(self):
+        for (val,) in _BE32.iter_unpack(self.raw):
+            yield val
+
+    def __reduce__(self):
+        # Workers reopen the mapping instead of receiving a copy
+        if self.path is not None:
+            return (_open_section, (self.path, self.name))
+        return (Section, (bytes(self.raw), self.name))
+
+    def entry(self, index):
+        """Return (letter_byte, eow, last, child) for one entry."""
+        val = _BE32.unpack_from(self.raw, index << 2)[0]
+        return val & 0xFF, (val >> 8) & 1, (val >> 9) & 1, val >> 10
+
+    def root(self, letter):
+        """Child group index for a root letter ('a'-'z'), 0 if absent."""
+        return self[1 + ord(letter) - ord('a')] >> 10
+
+    def to_array(self):
+        """Copy entries into a native-order array('I') for hot loops."""
+        arr = array('I')
+        if arr.itemsize != 4:
+            arr = array('L')
+        arr.frombytes(self.raw)
+        if sys.byteorder == 'little':
+            arr.byteswap()
+        return arr
+
+
+class MavenFork:
+    """A Maven data fork mapped read-only, with its S1 and S2 sections.
+
+    Use as a context manager, or call close() when done.  Sections must
+    not be used after the fork is closed.
+    """
+
+    def __init__(self, path=DAWG_PATH):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.buf = memoryview(self._map)
+
+        if len(self.buf) < HEADER_SIZE:
+            self.close()
+            raise ValueError(f"{path}: too short for a DAWG header")
+        self.boundary, self.s1_count, self.s2_count = _HEADER.unpack_from(self.buf, 0)
+
+        self.s1_base = HEADER_SIZE
+        self.s2_base = self.s1_base + self.s1_count * 4 + INDEX_DUP_SIZE
+        end = self.s2_base + self.s2_count * 4
+        if end > len(self.buf):
+            self.close()
+            raise ValueError(f"{path}: header counts s1={self.s1_count} "
+                             f"s2={self.s2_count} exceed file size {len(self.buf)}")
+
+        self.s1 = Section(self.buf[self.s1_base:self.s1_base + self.s1_count * 4],
+                          'S1', path)
+        self.s2 = Section(self.buf[self.s2_base:end], 'S2', path)
+
+    def section(self, name):
+        """Return section 'S1' or 'S2' (case-insensitive)."""
+        name = name.upper()
+        if name == 'S1':
+            return self.s1
+        if name == 'S2':
+            return self.s2
+        raise KeyError(name)
+
+    def index_duplicate(self, name):
+        """The 26-entry letter index copy stored after a section, as a list."""
+        sec = self.section(name)
+        base = (self.s1_base if sec is self.s1 else self.s2_base) + len(sec) * 4
+        return list(struct.unpack_from('>26I', self.buf, base))
+
+    def close(self):
+        for attr in ('s1', 's2'):
+            sec = self.__dict__.pop(attr, None)
+            if sec is not None:
+                sec.raw.release()
+        if getattr(self, 'buf', None) is not None:
+            self.buf.release()
+            self.buf = None
+        if getattr(self, '_map', None) is not None:
+            self._map.close()
+            self._map = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __reduce__(self):
+        return (MavenFork, (self.path,))
+
+
+# One mapping per path per process, shared by unpickled sections
+_open_forks = {}
+
+
+def open_fork(path=DAWG_PATH):
+    """Return a process-wide shared MavenFork for path."""
+    fork = _open_forks.get(path)
+    if fork is None:
+        fork = _open_forks[path] = MavenFork(path)
+    return fork
+
+
+def parse_section_spec(spec):
+    """Split a 'FORK[:S1|S2]' argument into (path, 'S1' or 'S2').
+
+    The section defaults to S2.
+    """
+    path, _, name = spec.rpartition(':')
+    if not path:
+        path, name = spec, 'S2'
+    return path, name.upper()
+
+
+def _open_section(path, name):
+    return open_fork(path).section(name)
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else DAWG_PATH
+    with MavenFork(path) as fork:
+        print(f"{path}: {len(fork.buf):,} bytes")
+        print(f"  Header: boundary={fork.boundary}, s1_count={fork.s1_count:,}, "
+              f"s2_count={fork.s2_count:,}")
+
+        for sec in (fork.s1, fork.s2):
+            dup = fork.index_duplicate(sec.name)
+            ok = all(dup[i] == sec[1 + i] for i in range(26))
+            print(f"\n  {sec.name}: {len(sec):,} entries, "
+                  f"letter index duplicate {'matches' if ok else 'DIFFERS'}")
+
+            t0 = time.perf_counter()
+            words = 0
+            max_child = 0
+            for val in sec:
+                words += (val >> 8) & 1
+                if val >> 10 > max_child:
+                    max_child = val >> 10
+            dt = time.perf_counter() - t0
+            print(f"    eow entries: {words:,}, max child: {max_child:,}")
+            print(f"    scanned in {dt*1000:.1f} ms "
+                  f"({len(sec) / dt / 1e6:.1f}M entries/s)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Streaming word enumeration and lookup over Maven DAWG entry arrays.
+
+Works on any entry sequence: a dawg_reader.Section, a list built by
+build_dawg, or an array.  Words come out of a generator in
+lexicographic order; the walker keeps only the current path (one entry
+index per letter), so memory is O(max word length) however large the
+section is.
+
+Section 1 stores words reversed, so S1 output is reversed words in
+lexicographic order of their reversal (use --reverse to print them
+forward).
+
+Usage:
+  python3 dawg_words.py [--fork maven2] [--section S2] [--prefix qu]
+                        [--min 2] [--max 8] [--after quail] [--reverse]
+"""
+
+import argparse
+import sys
+from array import array
+
+from dawg_reader import DAWG_PATH, MavenFork
+
+ROOT_GROUP = 1  # entries 1-26: root letter index
+
+
+def find_entry(entries, word):
+    """Entry index reached by spelling `word` from the root, or 0.
+
+    The returned entry's eow bit says whether `word` itself is a word;
+    its child field is the group of possible next letters.
+    """
+    n = len(entries)
+    idx = ROOT_GROUP
+    for pos, ch in enumerate(word):
+        if idx == 0 or idx >= n:
+            return 0
+        target = ord(ch)
+        while True:
+            val = entries[idx]
+            if val & 0xFF == target:
+                break
+            if val & 0x200 or idx + 1 >= n:
+                return 0
+            idx += 1
+        if pos == len(word) - 1:
+            return idx
+        idx = val >> 10
+    return 0
+
+
+def contains(entries, word):
+    """True if `word` is stored in the section."""
+    idx = find_entry(entries, word) if word else 0
+    return bool(idx and entries[idx] & 0x100)
+
+
+def _seek(entries, group, rest):
+    """Position a walk at the first word >= group-relative `rest`.
+
+    Returns (path, letters, pending, exact): path/letters are the entry
+    indexes and letters of the start position; pending means the top
+    entry has not been visited yet; exact means the top entry spells
+    `rest` itself.
+    """
+    n = len(entries)
+    path, letters = [], []
+    for d, ch in enumerate(rest):
+        target = ord(ch)
+        idx = group
+        while idx and idx < n:
+            val = entries[idx]
+            if (val & 0xFF) >= target:
+                break
+            if val & 0x200:
+                idx = 0
+                break
+            idx += 1
+        else:
+            idx = 0
+        if idx == 0 or idx >= n:
+            # Every word in this group sorts before rest: resume after parent
+            return path, letters, False, False
+        path.append(idx)
+        letters.append(chr(val & 0xFF))
+        if (val & 0xFF) > target:
+            return path, letters, True, False
+        if d == len(rest) - 1:
+            return path, letters, False, True
+        group = val >> 10
+        if group == 0:
+            return path, letters, False, False
+    return path, letters, True, False
+
+
+def iter_words(entries, prefix="", min_len=1, max_len=None, after=None):
+    """Yield the section's words in lexicographic order.
+
+    prefix:  only words starting with this prefix
+    min_len, max_len: inclusive word length bounds
+    after:   resume cursor -- only words strictly greater than this
+             (pass the last word received to continue an enumeration)
+    """
+    n = len(entries)
+    if max_len is not None and max_len < max(min_len, len(prefix)):
+        return
+
+    if after is not None and not after.startswith(prefix):
+        if after > prefix:
+            return  # every word with this prefix sorts before `after`
+        after = None
+
+    if prefix:
+        top = find_entry(entries, prefix)
+        if not top:
+            return
+        val = entries[top]
+        if val & 0x100 and len(prefix) >= min_len and after is None:
+            yield prefix
+        group = val >> 10
+        if not group or group >= n:
+            return
+    else:
+        group = ROOT_GROUP
+
+    if after is not None:
+        rest = after[len(prefix):]
+        if not rest:
+            after = None
+        else:
+            path, letters, pending, exact = _seek(entries, group, rest)
+            descend = exact
+
+    if after is None:
+        path, letters, pending, descend = [group], [''], True, True
+
+    yield from _walk(entries, path, letters, pending, descend, prefix, min_len, max_len)
+
+
+def iter_subtree(entries, group, prefix=""):
+    """Yield prefix + suffix for every word below sibling group `group`.
+
+    Words come out in lexicographic order; `prefix` is only prepended,
+    not looked up.
+    """
+    if not group or group >= len(entries):
+        return
+    yield from _walk(entries, [group], [''], True, True, prefix, 1, None)
+
+
+def _walk(entries, path, letters, pending, descend, prefix, min_len, max_len):
+    """Depth-first walk from a path position (see iter_words)."""
+    n = len(entries)
+    base = len(prefix)
+    while path:
+        top = path[-1]
+        val = entries[top]
+        if pending:
+            pending = False
+            ch = val & 0xFF
+            if not 0x61 <= ch <= 0x7A:
+                # Malformed entry or empty group: treat as end of group
+                path.pop()
+                letters.pop()
+                descend = False
+                continue
+            letters[-1] = chr(ch)
+            if val & 0x100:
+                length = base + len(letters)
+                if length >= min_len and (max_len is None or length <= max_len):
+                    yield prefix + ''.join(letters)
+            descend = True
+
+        if descend:
+            child = val >> 10
+            if child and child < n and (max_len is None or base + len(path) < max_len):
+                path.append(child)
+                letters.append('')
+                pending = True
+                continue
+
+        if not val & 0x200 and top + 1 < n:
+            path[-1] = top + 1
+            pending = True
+            descend = True
+            continue
+
+        path.pop()
+        letters.pop()
+        descend = False
+
+
+def structure_ids(entries, register):
+    """Canonical id for every sibling group (array indexed by group start).
+
+    Two groups, in this section or in any other section labelled with
+    the same `register`, get the same id exactly when they spell the
+    same set of suffixes.  Id 0 means "no group".
+    """
+    n = len(entries)
+    ids = array('i', bytes(4 * n))
+    stack = [ROOT_GROUP] if n > ROOT_GROUP else []
+    while stack:
+        g = stack[-1]
+        if ids[g]:
+            stack.pop()
+            continue
+        end = g
+        while end < n - 1 and not entries[end] & 0x200:
+            end += 1
+        pending = False
+        for i in range(g, end + 1):
+            child = entries[i] >> 10
+            if child and child < n and not ids[child]:
+                stack.append(child)
+                pending = True
+        if pending:
+            continue
+        stack.pop()
+        sig = []
+        for i in range(g, end + 1):
+            val = entries[i]
+            child = val >> 10
+            sig.append(val & 0x1FF)  # letter + eow
+            sig.append(ids[child] if child < n else 0)
+        ids[g] = register.setdefault(tuple(sig), len(register) + 1)
+    return ids
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Stream words from a Maven DAWG section")
+    parser.add_argument('--fork', default=DAWG_PATH,
+                        help='Maven data fork (default: %(default)s)')
+    parser.add_argument('--section', default='S2', choices=['S1', 'S2', 's1', 's2'],
+                        help='Section to enumerate (default: S2)')
+    parser.add_argument('--prefix', default='',
+                        help='Only words with this (stored-order) prefix')
+    parser.add_argument('--min', type=int, default=1, dest='min_len',
+                        help='Minimum word length')
+    parser.add_argument('--max', type=int, default=None, dest='max_len',
+                        help='Maximum word length')
+    parser.add_argument('--after', default=None,
+                        help='Resume after this (stored-order) word')
+    parser.add_argument('--reverse', action='store_true',
+                        help='Print each word reversed (for S1)')
+    args = parser.parse_args()
+
+    with MavenFork(args.fork) as fork:
+        section = fork.section(args.section)
+        out = sys.stdout
+        for word in iter_words(section, args.prefix.lower(), args.min_len,
+                               args.max_len, args.after and args.after.lower()):
+            out.write((word[::-1] if args.reverse else word) + '\n')
+        del section
+
+
+if __name__ == '__main__':
+    main()
@@ -34,6 +34,8 @@ import sys
 import os
 from collections import defaultdict
 
+from dawg_reader import map_file
+
 DEFAULT_DAWG_PATH = "/Volumes/T7/retrogames/oldmac/share/maven2"
 OUTPUT_DIR = "/Volumes/T7/retrogames/oldmac/maven_re/lexica"
 
@@ -56,16 +58,15 @@ class DAWGExtractor:
     """Extract words from Maven's DAWG dictionary."""
 
     def __init__(self, filepath, node_start, letter_index_offset, max_entries=None):
-        with open(filepath, 'rb') as f:
-            self.data = f.read()
+        # Read-only mapping: extractors for DAWG1 and DAWG2 share one copy
+        self.data = map_file(filepath)
 
         self.node_start = node_start
         self.letter_index_offset = letter_index_offset
 
         # Parse header to get section boundaries
         header_offset = node_start - 0x410
-        self.section1_end = struct.unpack('>I', self.data[header_offset:header_offset+4])[0]
-        self.section2_end = struct.unpack('>I', self.data[header_offset+4:header_offset+8])[0]
+        self.section1_end, self.section2_end = struct.unpack_from('>II', self.data, header_offset)
 
         if max_entries:
             self.section1_end = min(self.section1_end, max_entries)
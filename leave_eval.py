@@ -16,6 +16,8 @@ import os
 import struct
 import readline  # for history/editing in REPL
 
+from leave_patterns import compile_patterns
+
 RESOURCES_DIR = "/Volumes/T7/retrogames/oldmac/maven_re/resources"
 
 # MUL record format (28 bytes):
@@ -429,6 +431,20 @@ def show_patterns():
     print()
 
 
+def show_leave_patterns(leaves):
+    """Show which ESTR patterns each leave contains (as a multiset)."""
+    patterns = parse_estr_patterns()
+    if not patterns:
+        print("Could not load ESTR patterns")
+        return
+
+    matrix = compile_patterns(patterns)
+    print()
+    for leave, found in zip(leaves, matrix.match_many([lv.upper() for lv in leaves])):
+        print(f"{leave.upper():<8} {len(found):>3} patterns: {', '.join(found) or '-'}")
+    print()
+
+
 def show_raw_mul(tile, mul_data):
     """Show raw MUL record data for a tile."""
     tile = tile.upper()
@@ -463,6 +479,7 @@ def repl(mul_data, vcb_data=None):
     print("  raw X         Show raw MUL record for tile X")
     print("  vcb           Show VCB vowel count adjustments")
     print("  patterns      Show ESTR synergy patterns")
+    print("  patterns L..  Show ESTR patterns contained in leaves")
     print("  help          Show this help")
     print("  /q            Exit")
     print("\nUse ? for blank tiles. Single letters like Q are evaluated as leaves.")
@@ -500,6 +517,7 @@ def repl(mul_data, vcb_data=None):
             print("  raw X         Show raw MUL record for tile X")
             print("  vcb           Show VCB vowel count adjustments")
             print("  patterns      Show ESTR synergy patterns")
+            print("  patterns L..  Show ESTR patterns contained in leaves")
             print("  /q            Exit")
             print()
         elif cmd == 'table' and len(parts) == 1:
@@ -510,6 +528,8 @@ def repl(mul_data, vcb_data=None):
             show_vcb_data(vcb_data)
         elif cmd == 'patterns' and len(parts) == 1:
             show_patterns()
+        elif cmd == 'patterns' and len(parts) > 1:
+            show_leave_patterns(parts[1:])
         elif cmd == 'cmp' and len(parts) > 1:
             compare_leaves(parts[1:], mul_data, vcb_data)
         elif cmd == 'detail' and len(parts) > 1:
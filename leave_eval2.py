@@ -23,21 +23,34 @@ Maven's SANE 80-bit floating-point implementation.
 Usage:
     python3 leave_eval2.py [OPTIONS]
     python3 leave_eval2.py --rack QRSTUVW --leave QUV
+    python3 leave_eval2.py --rack QRSTUVW --build-table leaves.tbl
+    python3 leave_eval2.py --rack QRSTUVW --table leaves.tbl --cmp QU UV
 
 Options:
     --rack TILES    Full player rack (for accurate unseen counts)
     --bag TILES     Override bag contents (default: full 100-tile bag)
     --leave TILES   Evaluate this leave and exit (non-interactive)
+    --build-table PATH  Precompute all 0-6 tile leaves for this state
+    --table PATH    Look leaves up in a precomputed table (mmap)
+    --bench N       Time evaluate_leave on N random leaves
 
 In interactive mode, enter leaves like: AEINST, Q, SATIRE?, etc.
 Use ? for blank tiles.
 """
 
+import hashlib
+import itertools
+import mmap
 import os
 import struct
 import sys
 import math
-from collections import Counter
+import time
+from collections import Counter, OrderedDict
+
+import numpy as np
+
+from leave_patterns import compile_patterns
 
 RESOURCES_DIR = "/Volumes/T7/retrogames/oldmac/maven_re/resources"
 
@@ -165,22 +178,14 @@ def find_matching_patterns(leave_counts, patterns):
 
     Parameters:
         leave_counts: Counter of leave tiles (uppercase, '?' for blanks)
-        patterns: list of ESTR pattern strings (lowercase, '?' for blanks)
+        patterns: list of ESTR pattern strings (lowercase, '?' for blanks),
+            or a leave_patterns.PatternMatrix compiled from one
 
-    Returns: list of matching pattern strings
+    Returns: list of matching pattern strings, in pattern-list order
     """
-    # Convert leave to lowercase Counter for matching
-    leave_lower = Counter()
-    for tile, cnt in leave_counts.items():
-        leave_lower[tile.lower() if tile != '?' else '?'] += cnt
-
-    matching = []
-    for pattern in patterns:
-        pat_counts = Counter(pattern)
-        # Check if pattern is a multiset subset of the leave
-        if all(leave_lower[ch] >= cnt for ch, cnt in pat_counts.items()):
-            matching.append(pattern)
-    return matching
+    # The list is compiled once into a count matrix (leave_patterns) and
+    # cached, so each leave is a single vectorized subset test
+    return compile_patterns(patterns).matches(leave_counts)
 
 
 def tile_string_helper(pattern, unseen, mul_data, expr_values):
@@ -220,19 +225,32 @@ def tile_string_helper(pattern, unseen, mul_data, expr_values):
 # ─── Binomial Coefficients ──────────────────────────────────────────
 
 # Maven builds a Pascal's triangle table: 101 entries × 8 slots
-# entry[n][k] = C(n, k) for k = 0..7
-# We use Python's math.comb which is exact for integers.
+# entry[n][k] = C(n, k) for k = 0..7.  We do the same, as exact ints
+# (PASCAL) and as float64 (PASCAL_F, for the vectorized V/C tables).
+# Every product of two entries used here is below 2**53, so the float
+# table gives the same results as exact arithmetic.
+
+PASCAL_N = 100
+PASCAL_K = 7
+
+PASCAL = [[math.comb(n, k) for k in range(PASCAL_K + 1)]
+          for n in range(PASCAL_N + 1)]
+PASCAL_F = np.array(PASCAL, dtype=np.float64)
+
 
 def binom(n, k):
     """Binomial coefficient C(n, k). Returns 0 if k < 0 or k > n."""
     if k < 0 or k > n:
         return 0
+    if n <= PASCAL_N and k <= PASCAL_K:
+        return PASCAL[n][k]
     return math.comb(n, k)
 
 
 # ─── Per-Tile Binomial Leave (CODE 32, 0x1406) ─────────────────────
 
-def binomial_tile_leave(tile, tile_count_in_bag, unseen_count, mul_records):
+def binomial_tile_leave(tile, tile_count_in_bag, unseen_count, mul_records,
+                        comb=binom):
     """Compute binomial-weighted leave value for one tile type.
 
     This reimplements Maven's function at CODE 32 offset 0x1406.
@@ -242,6 +260,7 @@ def binomial_tile_leave(tile, tile_count_in_bag, unseen_count, mul_records):
         tile_count_in_bag: total count of this tile in distribution
         unseen_count: total unseen tiles (bag + opponent rack)
         mul_records: list of int32 leave adjustments from MUL resource
+        comb: binomial coefficient function (default: binom)
 
     Returns: leave value in centipoints (integer)
 
@@ -272,7 +291,7 @@ def binomial_tile_leave(tile, tile_count_in_bag, unseen_count, mul_records):
         if k > unseen_count:
             break
         # Weight = C(unseen, k) × C(rest, max_k - k)
-        w = binom(unseen_count, k) * binom(rest, max_k - k)
+        w = comb(unseen_count, k) * comb(rest, max_k - k)
         if w == 0:
             continue
         weight_sum += w
@@ -418,6 +437,140 @@ def blank_dispatcher(vowel, consonant, blank_count, unseen_vowels,
                                unseen_consonants, total, mul_data, cache)
 
 
+# ─── Precomputed V/C Tables ────────────────────────────────────────
+
+# blank_dispatcher depends on the game only through the unseen vowel and
+# consonant counts.  For one such state its whole domain for patterns of
+# at most 7 tiles (V + C + ? <= 7, ? <= 2, draw <= 7) is 8 × 8 × 3 × 8
+# values, computed at once with the Pascal table and kept in a
+# process-wide LRU keyed by (unseen_vowels, unseen_consonants).  The
+# channel-b lookup is then vc_dispatch_table(uv, uc)[v, c, ?, draw].
+
+VC_MAX_TILES = 7
+VC_MAX_BLANKS = 2
+VC_TABLE_STATES = 256  # unseen states kept (~12 KB each)
+
+_VC_TABLES = OrderedDict()
+
+# core_vc_calculator's penalty for a rack of rack_v vowels out of rack_t
+_VC_PENALTY = np.zeros((VC_MAX_TILES + 1, VC_MAX_TILES + 1), dtype=np.float64)
+for _rt in range(1, VC_MAX_TILES + 1):
+    for _rv in range(_rt + 1):
+        _VC_PENALTY[_rv, _rt] = (_rv / _rt - 0.40) ** 2 * 17000
+
+
+def _vc_draw_penalties():
+    """Penalty of drawing v_draw vowels, as pen[v_draw, v, c, d].
+
+    Returns (pen, valid): pen is zero where the cell is outside the
+    domain (valid: v + c + d <= 7 and d > 0) or v_draw > d, which the
+    scalar loop never visits.
+    """
+    n = VC_MAX_TILES + 1
+    v, c, d = np.ogrid[:n, :n, :n]
+    valid = (v + c + d <= VC_MAX_TILES) & (d > 0)
+    pen = np.zeros((n, n, n, n), dtype=np.float64)
+    for v_draw in range(n):
+        rack_v = np.minimum(v + v_draw, VC_MAX_TILES)
+        rack_t = np.where(valid, v + c + d, 0)
+        pen[v_draw] = np.where(valid & (v_draw <= d), _VC_PENALTY[rack_v, rack_t], 0.0)
+    return pen, valid
+
+
+_VC_DRAW_PENALTY, _VC_VALID = _vc_draw_penalties()
+
+
+def _vc_core_grid(unseen_vowels, unseen_consonants):
+    """core_vc_calculator(v, c, uv, uc, v + c + d) as grid[v, c, d]."""
+    n = VC_MAX_TILES + 1
+    # weights[d, v_draw] = C(uv, v_draw) × C(uc, d - v_draw)
+    d, v_draw = np.ogrid[:n, :n]
+    c_draw = d - v_draw
+    weights = np.where(c_draw >= 0,
+                       PASCAL_F[unseen_vowels, v_draw]
+                       * PASCAL_F[unseen_consonants, np.clip(c_draw, 0, PASCAL_K)], 0.0)
+    # Accumulate over vowels drawn in the scalar loop's order so the
+    # float sums round identically
+    total_value = np.zeros((n, n, n), dtype=np.float64)
+    total_weight = np.zeros(n, dtype=np.float64)
+    for k in range(n):
+        total_value += weights[:, k] * _VC_DRAW_PENALTY[k]
+        total_weight += weights[:, k]
+    weight = np.broadcast_to(total_weight, total_value.shape)
+    ok = _VC_VALID & (weight != 0)
+    grid = np.zeros((n, n, n), dtype=np.int64)
+    grid[ok] = np.trunc(total_value[ok] / weight[ok]).astype(np.int64)
+    return grid
+
+
+def _vc_relative(grid):
+    """cached_vc_leave(v, c, uv, uc, t) as rel[v, c, t] from a core grid.
+
+    Padded with zeros to VC_MAX_TILES + VC_MAX_BLANKS + 1 in v and c so
+    blank assignments can index past the pattern's own tiles.
+    """
+    n = VC_MAX_TILES + 1
+    size = n + VC_MAX_BLANKS
+    v, c, t = np.ogrid[:size, :size, :n]
+    inside = (v + c <= VC_MAX_TILES) & (v + c > 0)
+    d = np.clip(np.minimum(t, VC_MAX_TILES - v - c), 0, VC_MAX_TILES)
+    vi, ci = np.minimum(v, VC_MAX_TILES), np.minimum(c, VC_MAX_TILES)
+    total = np.minimum(v + c + d, VC_MAX_TILES)
+    return np.where(inside, grid[vi, ci, d] - grid[0, 0, total], 0)
+
+
+def vc_dispatch_table(unseen_vowels, unseen_consonants, mul_data=None):
+    """blank_dispatcher over its whole domain for one unseen state.
+
+    Returns an int64 array table[v, c, b, t] equal to
+    blank_dispatcher(v, c, b, unseen_vowels, unseen_consonants, t, ...)
+    for v + c + b <= VC_MAX_TILES, b <= VC_MAX_BLANKS, t <= VC_MAX_TILES
+    (other cells are 0).  Tables are memoized process-wide, least
+    recently used first out.
+    """
+    key = (unseen_vowels, unseen_consonants)
+    table = _VC_TABLES.get(key)
+    if table is not None:
+        _VC_TABLES.move_to_end(key)
+        return table
+
+    n = VC_MAX_TILES + 1
+    table = np.zeros((n, n, VC_MAX_BLANKS + 1, n), dtype=np.int64)
+    if 0 <= unseen_vowels <= PASCAL_N and 0 <= unseen_consonants <= PASCAL_N:
+        rel = _vc_relative(_vc_core_grid(unseen_vowels, unseen_consonants))
+        v, c = np.ogrid[:n, :n]
+        room = (VC_MAX_TILES - v - c)[..., None]
+        table[:, :, 0] = np.where(room >= 0, rel[:n, :n], 0)
+        table[:, :, 1] = np.where(room >= 1, (rel[:n, 1:n + 1] + rel[1:n + 1, :n]) // 2, 0)
+        table[:, :, 2] = np.where(room >= 2, np.maximum(np.maximum(
+            rel[:n, 2:n + 2], rel[1:n + 1, 1:n + 1]), rel[2:n + 2, :n]), 0)
+    else:
+        # Past the Pascal table (custom bags only): fill it cell by cell
+        cache = {}
+        for v in range(n):
+            for c in range(n - v):
+                for b in range(min(VC_MAX_BLANKS, VC_MAX_TILES - v - c) + 1):
+                    for t in range(n):
+                        table[v, c, b, t] = blank_dispatcher(
+                            v, c, b, unseen_vowels, unseen_consonants, t, mul_data, cache)
+
+    _VC_TABLES[key] = table
+    if len(_VC_TABLES) > VC_TABLE_STATES:
+        _VC_TABLES.popitem(last=False)
+    return table
+
+
+def vc_lookup(vowel, consonant, blank_count, unseen_vowels, unseen_consonants,
+              total, mul_data, cache):
+    """blank_dispatcher, answered from vc_dispatch_table when in range."""
+    if (blank_count <= VC_MAX_BLANKS and total <= VC_MAX_TILES
+            and vowel + consonant + blank_count <= VC_MAX_TILES):
+        table = vc_dispatch_table(unseen_vowels, unseen_consonants, mul_data)
+        return int(table[vowel, consonant, blank_count, total])
+    return blank_dispatcher(vowel, consonant, blank_count, unseen_vowels,
+                            unseen_consonants, total, mul_data, cache)
+
+
 # ─── Main Leave Evaluator ──────────────────────────────────────────
 
 def compute_unseen(bag_contents, rack=None, board_tiles=None):
@@ -443,6 +596,51 @@ def compute_unseen(bag_contents, rack=None, board_tiles=None):
     return unseen
 
 
+def score_pattern(pattern, unseen, unseen_vowels, unseen_consonants,
+                  mul_data, expr_values, vc_cache):
+    """Score one matching pattern (leave_orchestrator 0x09D8 loop body).
+
+    Returns (helper_val, vc, is_q_no_u), or None when the
+    tile_string_helper gate (0x1648) skips the pattern.  The pattern adds
+    helper_val to the EXPR synergy if it is multi-letter, and vc to the
+    V/C balance.
+    """
+    # tile_string_helper gate (0x1648)
+    helper_val = tile_string_helper(pattern, unseen, mul_data,
+                                    expr_values or {})
+    if helper_val == 0:
+        return None
+
+    # Q-without-U check (0x0B1E-0x0B62): OVERWRITES helper_val
+    is_q_no_u = False
+    if 'q' in pattern and 'u' not in pattern:
+        # Maven: penalty = (counter - unseen) / unseen, clamped -100
+        # At game start, counter ≈ unseen → penalty ≈ 0
+        helper_val = 0
+        is_q_no_u = True
+
+    # Channel a: EXPR synergy (stored in work buffer via 0x18E4)
+    # Only multi-letter EXPR values count as synergy, since single-letter
+    # EXPR values overlap with Component 1 MUL per-tile values.
+    # (In Maven, both channels go to separate buffers combined by CODE 35;
+    # this approximation avoids double-counting until CODE 35 is decoded.)
+
+    # Classify pattern V/C for channel b
+    pat_v = sum(1 for ch in pattern if ch in 'aeiou')
+    pat_c = sum(1 for ch in pattern
+                if ch.isalpha() and ch not in 'aeiou')
+    pat_b = pattern.count('?')
+
+    # draw_count = 7 - pattern_length (per-pattern, not per-leave)
+    draw = max(0, 7 - len(pattern))
+
+    # Channel b: V/C balance (blank_dispatcher 0x0CC0)
+    vc = vc_lookup(pat_v, pat_c, pat_b,
+                   unseen_vowels, unseen_consonants,
+                   draw, mul_data, vc_cache)
+    return helper_val, vc, is_q_no_u
+
+
 def evaluate_leave(leave_str, mul_data, bag=None, rack=None,
                    board_tiles=None, verbose=True, estr_patterns=None,
                    expr_values=None):
@@ -549,43 +747,15 @@ def evaluate_leave(leave_str, mul_data, bag=None, rack=None,
         matching = find_matching_patterns(leave_counts, pattern_set)
 
         for pattern in matching:
-            # tile_string_helper gate (0x1648)
-            helper_val = tile_string_helper(pattern, unseen, mul_data,
-                                            expr_values or {})
-            if helper_val == 0:
+            scored = score_pattern(pattern, unseen, unseen_vowels,
+                                   unseen_consonants, mul_data, expr_values,
+                                   vc_cache)
+            if scored is None:
                 continue
-
-            # Q-without-U check (0x0B1E-0x0B62): OVERWRITES helper_val
-            is_q_no_u = False
-            if 'q' in pattern and 'u' not in pattern:
-                # Maven: penalty = (counter - unseen) / unseen, clamped -100
-                # At game start, counter ≈ unseen → penalty ≈ 0
-                helper_val = 0
-                is_q_no_u = True
-
-            # Channel a: EXPR synergy (stored in work buffer via 0x18E4)
-            # Only add multi-letter EXPR values as synergy, since single-letter
-            # EXPR values overlap with Component 1 MUL per-tile values.
-            # (In Maven, both channels go to separate buffers combined by CODE 35;
-            # this approximation avoids double-counting until CODE 35 is decoded.)
+            helper_val, vc, is_q_no_u = scored
             if len(pattern) > 1:
                 synergy_total += helper_val
-
-            # Classify pattern V/C for channel b
-            pat_v = sum(1 for ch in pattern if ch in 'aeiou')
-            pat_c = sum(1 for ch in pattern
-                        if ch.isalpha() and ch not in 'aeiou')
-            pat_b = pattern.count('?')
-
-            # draw_count = 7 - pattern_length (per-pattern, not per-leave)
-            draw = max(0, 7 - len(pattern))
-
-            # Channel b: V/C balance (blank_dispatcher 0x0CC0)
-            vc = blank_dispatcher(pat_v, pat_c, pat_b,
-                                  unseen_vowels, unseen_consonants,
-                                  draw, mul_data, vc_cache)
             vc_total += vc
-
             active_patterns.append((pattern, helper_val, vc, is_q_no_u))
 
     # Combine: MUL per-tile + EXPR synergies - V/C penalties
@@ -656,15 +826,173 @@ def evaluate_leave(leave_str, mul_data, bag=None, rack=None,
     return total, tile_values
 
 
+# ─── Batch Leave Evaluation ────────────────────────────────────────
+
+# With the unseen tiles fixed, every term of evaluate_leave except the
+# leave's own tile counts is a constant: the MUL value of k copies of
+# each tile, and each pattern's net score (EXPR synergy minus V/C
+# balance, 0 when tile_string_helper skips it).  LeaveBatch computes
+# those once; a leave is then
+#   sum_t rel[t, count_t] + sum of score[p] over the patterns it holds
+# with the patterns found through PatternMatrix.match_bits and the
+# scores summed a byte (8 patterns) at a time from lookup tables.
+
+BATCH_CHUNK = 65536  # leaves per vectorized pass
+
+# Column order of the (N, 27) tile-count arrays
+TILE_ORDER = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ?'
+_TILE_COLUMN = np.full(128, -1, dtype=np.int64)
+for _t, _tile in enumerate(TILE_ORDER):
+    _TILE_COLUMN[ord(_tile)] = _t
+
+
+def leave_count_matrix(leaves):
+    """(N, 27) tile counts in TILE_ORDER for leave strings.
+
+    Parsed like evaluate_leave: case-insensitive, '?' is a blank and
+    other characters are ignored.
+    """
+    leaves = [leave.upper() for leave in leaves]
+    lengths = np.fromiter(map(len, leaves), dtype=np.int64, count=len(leaves))
+    codes = np.frombuffer(''.join(leaves).encode('utf-32-le'), dtype='<u4')
+    rows = np.repeat(np.arange(len(leaves)), lengths)
+    cols = np.where(codes < 128, _TILE_COLUMN[np.minimum(codes, 127)], -1)
+    keep = cols >= 0
+    flat = np.bincount(rows[keep] * len(TILE_ORDER) + cols[keep],
+                       minlength=len(leaves) * len(TILE_ORDER))
+    return flat.reshape(len(leaves), len(TILE_ORDER))
+
+
+class LeaveBatch:
+    """Evaluates many leaves against one unseen state.
+
+    unseen: Counter of unseen tiles, as evaluate_leave computes it.
+    values() returns exactly what evaluate_leave would for each leave
+    with that unseen state.
+    """
+
+    def __init__(self, unseen, mul_data, bag=None, estr_patterns=None,
+                 expr_values=None):
+        self.unseen = Counter(unseen)
+        self.mul_data = mul_data
+        self.bag = Counter(STANDARD_BAG) if bag is None else bag
+        self._rel = np.zeros((len(TILE_ORDER), 0), dtype=np.int64)
+
+        unseen_vowels = sum(self.unseen.get(v, 0) for v in VOWELS)
+        unseen_consonants = sum(self.unseen.get(c, 0) for c in self.unseen
+                                if c not in VOWELS and c != '?')
+        pattern_set = list(expr_values.keys()) if expr_values else (estr_patterns or [])
+        self.matrix = compile_patterns(pattern_set)
+
+        vc_cache = {}
+        self.scores = np.zeros(len(self.matrix), dtype=np.int64)
+        for p, pattern in enumerate(self.matrix.patterns):
+            scored = score_pattern(pattern, self.unseen, unseen_vowels,
+                                   unseen_consonants, mul_data, expr_values,
+                                   vc_cache)
+            if scored is not None:
+                helper_val, vc, _ = scored
+                self.scores[p] = (helper_val if len(pattern) > 1 else 0) - vc
+
+        # byte_scores[j, byte]: summed scores of patterns 8j..8j+7 set in byte
+        n_bytes = self.matrix.bitsets().shape[-1] * 8
+        scores = np.zeros(n_bytes * 8, dtype=np.int64)
+        scores[:len(self.scores)] = self.scores
+        bits = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1,
+                             bitorder='little').astype(np.int64)
+        self.byte_scores = (scores.reshape(n_bytes, 8) @ bits.T)
+
+    def tile_values(self, max_count):
+        """rel[t, k]: Component 1 value of k copies of tile t."""
+        if self._rel.shape[1] <= max_count:
+            rel = np.zeros((len(TILE_ORDER), max_count + 1), dtype=np.int64)
+            for t, tile in enumerate(TILE_ORDER):
+                records = self.mul_data.get(tile)
+                if records is None:
+                    continue
+                for k in range(1, max_count + 1):
+                    if k < len(records):
+                        rel[t, k] = records[k] - records[0]
+                    else:
+                        rel[t, k] = binomial_tile_leave(
+                            tile, self.bag.get(tile, 0), self.unseen[tile], records) * k
+            self._rel = rel
+        return self._rel
+
+    def values_from_counts(self, counts):
+        """Leave values for an (N, 27) count array in TILE_ORDER."""
+        counts = np.asarray(counts, dtype=np.int64)
+        out = np.zeros(len(counts), dtype=np.int64)
+        if not len(counts):
+            return out
+        rel = self.tile_values(int(counts.max()))
+        byte_index = np.arange(self.byte_scores.shape[0])
+        for lo in range(0, len(counts), BATCH_CHUNK):
+            chunk = counts[lo:lo + BATCH_CHUNK]
+            matched = self.matrix.match_bits(chunk).view(np.uint8)
+            total = self.byte_scores[byte_index, matched].sum(axis=1)
+            for t, column in enumerate(chunk.T):
+                if column.any():
+                    total += rel[t].take(column)
+            out[lo:lo + BATCH_CHUNK] = total
+        return out
+
+    def values(self, leaves):
+        """Leave values (int64 array) for a sequence of leave strings."""
+        out = np.zeros(len(leaves), dtype=np.int64)
+        for lo in range(0, len(leaves), BATCH_CHUNK):
+            out[lo:lo + BATCH_CHUNK] = self.values_from_counts(
+                leave_count_matrix(leaves[lo:lo + BATCH_CHUNK]))
+        return out
+
+
+def evaluate_leaves(leaves, mul_data, bag=None, rack=None, board_tiles=None,
+                    estr_patterns=None, expr_values=None):
+    """evaluate_leave's totals for many leaves, as a list of ints.
+
+    With a rack every leave shares one unseen state and a single
+    LeaveBatch scores them all.  Without one, evaluate_leave removes each
+    leave from the unseen tiles, so leaves are grouped by the state they
+    produce; leaves alone in their state go through evaluate_leave.
+    """
+    if bag is None:
+        bag = Counter(STANDARD_BAG)
+    leaves = list(leaves)
+    base = compute_unseen(bag, rack, board_tiles)
+    if rack is not None:
+        batch = LeaveBatch(base, mul_data, bag, estr_patterns, expr_values)
+        return batch.values(leaves).tolist()
+
+    groups = {}
+    for i, row in enumerate(leave_count_matrix(leaves)):
+        unseen = Counter(base)
+        for t in np.flatnonzero(row):
+            tile = TILE_ORDER[t]
+            if unseen[tile] > 0:
+                unseen[tile] = max(0, unseen[tile] - int(row[t]))
+        groups.setdefault(tuple(sorted(unseen.items())), []).append(i)
+
+    results = [0] * len(leaves)
+    for state, idx in groups.items():
+        if len(idx) == 1:
+            i = idx[0]
+            results[i], _ = evaluate_leave(
+                leaves[i], mul_data, bag, rack, board_tiles, verbose=False,
+                estr_patterns=estr_patterns, expr_values=expr_values)
+            continue
+        batch = LeaveBatch(Counter(dict(state)), mul_data, bag, estr_patterns,
+                           expr_values)
+        for i, val in zip(idx, batch.values([leaves[i] for i in idx]).tolist()):
+            results[i] = val
+    return results
+
+
 def compare_leaves(leaves, mul_data, bag=None, rack=None, board_tiles=None,
                    estr_patterns=None, expr_values=None):
     """Compare multiple leaves, sorted best to worst."""
-    results = []
-    for leave in leaves:
-        total, _ = evaluate_leave(leave, mul_data, bag, rack, board_tiles,
-                                  verbose=False, estr_patterns=estr_patterns,
-                                  expr_values=expr_values)
-        results.append((leave.upper(), total))
+    totals = evaluate_leaves(leaves, mul_data, bag, rack, board_tiles,
+                             estr_patterns, expr_values)
+    results = [(leave.upper(), total) for leave, total in zip(leaves, totals)]
 
     results.sort(key=lambda x: -x[1])
 
@@ -770,16 +1098,13 @@ def top_leaves(rack_str, mul_data, bag=None, rack_for_unseen=None,
 
     subsets = unique_subsets(rack_tiles)
 
+    # Every subset shares the rack's unseen state: one batch
+    totals = evaluate_leaves([''.join(subset) for subset in subsets], mul_data,
+                             bag, rack_for_unseen or rack_str.upper(),
+                             board_tiles, estr_patterns, expr_values)
     results = []
-    for subset in subsets:
-        leave_str = ''.join(subset)
-        if not leave_str:
-            leave_str = '-'  # empty leave
-        total, _ = evaluate_leave(
-            leave_str if leave_str != '-' else '',
-            mul_data, bag, rack_for_unseen or rack_str.upper(),
-            board_tiles, verbose=False,
-            estr_patterns=estr_patterns, expr_values=expr_values)
+    for subset, total in zip(subsets, totals):
+        leave_str = ''.join(subset) or '-'  # '-' for the empty leave
         played = len(rack_tiles) - len(subset)
         results.append((leave_str, total, played, len(subset)))
 
@@ -797,6 +1122,220 @@ def top_leaves(rack_str, mul_data, bag=None, rack_for_unseen=None,
     print()
 
 
+# ─── Benchmark ─────────────────────────────────────────────────────
+
+def benchmark(mul_data, bag=None, rack=None, board_tiles=None,
+              estr_patterns=None, expr_values=None, n=2000):
+    """Time binomials, evaluate_leave, batch evaluation and V/C tables.
+
+    Compares math.comb against the Pascal table (in binomial_tile_leave,
+    the scalar code that uses it), evaluate_leave against
+    evaluate_leaves, and blank_dispatcher against vc_dispatch_table,
+    checking the results are equal.  Each timed evaluation starts with
+    empty V/C tables.
+    """
+    import random
+
+    if bag is None:
+        bag = Counter(STANDARD_BAG)
+    rng = random.Random(1)
+    tiles = [t for t, c in bag.items() for _ in range(c)]
+    leaves = [''.join(rng.sample(tiles, rng.randint(1, 6))) for _ in range(n)]
+
+    states = []
+    for _ in range(200):
+        unseen = [rng.randint(0, bag.get(t, 0)) for t in TILE_ORDER]
+        states.append(([bag.get(t, 0) for t in TILE_ORDER], unseen))
+
+    def comb_binom(n, k):
+        if k < 0 or k > n:
+            return 0
+        return math.comb(n, k)
+
+    def scalar_weights(comb):
+        return [[binomial_tile_leave(t, counts[i], unseen[i], mul_data.get(t, []), comb)
+                 for i, t in enumerate(TILE_ORDER)] for counts, unseen in states]
+
+    t0 = time.perf_counter()
+    ref = scalar_weights(comb_binom)
+    t1 = time.perf_counter()
+    scalar = scalar_weights(binom)
+    t2 = time.perf_counter()
+    print(f"\nbinomial_tile_leave for all {len(TILE_ORDER)} tiles ({len(states)} unseen states):")
+    print(f"  math.comb:    {(t1 - t0) / len(states) * 1e6:8.1f} us/state")
+    print(f"  Pascal table: {(t2 - t1) / len(states) * 1e6:8.1f} us/state  "
+          f"({(t1 - t0) / (t2 - t1):.2f}x, {'identical' if ref == scalar else 'DIFFERENT'})")
+
+    # The batch needs one shared unseen state: without a rack, use the
+    # state evaluate_leave gets for rack='' (nothing removed)
+    state_rack = rack if rack is not None else ''
+    _VC_TABLES.clear()
+    t0 = time.perf_counter()
+    each = [evaluate_leave(leave, mul_data, bag, state_rack, board_tiles,
+                           verbose=False, estr_patterns=estr_patterns,
+                           expr_values=expr_values)[0] for leave in leaves]
+    t1 = time.perf_counter()
+    _VC_TABLES.clear()
+    batch_vals = evaluate_leaves(leaves, mul_data, bag, state_rack, board_tiles,
+                                 estr_patterns, expr_values)
+    t2 = time.perf_counter()
+    print(f"\nevaluate_leave over {n:,} random leaves: {(t1 - t0) / n * 1e6:8.1f} us/leave")
+    print(f"  evaluate_leaves (one state): {n / (t2 - t1) / 1000:8.1f} leaves/ms "
+          f"vs {n / (t1 - t0) / 1000:.1f} one at a time  "
+          f"({'identical' if batch_vals == each else 'DIFFERENT'})")
+
+    n_vc = 100
+    vc_states = [(rng.randint(0, 44), rng.randint(0, 56)) for _ in range(n_vc)]
+    cells = [(v, c, b, t) for v in range(VC_MAX_TILES + 1)
+             for c in range(VC_MAX_TILES + 1 - v)
+             for b in range(min(VC_MAX_BLANKS, VC_MAX_TILES - v - c) + 1)
+             for t in range(VC_MAX_TILES + 1)]
+    t0 = time.perf_counter()
+    vc_scalar = []
+    for uv, uc in vc_states:
+        cache = {}
+        vc_scalar.append([blank_dispatcher(v, c, b, uv, uc, t, mul_data, cache)
+                          for v, c, b, t in cells])
+    t1 = time.perf_counter()
+    _VC_TABLES.clear()
+    vc_tables = [vc_dispatch_table(uv, uc) for uv, uc in vc_states]
+    t2 = time.perf_counter()
+    vc_vector = [[int(table[cell]) for cell in cells] for table in vc_tables]
+    print(f"\nV/C dispatch over all {len(cells)} cells ({n_vc} unseen states):")
+    print(f"  scalar calls: {(t1 - t0) / n_vc * 1e6:8.1f} us/state")
+    print(f"  table build:  {(t2 - t1) / n_vc * 1e6:8.1f} us/state  "
+          f"({'identical' if vc_scalar == vc_vector else 'DIFFERENT'})")
+    return ref == scalar and batch_vals == each and vc_scalar == vc_vector
+
+
+# ─── Precomputed Leave Table ───────────────────────────────────────
+
+# Every leave of 0-6 tiles, for one game state, stored as an int32
+# array indexed by a perfect hash of the leave multiset.  Tiles are
+# numbered A=0 .. Z=25, ?=26; a k-tile leave with sorted tile numbers
+# t0 <= t1 <= ... is ranked in the combinatorial number system with
+# repetition, sum C(t_j + j, j + 1), after the C(26 + m, m) leaves of
+# every smaller size m.  All 1,107,568 multisets get a slot (4.4 MB);
+# leaves the bag cannot hold are stored as LEAVE_MISSING.
+#
+# Table file (little-endian):
+#   [48-byte header: magic 'LVTB', version u16, max leave u16,
+#                    slot count u32, reserved u32, state sha256 (32)]
+#   [value: int32 × slot count]
+
+LEAVE_TILES = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ?'
+MAX_TABLE_LEAVE = 6
+LEAVE_MISSING = -0x80000000
+
+TABLE_MAGIC = b'LVTB'
+TABLE_VERSION = 1
+_TABLE_HEADER = struct.Struct('<4sHHII32s')
+
+_TILE_NUMBER = {t: i for i, t in enumerate(LEAVE_TILES)}
+_SIZE_OFFSET = [0]
+for _m in range(MAX_TABLE_LEAVE + 1):
+    _SIZE_OFFSET.append(_SIZE_OFFSET[-1] + math.comb(len(LEAVE_TILES) - 1 + _m, _m))
+TABLE_SLOTS = _SIZE_OFFSET[-1]
+
+
+def leave_index(leave):
+    """Perfect-hash slot of a leave string (e.g. 'AEI?'), or -1 if > 6 tiles.
+
+    Raises ValueError if the leave has characters other than A-Z and '?'.
+    """
+    try:
+        nums = sorted(_TILE_NUMBER[c] for c in leave.upper())
+    except KeyError:
+        raise ValueError(f"invalid leave {leave!r}") from None
+    if len(nums) > MAX_TABLE_LEAVE:
+        return -1
+    idx = _SIZE_OFFSET[len(nums)]
+    for j, t in enumerate(nums):
+        idx += math.comb(t + j, j + 1)
+    return idx
+
+
+def table_state_key(mul_data, bag=None, rack=None, board_tiles=None,
+                    estr_patterns=None, expr_values=None):
+    """sha256 over everything evaluate_leave's result depends on."""
+    h = hashlib.sha256(f"leave table v{TABLE_VERSION}\n".encode())
+    bag = Counter(STANDARD_BAG) if bag is None else bag
+    for part in (sorted(bag.items()), rack, board_tiles,
+                 sorted(mul_data.items()), estr_patterns,
+                 sorted((expr_values or {}).items())):
+        h.update(repr(part).encode() + b'\n')
+    return h.digest()
+
+
+def build_leave_table(path, mul_data, bag=None, rack=None, board_tiles=None,
+                      estr_patterns=None, expr_values=None, progress=True):
+    """Evaluate every 0-6 tile leave the bag allows and write a table file."""
+    if bag is None:
+        bag = Counter(STANDARD_BAG)
+    values = [LEAVE_MISSING] * TABLE_SLOTS
+    done = 0
+    for size in range(MAX_TABLE_LEAVE + 1):
+        leaves = []
+        for combo in itertools.combinations_with_replacement(LEAVE_TILES, size):
+            leave = ''.join(combo)
+            counts = Counter(leave)
+            if any(bag.get(t, 0) < n for t, n in counts.items()):
+                continue
+            leaves.append(leave)
+        # One batch per size; with a rack every leave shares one state
+        totals = evaluate_leaves(leaves, mul_data, bag, rack, board_tiles,
+                                 estr_patterns, expr_values)
+        for leave, total in zip(leaves, totals):
+            values[leave_index(leave)] = total
+        done += len(leaves)
+        if progress:
+            print(f"  {done:,} leaves evaluated (up to {size} tiles)...")
+
+    header = _TABLE_HEADER.pack(
+        TABLE_MAGIC, TABLE_VERSION, MAX_TABLE_LEAVE, TABLE_SLOTS, 0,
+        table_state_key(mul_data, bag, rack, board_tiles, estr_patterns,
+                        expr_values))
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, 'wb') as f:
+        f.write(header)
+        f.write(struct.pack(f'<{TABLE_SLOTS}i', *values))
+    os.replace(tmp, path)
+    return done
+
+
+class LeaveTable:
+    """A leave table file mapped read-only; value() is one array read."""
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, max_leave, slots, _, self.state_key = \
+            _TABLE_HEADER.unpack_from(self._map, 0)
+        if (magic != TABLE_MAGIC or version != TABLE_VERSION
+                or max_leave != MAX_TABLE_LEAVE or slots != TABLE_SLOTS
+                or len(self._map) != _TABLE_HEADER.size + 4 * slots):
+            self._map.close()
+            raise ValueError(f"{path}: not a leave table (v{TABLE_VERSION})")
+
+    def matches(self, state_key):
+        """True if the table was built for this table_state_key()."""
+        return self.state_key == state_key
+
+    def value(self, leave):
+        """Centipoint value of a leave, or None if not in the table.
+
+        Raises ValueError for an invalid leave (see leave_index).
+        """
+        idx = leave_index(leave)
+        if idx < 0:
+            return None
+        val, = struct.unpack_from('<i', self._map, _TABLE_HEADER.size + 4 * idx)
+        return None if val == LEAVE_MISSING else val
+
+    def close(self):
+        self._map.close()
+
+
 # ─── REPL ───────────────────────────────────────────────────────────
 
 def repl(mul_data, bag, rack, board_tiles, estr_patterns=None, expr_values=None):
@@ -921,6 +1460,13 @@ def main():
                         help='Compare multiple leaves and exit')
     parser.add_argument('--top', type=str, default=None,
                         help='Show top 10 leaves from all subsets of RACK')
+    parser.add_argument('--bench', type=int, metavar='N', default=None,
+                        help='Benchmark evaluate_leave on N random leaves')
+    parser.add_argument('--build-table', metavar='PATH', default=None,
+                        help='Precompute every 0-6 tile leave for this '
+                             'bag/rack/board state into a table file')
+    parser.add_argument('--table', metavar='PATH', default=None,
+                        help='Answer --leave/--cmp from a precomputed table')
     args = parser.parse_args()
 
     print("Loading MUL resources...")
@@ -943,7 +1489,32 @@ def main():
     rack = args.rack.upper() if args.rack else None
     board = args.board.upper() if args.board else None
 
-    if args.leave:
+    if args.bench:
+        ok = benchmark(mul_data, bag, rack, board, estr_patterns, expr_values,
+                       args.bench)
+        sys.exit(0 if ok else 1)
+    elif args.build_table:
+        print(f"Building leave table {args.build_table}...")
+        count = build_leave_table(args.build_table, mul_data, bag, rack, board,
+                                  estr_patterns, expr_values)
+        print(f"Wrote {count:,} leave values ({TABLE_SLOTS:,} slots)")
+    elif args.table and (args.leave or args.cmp):
+        table = LeaveTable(args.table)
+        if not table.matches(table_state_key(mul_data, bag, rack, board,
+                                             estr_patterns, expr_values)):
+            print(f"Error: {args.table} was built for a different game state")
+            sys.exit(1)
+        for leave in ([args.leave] if args.leave else args.cmp):
+            try:
+                val = table.value(leave)
+            except ValueError as e:
+                print(f"Error: {e}")
+                table.close()
+                sys.exit(1)
+            shown = f"{val/100:>+8.2f} pts  ({val:>+6} cp)" if val is not None else "not in table"
+            print(f"  {leave.upper():<14} {shown}")
+        table.close()
+    elif args.leave:
         evaluate_leave(args.leave, mul_data, bag, rack, board,
                        estr_patterns=estr_patterns, expr_values=expr_values)
     elif args.top:
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Compiled ESTR/PATB pattern set for leave matching.
+
+Maven's leave_orchestrator (CODE 32, 0x09D8) scores every pattern that
+is a multiset subset of the leave.  Testing that with a Counter per
+pattern costs ~130 small dict builds per leave.  PatternMatrix compiles
+the pattern list once into a count matrix:
+
+  counts[p, t]   copies of tile t in pattern p
+                 (columns A..Z = 0..25, blank '?' = 26)
+
+A leave becomes a 27-int count vector v, and pattern p matches when
+counts[p] <= v in every column: one vectorized comparison per leave,
+or per batch of leaves (an (N, 27) array of vectors).  Results keep the
+pattern list's order, so they equal the Counter scan's exactly.
+
+For large batches match_bits() avoids the (N, patterns, 27) comparison:
+per column t and count k it precomputes the bitset of patterns needing
+at most k copies of t, and a leave's matches are the AND of its 27
+column bitsets.
+
+Patterns are the lowercase strings from ESTR/PATB ('qu', 'gin', '??');
+a pattern with any other character never matches.  Leaves may be
+strings or Counters, in either case.
+
+Usage:
+  python3 leave_patterns.py LEAVE ...       # patterns matched by each leave
+  python3 leave_patterns.py --bench 20000   # Counter scan vs matrix
+"""
+
+import argparse
+import time
+from collections import Counter
+from functools import lru_cache
+
+import numpy as np
+
+PATTERN_TILES = 'abcdefghijklmnopqrstuvwxyz?'
+BLANK = '?'
+
+_COLUMN = {ch: i for i, ch in enumerate(PATTERN_TILES)}
+_COLUMN.update({ch.upper(): i for i, ch in enumerate(PATTERN_TILES[:26])})
+
+
+def _counts(leave):
+    vec = [0] * len(PATTERN_TILES)
+    items = leave.items() if isinstance(leave, Counter) else Counter(leave).items()
+    for tile, cnt in items:
+        col = _COLUMN.get(tile)
+        if col is not None:
+            vec[col] += cnt
+    return vec
+
+
+def leave_vector(leave):
+    """27-entry count vector of a leave string or Counter (any case)."""
+    return np.array(_counts(leave), dtype=np.int16)
+
+
+class PatternMatrix:
+    """A pattern list compiled into a (patterns, 27) count matrix."""
+
+    def __init__(self, patterns):
+        self.patterns = list(patterns)
+        self.counts = np.zeros((len(self.patterns), len(PATTERN_TILES)), dtype=np.int16)
+        self.valid = np.ones(len(self.patterns), dtype=bool)
+        for p, pattern in enumerate(self.patterns):
+            for ch in pattern:
+                col = _COLUMN.get(ch) if ch == BLANK or ch.islower() else None
+                if col is None:
+                    self.valid[p] = False
+                else:
+                    self.counts[p, col] += 1
+        self._bitsets = None
+
+    def __len__(self):
+        return len(self.patterns)
+
+    def match_mask(self, vectors):
+        """Bool array (..., patterns): which patterns each count vector holds."""
+        vectors = np.asarray(vectors, dtype=np.int16)
+        return (self.counts <= vectors[..., None, :]).all(axis=-1) & self.valid
+
+    def matches(self, leave):
+        """Patterns contained in one leave, in pattern-list order."""
+        patterns = self.patterns
+        return [patterns[p] for p in np.flatnonzero(self.match_mask(leave_vector(leave)))]
+
+    def match_many(self, leaves):
+        """matches() for a sequence of leaves, as one (N, 27) comparison."""
+        if not len(leaves):
+            return []
+        mask = self.match_mask([_counts(leave) for leave in leaves])
+        patterns = self.patterns
+        return [[patterns[p] for p in np.flatnonzero(row)] for row in mask]
+
+    def bitsets(self):
+        """Per-column pattern bitsets, as sets[t, k, w] (little-endian u64).
+
+        Bit p of sets[t, k] is set when pattern p needs at most k copies
+        of tile t; k runs to the largest count any pattern needs, and a
+        leave's matches are the AND over t of sets[t, min(count_t, k)].
+        """
+        if self._bitsets is None:
+            n_words = max(1, (len(self.patterns) + 63) // 64)
+            top = int(self.counts.max(initial=0))
+            bits = np.zeros((len(PATTERN_TILES), top + 1, n_words * 64), dtype=bool)
+            for k in range(top + 1):
+                bits[:, k, :len(self.patterns)] = ((self.counts <= k) & self.valid[:, None]).T
+            self._bitsets = np.packbits(bits, axis=-1, bitorder='little').view('<u8')
+        return self._bitsets
+
+    def match_bits(self, counts):
+        """Matched-pattern bitsets (N, words) for an (N, 27) count array."""
+        sets = self.bitsets()
+        columns = np.minimum(np.asarray(counts), sets.shape[1] - 1).T
+        # One gather per column is much cheaper than an (N, 27, words) one
+        matched = sets[0].take(columns[0], axis=0)
+        for t in range(1, len(PATTERN_TILES)):
+            if columns[t].any():
+                matched &= sets[t].take(columns[t], axis=0)
+            else:
+                matched &= sets[t, 0]
+        return matched
+
+    def containing(self, tile):
+        """Patterns that use `tile` at least once."""
+        col = _COLUMN.get(tile)
+        if col is None:
+            return []
+        return [self.patterns[p] for p in np.flatnonzero(self.counts[:, col])]
+
+
+@lru_cache(maxsize=8)
+def _compiled(patterns):
+    return PatternMatrix(patterns)
+
+
+def compile_patterns(patterns):
+    """PatternMatrix for a pattern list, cached for repeated calls."""
+    if isinstance(patterns, PatternMatrix):
+        return patterns
+    return _compiled(tuple(patterns))
+
+
+def counter_matches(leave_counts, patterns):
+    """The per-pattern Counter scan that PatternMatrix replaces."""
+    leave_lower = Counter()
+    for tile, cnt in leave_counts.items():
+        leave_lower[tile.lower() if tile != BLANK else BLANK] += cnt
+    return [pattern for pattern in patterns
+            if all(leave_lower[ch] >= cnt for ch, cnt in Counter(pattern).items())]
+
+
+def main():
+    import leave_eval2
+
+    parser = argparse.ArgumentParser(
+        description="Match leaves against Maven's compiled PATB pattern set")
+    parser.add_argument('leaves', nargs='*', help="Leaves, '?' for a blank")
+    parser.add_argument('--resources', default=leave_eval2.RESOURCES_DIR,
+                        help='Maven resources directory (default: %(default)s)')
+    parser.add_argument('--bench', type=int, default=0, metavar='N',
+                        help='Time N random leaves: Counter scan vs matrix')
+    args = parser.parse_args()
+
+    leave_eval2.RESOURCES_DIR = args.resources
+    patterns = list(leave_eval2.load_patb_expr())
+    matrix = compile_patterns(patterns)
+    print(f"{len(matrix)} PATB patterns")
+
+    for leave in args.leaves:
+        found = matrix.matches(leave.upper())
+        print(f"  {leave.upper()}: {' '.join(found) or '-'}")
+
+    if args.bench:
+        import random
+        rng = random.Random(1)
+        tiles = [t for t, c in leave_eval2.STANDARD_BAG.items() for _ in range(c)]
+        leaves = [Counter(rng.sample(tiles, rng.randint(1, 6))) for _ in range(args.bench)]
+        n = len(leaves)
+        t0 = time.perf_counter()
+        ref = [counter_matches(leave, patterns) for leave in leaves]
+        t1 = time.perf_counter()
+        single = [matrix.matches(leave) for leave in leaves]
+        t2 = time.perf_counter()
+        batch = matrix.match_many(leaves)
+        t3 = time.perf_counter()
+        print(f"\n{n:,} random leaves:")
+        print(f"  Counter scan: {(t1 - t0) / n * 1e6:8.1f} us/leave")
+        print(f"  matrix:       {(t2 - t1) / n * 1e6:8.1f} us/leave  "
+              f"({'identical' if single == ref else 'DIFFERENT'})")
+        print(f"  batched:      {(t3 - t2) / n * 1e6:8.1f} us/leave  "
+              f"({'identical' if batch == ref else 'DIFFERENT'})")
+
+
+if __name__ == '__main__':
+    main()
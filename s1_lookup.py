@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+S1 word lookup with a shared-suffix cache.
+
+Section 1 stores words reversed, so validating a word walks word[::-1]
+and every member of an inflected family (-ING, -ATION, -NESS, ...)
+re-walks the same suffix from the root.  S1Lookup keeps a bounded LRU
+from reversed-prefix strings (e.g. 'gni' for -ING) to the entry reached
+by spelling them, and starts each walk from the longest cached prefix.
+Prefixes known to be absent are cached too (as entry 0).  Only a few
+prefix lengths are cached (`depths`), which keeps the probe and insert
+cost per lookup below the cost of the letters it saves.
+
+Usage:
+  python3 s1_lookup.py [--fork maven2] [--words lexica/s1_words.txt]
+                       [--size 4096] [--depths 3,5] [--raw]
+                       # benchmark against plain walks
+"""
+
+import argparse
+import random
+import sys
+import time
+from collections import OrderedDict
+
+from dawg_reader import DAWG_PATH, MavenFork
+from dawg_words import ROOT_GROUP, contains
+
+
+class S1Lookup:
+    """Cached lookups of forward words in a reversed-storage section."""
+
+    def __init__(self, entries, maxsize=4096, depths=(3, 5)):
+        self.entries = entries
+        self.maxsize = maxsize
+        self.depths = sorted({d for d in depths if d > 0}, reverse=True)  # deepest first
+        self.cached_depth = bytearray(max(self.depths, default=0) + 1)
+        for d in self.depths:
+            self.cached_depth[d] = 1
+        self.cache = OrderedDict()  # reversed prefix -> entry index (0 = absent)
+        self.hits = 0
+        self.misses = 0
+
+    def _remember(self, key, idx):
+        cache = self.cache
+        if key not in cache:
+            cache[key] = idx
+            if len(cache) > self.maxsize:
+                cache.popitem(last=False)
+
+    def find_entry(self, rev):
+        """Entry index reached by spelling the stored string `rev`, or 0."""
+        entries = self.entries
+        n = len(entries)
+        length = len(rev)
+        cache = self.cache
+
+        start = 0
+        idx = 0
+        for d in self.depths:
+            if d > length:
+                continue
+            key = rev[:d]
+            hit = cache.get(key)
+            if hit is not None:
+                cache.move_to_end(key)
+                self.hits += 1
+                if not hit:
+                    return 0
+                start, idx = d, hit
+                break
+        else:
+            self.misses += 1
+
+        cached_depth = self.cached_depth
+        top = len(cached_depth)
+        g = entries[idx] >> 10 if start else ROOT_GROUP
+        for pos in range(start, length):
+            target = ord(rev[pos])
+            while g and g < n:
+                val = entries[g]
+                if val & 0xFF == target:
+                    break
+                if val & 0x200:
+                    g = 0
+                    break
+                g += 1
+            else:
+                g = 0
+            depth = pos + 1
+            if depth < top and cached_depth[depth]:
+                self._remember(rev[:depth], g)
+            if not g:
+                return 0
+            idx = g
+            g = val >> 10
+        return idx
+
+    def contains(self, word):
+        """True if the forward word `word` is in the reversed section."""
+        if not word:
+            return False
+        idx = self.find_entry(word[::-1])
+        return bool(idx and self.entries[idx] & 0x100)
+
+    def clear(self):
+        self.cache.clear()
+        self.hits = self.misses = 0
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark cached S1 lookups against plain walks")
+    parser.add_argument('--fork', default=DAWG_PATH,
+                        help='Maven data fork (default: %(default)s)')
+    parser.add_argument('--words', default='lexica/s1_words.txt',
+                        help='Forward word list to validate')
+    parser.add_argument('--size', type=int, default=4096,
+                        help='LRU size (default: 4096)')
+    parser.add_argument('--depths', default='3,5',
+                        help='Cached reversed-prefix lengths (default: 3,5)')
+    parser.add_argument('--raw', action='store_true',
+                        help='Walk the mapped section directly instead of '
+                             'a decoded array')
+    args = parser.parse_args()
+
+    with open(args.words) as f:
+        words = [w.lower() for w in f.read().split()]
+    if not words:
+        print(f"Error: no words in {args.words}")
+        sys.exit(1)
+    random.seed(1)
+    random.shuffle(words)
+
+    with MavenFork(args.fork) as fork:
+        s1 = fork.s1 if args.raw else fork.s1.to_array()
+
+        t0 = time.perf_counter()
+        plain = [contains(s1, w[::-1]) for w in words]
+        t1 = time.perf_counter()
+        depths = [int(d) for d in args.depths.split(',') if d.strip()]
+        lookup = S1Lookup(s1, args.size, depths)
+        cached = [lookup.contains(w) for w in words]
+        t2 = time.perf_counter()
+        del s1, lookup.entries
+
+    ok = plain == cached
+    print(f"{len(words):,} words, {sum(cached):,} valid in S1")
+    print(f"  plain walks: {t1 - t0:.2f}s")
+    print(f"  cached:      {t2 - t1:.2f}s  (LRU {args.size}, "
+          f"{lookup.hits:,} prefix hits, {lookup.misses:,} misses)  "
+          f"({'identical' if ok else 'DIFFERENT'})")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
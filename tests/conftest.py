@@ -0,0 +1,40 @@
+"""Shared fixtures: a small synthetic lexicon and its built section.
+
+The checks run without the Maven data fork or resources; everything is
+generated here from a fixed seed.
+"""
+
+import random
+
+import pytest
+
+import build_dawg
+
+
+def synthetic_words(n=1500, seed=7):
+    """Deterministic lowercase words, with some shared prefixes and suffixes."""
+    rng = random.Random(seed)
+    words = {'a', 'st', 'sta', 'star', 'stars', 'start', 'starts', 'stat',
+             'qi', 'qua', 'quack', 'zzz'}
+    stems = [''.join(rng.choice('abcdeilmnorstu') for _ in range(rng.randint(1, 5)))
+             for _ in range(n // 3)]
+    for stem in stems:
+        words.add(stem)
+        for suffix in ('s', 'ed', 'ing', 'er'):
+            if rng.random() < 0.4:
+                words.add(stem + suffix)
+    while len(words) < n:
+        words.add(''.join(rng.choice('abcdefghijklmnopqrstuvwxyz')
+                          for _ in range(rng.randint(1, 9))))
+    return sorted(words)
+
+
+@pytest.fixture(scope='session')
+def words():
+    return synthetic_words()
+
+
+@pytest.fixture(scope='session')
+def section(words):
+    """(entries, boundary) for the synthetic lexicon, built serially."""
+    return build_dawg.build_section(words)
@@ -0,0 +1,31 @@
+"""Build modes of build_dawg produce byte-identical sections."""
+
+import pytest
+
+import build_dawg
+
+
+def test_incremental_identical(words, section):
+    assert build_dawg.build_section(words, incremental=True) == section
+
+
+def test_enumerates_back(words, section):
+    # enumerate_entries starts at two letters, like Maven's lexicon
+    assert build_dawg.enumerate_entries(section[0]) == {w for w in words if len(w) > 1}
+
+
+@pytest.mark.parametrize('incremental', [False, True])
+def test_parallel_identical(words, section, incremental):
+    entries, boundary = section
+    par = build_dawg.build_section(words, incremental=incremental, jobs=2)
+    assert par == section
+    assert (build_dawg.pack_file(par[0], par[0], boundary)
+            == build_dawg.pack_file(entries, entries, boundary))
+
+
+def test_trie_entry_points_identical(words, section):
+    assert build_dawg.serialize_dawg(build_dawg.build_trie(words)) == section
+    assert build_dawg.serialize_dawg(build_dawg.build_dawg_incremental(words)) == section
+    root = build_dawg.minimize_trie(build_dawg.build_trie(words))
+    assert build_dawg.serialize_dawg(root) == section
+    assert build_dawg.count_nodes(root) == len(build_dawg.build_table(words))
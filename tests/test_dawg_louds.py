@@ -0,0 +1,48 @@
+"""LoudsDawg: round trip to Maven entries and iter_words vs brute force."""
+
+import itertools
+
+import pytest
+
+import build_dawg
+from conftest import synthetic_words
+from dawg_louds import LoudsDawg
+from test_dawg_words import AFTERS, MAX_LENS, MIN_LENS, PREFIXES, expected
+
+
+@pytest.fixture(scope='module')
+def louds(section):
+    return LoudsDawg(section[0])
+
+
+def test_round_trip(section):
+    assert LoudsDawg(section[0]).to_entries() == section
+
+
+def test_round_trip_reversed_and_gaddag():
+    words = synthetic_words(400, seed=3)
+    reversed_section = build_dawg.build_section([w[::-1] for w in words])
+    assert LoudsDawg(reversed_section[0]).to_entries() == reversed_section
+    gaddag = build_dawg.build_gaddag(words)
+    assert LoudsDawg(gaddag[0]).to_entries() == gaddag
+
+
+def test_enumerates_every_word(words, louds):
+    assert list(louds.iter_words()) == words
+    assert all(louds.contains(w) for w in words)
+
+
+@pytest.mark.parametrize('prefix', PREFIXES)
+def test_iter_words_matches_brute_force(words, louds, prefix):
+    for min_len, max_len, after in itertools.product(MIN_LENS, MAX_LENS, AFTERS):
+        args = (prefix, min_len, max_len, after)
+        assert list(louds.iter_words(*args)) == expected(words, *args), args
+
+
+def test_resume_after_every_word(words, louds):
+    for i in range(0, len(words), 37):
+        assert list(louds.iter_words(after=words[i])) == words[i + 1:]
+
+
+def test_max_len_below_prefix(louds):
+    assert list(louds.iter_words('st', 2, 1)) == []
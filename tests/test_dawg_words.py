@@ -0,0 +1,42 @@
+"""dawg_words.iter_words against a brute-force word list."""
+
+import itertools
+
+import pytest
+
+from dawg_words import contains, iter_words
+
+PREFIXES = ['', 's', 'st', 'sta', 'qu', 'zzz', 'zzzz', 'x']
+MIN_LENS = [1, 2, 4]
+MAX_LENS = [None, 1, 2, 3, 6]
+AFTERS = [None, '', 'a', 'm', 'st', 'stars', 'stb', 'r', 'zzzz']
+
+
+def expected(words, prefix="", min_len=1, max_len=None, after=None):
+    """The words iter_words should yield, filtered the slow way."""
+    return [w for w in words
+            if w.startswith(prefix) and len(w) >= min_len
+            and (max_len is None or len(w) <= max_len)
+            and (after is None or w > after)]
+
+
+def test_enumerates_every_word(words, section):
+    entries = section[0]
+    assert list(iter_words(entries)) == words
+    assert all(contains(entries, w) for w in words)
+
+
+@pytest.mark.parametrize('prefix', PREFIXES)
+def test_iter_words_matches_brute_force(words, section, prefix):
+    for min_len, max_len, after in itertools.product(MIN_LENS, MAX_LENS, AFTERS):
+        args = (prefix, min_len, max_len, after)
+        assert list(iter_words(section[0], *args)) == expected(words, *args), args
+
+
+def test_resume_after_every_word(words, section):
+    for i in range(0, len(words), 37):
+        assert list(iter_words(section[0], after=words[i])) == words[i + 1:]
+
+
+def test_max_len_below_prefix(section):
+    assert list(iter_words(section[0], 'st', 2, 1)) == []
@@ -0,0 +1,63 @@
+"""leave_eval2: leave_index, and evaluate_leaves vs evaluate_leave on
+synthetic MUL/ESTR/EXPR data."""
+
+import random
+from collections import Counter
+
+import pytest
+
+import leave_eval2 as L
+
+
+@pytest.fixture(scope='module')
+def resources():
+    """(mul_data, estr_patterns, expr_values) shaped like Maven's."""
+    rng = random.Random(11)
+    mul_data = {tile: [rng.randint(-300, 300)] +
+                      [rng.randint(-1500, 2500) for _ in range(min(count, 7))]
+                for tile, count in L.STANDARD_BAG.items()}
+    patterns = ['?', '??'] + list('abcdefijlmnoprsvxyz')
+    while len(patterns) < 120:
+        pattern = ''.join(sorted(rng.choice('aeiourstlnqudg?')
+                                 for _ in range(rng.choice([2, 2, 3, 3, 4]))))
+        if pattern not in patterns:
+            patterns.append(pattern)
+    patterns += ['qu', 'ing', 'aeio']
+    expr_values = {p: rng.randint(-800, 800) for p in rng.sample(patterns, 100)}
+    return mul_data, patterns, expr_values
+
+
+def random_leaves(bag, n, seed):
+    rng = random.Random(seed)
+    tiles = [t for t, c in bag.items() for _ in range(c)]
+    leaves = [''.join(rng.sample(tiles, rng.randint(1, 6))) for _ in range(n)]
+    return leaves + ['', 'Q', 'QU', '??', 'AEIOU?', 'ING']
+
+
+STATES = [
+    (None, None, None),
+    ('AEINST?', None, None),
+    ('QUIZ', 'XJKVWY', None),
+    (None, 'EEEE', {'A': 4, 'E': 5, 'I': 3, 'N': 3, 'Q': 1, 'S': 2, 'T': 3, 'U': 2, '?': 1}),
+]
+
+
+@pytest.mark.parametrize('rack,board,bag', STATES)
+@pytest.mark.parametrize('with_expr', [True, False])
+def test_batch_matches_single(resources, rack, board, bag, with_expr):
+    mul_data, patterns, expr_values = resources
+    bag = Counter(bag) if bag else Counter(L.STANDARD_BAG)
+    expr = expr_values if with_expr else None
+    leaves = [leave for leave in random_leaves(bag, 300, seed=5)
+              if not Counter(leave) - bag]
+    single = [L.evaluate_leave(leave, mul_data, bag, rack, board, verbose=False,
+                               estr_patterns=patterns, expr_values=expr)[0]
+              for leave in leaves]
+    assert L.evaluate_leaves(leaves, mul_data, bag, rack, board, patterns, expr) == single
+
+
+def test_leave_index_rejects_invalid_tiles():
+    assert L.leave_index('aei?') == L.leave_index('?IEA')
+    assert L.leave_index('ABCDEFG') == -1
+    with pytest.raises(ValueError):
+        L.leave_index('AE1')
@@ -17,29 +17,41 @@ File header:
 
 import struct
 
+from dawg_reader import MavenFork
+
 FILEPATH = "/Volumes/T7/retrogames/oldmac/share/maven2"
 
+_BE32 = struct.Struct('>I')
+
+
 class DAWGRuntime:
     def __init__(self, filepath):
-        with open(filepath, 'rb') as f:
-            self.data = f.read()
+        # Mapped read-only; entries are decoded in place on demand
+        self.fork = MavenFork(filepath)
+        self.data = self.fork.buf
 
-        self.s1_boundary = struct.unpack('>I', self.data[0:4])[0]
-        self.field2 = struct.unpack('>I', self.data[4:8])[0]
-        self.field3 = struct.unpack('>I', self.data[8:12])[0]
-        self.field4 = struct.unpack('>I', self.data[12:16])[0]
+        self.s1_boundary = self.fork.boundary
+        self.field2 = self.fork.s1_count
+        self.field3 = self.fork.s2_count
+        self.field4 = _BE32.unpack_from(self.data, 12)[0]
 
         self.base = 12  # DAWG base at file offset 12
+        self.max_entry = (len(self.data) - self.base) // 4
 
         print(f"Header: s1_boundary={self.s1_boundary}, field2={self.field2}, "
               f"field3={self.field3}")
         print(f"Entry 0 (sentinel): val=0x{self.field4:08X} = {self.field4}")
 
+    def get_value(self, index):
+        """Raw 32-bit entry value, or None past the end of the file."""
+        if index >= self.max_entry:
+            return None
+        return _BE32.unpack_from(self.data, self.base + index * 4)[0]
+
     def get_entry(self, index):
-        offset = self.base + index * 4
-        if offset + 4 > len(self.data):
+        val = self.get_value(index)
+        if val is None:
             return None
-        val = struct.unpack('>I', self.data[offset:offset+4])[0]
         letter_byte = val & 0xFF
         return {
             'val': val,
@@ -84,7 +96,7 @@ class DAWGRuntime:
         li_entry = self.get_entry(1 + i)
         child = li_entry['child']
         # CODE 15 walk_to_child has NO boundary check - use total entry count
-        max_entry = len(self.data) // 4
+        max_entry = self.max_entry
         print(f"\nFirst sibling group for '{letter}' subtree (starting at entry {child}):")
         siblings = self.get_siblings(child, max_entry)
         for idx, entry in siblings:
@@ -96,22 +108,35 @@ class DAWGRuntime:
         word = word.lower()
         if len(word) < 2:
             return False
-        # CODE 15 walk_to_child: no boundary check, just follows child pointers
-        max_entry = len(self.data) // 4
 
         rev = word[::-1]
-        first = rev[0]
-        i = ord(first) - ord('a')
+        i = ord(rev[0]) - ord('a')
         if i < 0 or i > 25:
             return False
 
-        li_entry = self.get_entry(1 + i)
-        child = li_entry['child']
-        if child == 0:
-            return False
-
-        siblings = self.get_siblings(child, max_entry)
-        return self._match_nb(siblings, rev[1:])
+        # CODE 15 walk_to_child: no boundary check, just follows child pointers.
+        # Walks raw entry values so no per-node dicts are built.
+        get = self.get_value
+        idx = get(1 + i) >> 10
+        for pos in range(1, len(rev)):
+            if idx == 0:
+                return False
+            target = ord(rev[pos])
+            if not 97 <= target <= 122:
+                return False
+            while True:
+                val = get(idx)
+                if val is None:
+                    return False
+                if val & 0xFF == target:
+                    break
+                if val & 0x200:
+                    return False
+                idx += 1
+            if pos == len(rev) - 1:
+                return bool(val & 0x100)
+            idx = val >> 10
+        return False
 
     def _match(self, siblings, remaining):
         if not remaining:
@@ -136,7 +161,7 @@ class DAWGRuntime:
         """Match with no boundary check (like CODE 15 walk_to_child)."""
         if not remaining:
             return True
-        max_entry = len(self.data) // 4
+        max_entry = self.max_entry
 
         target = remaining[0]
         rest = remaining[1:]
@@ -161,7 +186,7 @@ class DAWGRuntime:
         i = ord(first) - ord('a')
         li_entry = self.get_entry(1 + i)
         child = li_entry['child']
-        max_entry = len(self.data) // 4
+        max_entry = self.max_entry
 
         print(f"\nTracing '{word}' (reversed: '{rev}'):")
         print(f"  Letter index '{first}': child={child}")